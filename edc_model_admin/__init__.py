@@ -1,15 +1,54 @@
-from .address_model_admin_mixin import AddressModelAdminMixin
-from .changelist_buttons import ModelAdminChangelistButtonMixin, ModelAdminChangelistModelButtonMixin
-from .form_as_json_model_admin_mixin import FormAsJSONModelAdminMixin
-from .inlines import LimitedAdminInlineMixin, StackedInlineMixin, TabularInlineMixin
-from .model_admin_audit_fields_mixin import ModelAdminAuditFieldsMixin, audit_fields, audit_fieldset_tuple
-from .model_admin_basic_mixin import ModelAdminBasicMixin
-from .model_admin_form_auto_number_mixin import ModelAdminFormAutoNumberMixin
-from .model_admin_form_instructions_mixin import ModelAdminFormInstructionsMixin
-from .model_admin_institution_mixin import ModelAdminInstitutionMixin
-from .model_admin_model_redirect_mixin import ModelAdminModelRedirectMixin
-from .model_admin_next_url_redirect_mixin import ModelAdminNextUrlRedirectError
-from .model_admin_next_url_redirect_mixin import ModelAdminNextUrlRedirectMixin
-from .model_admin_readonly_mixin import ModelAdminReadOnlyMixin
-from .model_admin_redirect_on_delete_mixin import ModelAdminRedirectOnDeleteMixin
-from .model_admin_replace_label_text_mixin import ModelAdminReplaceLabelTextMixin
+"""Public names are imported on first access.
+"""
+from .lazy import lazy_exports
+
+_exports = {
+    'AddressModelAdminMixin': '.address_model_admin_mixin',
+    'AuditValues': '.audit_values',
+    'AuditValuesListFilter': '.audit_values',
+    'ModelAdminChangelistButtonMixin': '.changelist_buttons',
+    'ModelAdminChangelistModelButtonMixin': '.changelist_buttons',
+    'clear_button_cache': '.changelist_buttons',
+    'FormAsJSONModelAdminMixin': '.form_as_json_model_admin_mixin',
+    'clear_fragment_cache': '.fragment_cache',
+    'LimitedAdminInlineMixin': '.inlines',
+    'ModelAdminPaginatedInlinesMixin': '.inlines',
+    'PaginatedInlineMixin': '.inlines',
+    'StackedInlineMixin': '.inlines',
+    'TabularInlineMixin': '.inlines',
+    'ModelAdminAuditFieldsMixin': '.model_admin_audit_fields_mixin',
+    'audit_fields': '.model_admin_audit_fields_mixin',
+    'audit_fieldset_tuple': '.model_admin_audit_fields_mixin',
+    'ChangelistCounts': '.changelist_count',
+    'estimate_count': '.changelist_count',
+    'ModelAdminChangelistCountMixin': '.model_admin_changelist_count_mixin',
+    'ModelAdminBasicMixin': '.model_admin_basic_mixin',
+    'clear_layout_cache': '.model_admin_basic_mixin',
+    'ModelAdminFormAutoNumberMixin': '.model_admin_form_auto_number_mixin',
+    'ModelAdminFormCacheMixin': '.model_admin_form_cache_mixin',
+    'ModelAdminFormInstructionsMixin': '.model_admin_form_instructions_mixin',
+    'ModelAdminInstitutionMixin': '.model_admin_institution_mixin',
+    'ModelAdminLabelPipelineMixin': '.model_admin_label_pipeline_mixin',
+    'clear_label_cache': '.model_admin_label_pipeline_mixin',
+    'ModelAdminModelRedirectMixin': '.model_admin_model_redirect_mixin',
+    'ModelAdminNextUrlRedirectError': '.model_admin_next_url_redirect_mixin',
+    'ModelAdminNextUrlRedirectMixin': '.model_admin_next_url_redirect_mixin',
+    'ModelAdminReadOnlyMixin': '.model_admin_readonly_mixin',
+    'clear_readonly_form_cache': '.model_admin_readonly_mixin',
+    'ModelAdminRedirectOnDeleteMixin': '.model_admin_redirect_on_delete_mixin',
+    'ModelAdminReplaceLabelTextMixin': '.model_admin_replace_label_text_mixin',
+    'ModelAdminStaticContextMixin': '.model_admin_static_context_mixin',
+    'clear_static_context_cache': '.model_admin_static_context_mixin',
+    'NavigationPlan': '.navigation_plan',
+    'clear_navigation_plan': '.navigation_plan',
+    'NextUrl': '.next_url',
+    'FullTextBackend': '.search',
+    'PostgresFullTextBackend': '.search',
+    'Search': '.search',
+    'SqliteFTS5Backend': '.search',
+    'fulltext': '.search',
+}
+
+__all__ = sorted(_exports)
+
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -1,5 +1,26 @@
 from django.apps import AppConfig as DjangoAppConfig
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.core.signals import request_started
+from django.db.models.signals import post_delete, post_save
 
 
 class AppConfig(DjangoAppConfig):
     name = 'edc_model_admin'
+
+    def ready(self):
+        from . import checks  # noqa registers the system checks
+        from .navigation_plan import drop_crf_url
+        from .startup import warm_up_on_first_request
+        for model in django_apps.get_models():
+            if hasattr(model, 'visit_model_attr'):
+                uid = f'edc_model_admin.drop_crf_url.{model._meta.label_lower}'
+                post_save.connect(drop_crf_url, sender=model, dispatch_uid=uid)
+                post_delete.connect(drop_crf_url, sender=model, dispatch_uid=uid)
+        if getattr(settings, 'EDC_MODEL_ADMIN_INSTRUMENTATION', False):
+            from .instrumentation import enable
+            enable()
+        if getattr(settings, 'EDC_MODEL_ADMIN_WARM_UP', True):
+            # fallback if wsgi.py has not called startup.warm_up()
+            request_started.connect(
+                warm_up_on_first_request, dispatch_uid='edc_model_admin.warm_up')
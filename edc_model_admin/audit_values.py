@@ -0,0 +1,107 @@
+from django.contrib.admin.filters import AllValuesFieldListFilter, FieldListFilter
+from django.core.cache import caches
+
+# audit fields filtered by value, created and modified use the date filter
+audit_value_fields = ('user_created', 'user_modified',
+                      'hostname_created', 'hostname_modified')
+
+
+class AuditValues:
+
+    """The distinct values of an audit field of a model kept in the
+    Django cache.
+
+    Built by one distinct query when missing or expired, extended
+    by `add` as instances are saved in the admin and rebuilt by
+    the `edc_model_admin_audit_values` command.
+
+    `add` does not rewrite the list. It stores a new value under
+    its own numbered key (`cache.incr`), so concurrent adds from
+    several workers are not lost. `get` merges the numbered values
+    into the list.
+
+    The cache must be shared by all processes, e.g. memcached or
+    redis. With the default LocMemCache each process has its own
+    values, and the rebuild command only rebuilds its own.
+    """
+
+    cache_alias = 'default'
+    timeout = 60 * 60 * 24
+
+    def __init__(self, model, field_name, cache_alias=None):
+        self.model = model
+        self.field_name = field_name
+        self.cache = caches[cache_alias or self.cache_alias]
+        self.key = (f'edc_model_admin.audit_values.'
+                    f'{model._meta.label_lower}.{field_name}')
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.key})'
+
+    def get(self):
+        values = self.cache.get(self.key)
+        if values is None:
+            values = self.rebuild()
+        return self.merge_added(values)
+
+    def rebuild(self):
+        values = list(
+            self.model._default_manager.order_by(self.field_name)
+            .values_list(self.field_name, flat=True).distinct())
+        values = self.sort(values)
+        self.cache.set(self.key, values, self.timeout)
+        return values
+
+    def merge_added(self, values):
+        count = self.cache.get(f'{self.key}.added') or 0
+        if not count:
+            return values
+        added = self.cache.get_many(
+            [f'{self.key}.added.{index}' for index in range(1, count + 1)])
+        new_values = [value for value in added.values() if value not in values]
+        if not new_values:
+            return values
+        return self.sort(values + list(set(new_values)))
+
+    def add(self, value):
+        values = self.cache.get(self.key)
+        if values is None or value in self.merge_added(values):
+            return
+        count_key = f'{self.key}.added'
+        self.cache.add(count_key, 0, self.timeout)
+        try:
+            index = self.cache.incr(count_key)
+        except ValueError:
+            # expired between add and incr
+            self.cache.add(count_key, 0, self.timeout)
+            index = self.cache.incr(count_key)
+        self.cache.set(f'{count_key}.{index}', value, self.timeout)
+
+    @staticmethod
+    def sort(values):
+        """Returns values sorted with None, if any, last.
+        """
+        return (sorted(v for v in values if v is not None)
+                + ([None] if None in values else []))
+
+
+class AuditValuesListFilter(AllValuesFieldListFilter):
+
+    """An AllValuesFieldListFilter with the choices from AuditValues
+    instead of a distinct query on every changelist.
+
+    Choices are for the whole table, not limited by the ModelAdmin
+    queryset.
+    """
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.lookup_kwarg = field_path
+        self.lookup_kwarg_isnull = f'{field_path}__isnull'
+        self.lookup_val = params.get(self.lookup_kwarg)
+        self.lookup_val_isnull = params.get(self.lookup_kwarg_isnull)
+        self.empty_value_display = model_admin.get_empty_value_display()
+        self.lookup_choices = AuditValues(
+            field.model, field.name,
+            cache_alias=getattr(model_admin, 'audit_values_cache', None)).get()
+        FieldListFilter.__init__(
+            self, field, request, params, model, model_admin, field_path)
@@ -1,5 +1,7 @@
 from django.http.response import HttpResponseRedirect
 
+from .instrumentation import instrument
+
 
 class BaseModelAdminRedirectMixin:
 
@@ -18,6 +20,7 @@ class BaseModelAdminRedirectMixin:
     def redirect_url_on_delete(self, request, obj_display, obj_id):
         return None
 
+    @instrument
     def response_add(self, request, obj, post_url_continue=None):
         redirect_url = None
         if '_addanother' not in request.POST and '_continue' not in request.POST:
@@ -26,6 +29,7 @@ class BaseModelAdminRedirectMixin:
             return HttpResponseRedirect(redirect_url)
         return super().response_add(request, obj, post_url_continue=post_url_continue)
 
+    @instrument
     def response_change(self, request, obj):
         redirect_url = None
         if '_addanother' not in request.POST and '_continue' not in request.POST:
@@ -34,6 +38,7 @@ class BaseModelAdminRedirectMixin:
             return HttpResponseRedirect(redirect_url)
         return super().response_change(request, obj)
 
+    @instrument
     def response_delete(self, request, obj_display, obj_id):
         redirect_url = self.redirect_url_on_delete(
             request, obj_display, obj_id)
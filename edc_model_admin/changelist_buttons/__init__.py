@@ -1,2 +1,11 @@
-from .model_admin_changelist_button_mixin import ModelAdminChangelistButtonMixin
-from .model_admin_changelist_model_button_mixin import ModelAdminChangelistModelButtonMixin
+from ..lazy import lazy_exports
+
+_exports = {
+    'ModelAdminChangelistButtonMixin': '.model_admin_changelist_button_mixin',
+    'clear_button_cache': '.model_admin_changelist_button_mixin',
+    'ModelAdminChangelistModelButtonMixin': '.model_admin_changelist_model_button_mixin',
+}
+
+__all__ = sorted(_exports)
+
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -1,9 +1,53 @@
-from django.urls import reverse
-from django.utils.html import format_html
+from django.urls import get_script_prefix, get_urlconf, reverse, NoReverseMatch
+from django.utils import translation
+from django.utils.html import conditional_escape
+from django.utils.http import RFC3986_SUBDELIMS
+from django.utils.safestring import mark_safe
+from urllib.parse import quote
+from uuid import UUID
+
+# values tried in place of a reverse arg to find the slot in the url
+PK_SLOTS = ('2147483647', '00000000-0000-4000-8000-000000000000')
+
+# (url_name, script prefix, language, urlconf) -> (prefix, suffix) or
+# None if not templated, (url_name, None, ...) -> url reversed
+# without args
+_button_urls = {}
+
+# (button template, label) -> template with the label in place
+_button_templates = {}
+_button_templates_maxsize = 1024
+
+
+def clear_button_cache():
+    _button_urls.clear()
+    _button_templates.clear()
+
+
+def compile_button_url(url_name):
+    """Returns (prefix, suffix) of the url reversed with one arg or
+    None if the url cannot be templated.
+    """
+    for slot in PK_SLOTS:
+        try:
+            url = reverse(url_name, args=(slot, ))
+        except NoReverseMatch:
+            continue
+        if url.count(slot) == 1:
+            prefix, suffix = url.split(slot)
+            return prefix, suffix
+    return None
 
 
 class ModelAdminChangelistButtonMixin:
 
+    """Renders link buttons for changelist columns.
+
+    Urls are reversed once per url_name with a slot for the pk and
+    the button template is formatted once per label. Rendering a row
+    only substitutes escaped values.
+    """
+
     changelist_model_button_template = (
         '<a href="{{url}}" class="button" title="{{title}}" {{disabled}}>{label}</a>')
 
@@ -12,7 +56,7 @@ class ModelAdminChangelistButtonMixin:
         label = label or 'change'
         if namespace:
             url_name = f'{namespace}:{url_name}'
-        url = reverse(url_name, args=reverse_args)
+        url = self.button_url(url_name, reverse_args)
         return self.button_template(label, url=url, disabled=disabled, title=title)
 
     def change_button(self, url_name, reverse_args, disabled=None,
@@ -20,7 +64,7 @@ class ModelAdminChangelistButtonMixin:
         label = label or 'change'
         if namespace:
             url_name = f'{namespace}:{url_name}'
-        url = reverse(url_name, args=reverse_args)
+        url = self.button_url(url_name, reverse_args)
         return self.button_template(label, url=url, disabled=disabled, title=title)
 
     def add_button(self, url_name, disabled=None, label=None,
@@ -28,16 +72,55 @@ class ModelAdminChangelistButtonMixin:
         label = label or 'add'
         if namespace:
             url_name = f'{namespace}:{url_name}'
-        url = reverse(url_name) + '' if querystring is None else querystring
+        url = self.button_url(url_name, querystring=querystring)
         return self.button_template(label, url=url, disabled=disabled, title=title)
 
+    def button_url(self, url_name, reverse_args=None, querystring=None):
+        """Returns the url for `url_name` from the compiled url
+        prefix if there is one reverse arg otherwise by `reverse`.
+        """
+        context = (get_script_prefix(), translation.get_language(), get_urlconf())
+        if reverse_args and len(reverse_args) == 1:
+            key = (url_name, ) + context
+            try:
+                compiled = _button_urls[key]
+            except KeyError:
+                compiled = _button_urls[key] = compile_button_url(url_name)
+            if compiled:
+                prefix, suffix = compiled
+                value = reverse_args[0]
+                if isinstance(value, (int, UUID)):
+                    value = str(value)
+                else:
+                    value = quote(str(value), safe=RFC3986_SUBDELIMS + '/~:@')
+                url = prefix + value + suffix
+            else:
+                url = reverse(url_name, args=reverse_args)
+        elif reverse_args:
+            url = reverse(url_name, args=reverse_args)
+        else:
+            key = (url_name, None) + context
+            try:
+                url = _button_urls[key]
+            except KeyError:
+                url = _button_urls[key] = reverse(url_name)
+        return url + (querystring or '')
+
     def button_template(self, label, disabled=None, title=None, url=None):
         title = title or ''
         disabled = 'disabled' if disabled else ''
         if disabled or not url:
             url = '#'
-        button_template = self.changelist_model_button_template.format(
-            label=label)
-        button_template = format_html(
-            button_template, disabled=disabled, title=title, url=url)
-        return button_template
+        key = (self.changelist_model_button_template, label)
+        try:
+            button_template = _button_templates[key]
+        except KeyError:
+            button_template = self.changelist_model_button_template.format(
+                label=label)
+            # labels may be per row values
+            if len(_button_templates) < _button_templates_maxsize:
+                _button_templates[key] = button_template
+        return mark_safe(button_template.format(
+            disabled=disabled,
+            title=conditional_escape(title),
+            url=conditional_escape(url)))
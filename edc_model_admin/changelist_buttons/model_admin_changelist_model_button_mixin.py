@@ -1,5 +1,7 @@
-from django.urls import reverse
+from django.apps import apps as django_apps
+from urllib.parse import urlencode
 
+from ..instrumentation import instrument
 from .model_admin_changelist_button_mixin import ModelAdminChangelistButtonMixin
 
 
@@ -7,8 +9,71 @@ class ModelAdminChangelistModelButtonMixin(ModelAdminChangelistButtonMixin):
 
     """Use a button as a list_display field with a link to add,
     change or changelist.
+
+    To link to a related model without a query per row, declare it
+    in `changelist_model_buttons` and call `related_model_button`
+    from the list_display callable. The related pks for the visible
+    page are fetched in one query per name.
+
+        changelist_model_buttons = {
+            'crf_one': dict(model='my_app.crfone', lookup='subject_visit')}
+
+        def crf_one(self, obj):
+            return self.related_model_button(obj, 'crf_one')
+
+    `lookup` is the field on the related model that joins to `attr`
+    on the row, default `attr='pk'`.
     """
 
+    changelist_model_buttons = {}
+
+    @instrument
+    def get_changelist_instance(self, request):
+        changelist = super().get_changelist_instance(request)
+        if self.changelist_model_buttons:
+            self.prefetch_related_model_pks(changelist.result_list)
+        return changelist
+
+    def prefetch_related_model_pks(self, objs):
+        """Sets the related pk of each name in
+        `changelist_model_buttons` on each obj.
+        """
+        objs = list(objs)
+        for obj in objs:
+            obj._changelist_model_button_pks = {}
+        for name, options in self.changelist_model_buttons.items():
+            attr = options.get('attr', 'pk')
+            values = {getattr(obj, attr) for obj in objs}
+            model_cls = django_apps.get_model(options['model'])
+            related_pks = dict(model_cls.objects.filter(
+                **{f'{options["lookup"]}__in': values}).values_list(
+                    options['lookup'], 'pk'))
+            for obj in objs:
+                obj._changelist_model_button_pks[name] = related_pks.get(
+                    getattr(obj, attr))
+
+    def get_related_model_pk(self, obj, name):
+        """Returns the related pk from the page prefetch or by
+        query if obj was not prefetched.
+        """
+        try:
+            return obj._changelist_model_button_pks[name]
+        except (AttributeError, KeyError):
+            options = self.changelist_model_buttons[name]
+            model_cls = django_apps.get_model(options['model'])
+            return model_cls.objects.filter(**{
+                options['lookup']: getattr(obj, options.get('attr', 'pk'))}).values_list(
+                    'pk', flat=True).first()
+
+    def related_model_button(self, obj, name, **kwargs):
+        """Returns a change button if the related model instance
+        declared for `name` exists, otherwise an add button.
+        """
+        app_label, model_name = self.changelist_model_buttons[name]['model'].split('.')
+        pk = self.get_related_model_pk(obj, name)
+        return self.changelist_model_button(
+            app_label, model_name, reverse_args=(pk, ) if pk else None, **kwargs)
+
     def changelist_model_button(self, app_label, model_name, reverse_args=None,
                                 namespace=None, change_label=None,
                                 add_label=None, add_querystring=None,
@@ -17,8 +82,6 @@ class ModelAdminChangelistModelButtonMixin(ModelAdminChangelistButtonMixin):
             changelist_model_button = self.disabled_button(
                 add_label or change_label)
         else:
-            app_label = app_label
-            model_name = model_name
             if reverse_args:
                 changelist_model_button = self.change_model_button(
                     app_label, model_name, reverse_args, namespace=namespace,
@@ -34,18 +97,16 @@ class ModelAdminChangelistModelButtonMixin(ModelAdminChangelistButtonMixin):
                             label=None, namespace=None, title=None):
         label = label or 'change'
         namespace = namespace or 'admin'
-        url = reverse(
-            f'{namespace}:{app_label}_{model_name}_change',
-            args=reverse_args)
+        url = self.button_url(
+            f'{namespace}:{app_label}_{model_name}_change', reverse_args)
         return self.button_template(label, url=url, title=title)
 
     def add_model_button(self, app_label, model_name, label=None,
                          querystring=None, namespace=None, title=None):
         label = label or 'add'
         namespace = namespace or 'admin'
-        url = reverse(
-            (f'{namespace}:{app_label}_{model_name}_add')
-            + (querystring or ''))
+        url = self.button_url(
+            f'{namespace}:{app_label}_{model_name}_add', querystring=querystring)
         return self.button_template(label, url=url, title=title)
 
     def changelist_list_button(self, app_label, model_name, querystring_value=None,
@@ -57,10 +118,10 @@ class ModelAdminChangelistModelButtonMixin(ModelAdminChangelistButtonMixin):
         namespace = namespace or 'admin'
         querystring = ''
         if querystring_value:
-            querystring = f'?q={querystring_value}'
-        url = reverse(
-            (f'{namespace}:{app_label}_{model_name}_changelist')
-            + querystring)
+            querystring = '?' + urlencode({'q': querystring_value})
+        url = self.button_url(
+            f'{namespace}:{app_label}_{model_name}_changelist',
+            querystring=querystring)
         return self.button_template(label, disabled=disabled, title=title, url=url)
 
     def disabled_button(self, label):
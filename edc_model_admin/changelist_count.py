@@ -0,0 +1,141 @@
+import hashlib
+import json
+
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.core.cache import caches
+from django.core.paginator import InvalidPage
+from django.db import DatabaseError, connections, transaction
+from uuid import uuid4
+
+CACHE_KEY = 'edc_model_admin.changelist_count'
+
+
+def estimate_count(queryset):
+    """Returns the database's row estimate for `queryset` or None.
+
+    Table statistics are used for an unfiltered queryset
+    (PostgreSQL, MySQL, SQLite after ANALYZE) and the planner's
+    estimate for a filtered one (PostgreSQL only).
+    """
+    connection = connections[queryset.db]
+    db_table = queryset.model._meta.db_table
+    if not queryset.query.where:
+        sql, params = {
+            'postgresql': ('SELECT reltuples::bigint FROM pg_class '
+                           'WHERE oid = %s::regclass', [db_table]),
+            'mysql': ('SELECT TABLE_ROWS FROM information_schema.TABLES '
+                      'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s',
+                      [db_table]),
+            'sqlite': ('SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1',
+                       [db_table]),
+        }.get(connection.vendor, (None, None))
+    elif connection.vendor == 'postgresql':
+        sql, params = queryset.order_by().query.sql_with_params()
+        sql = f'EXPLAIN (FORMAT JSON) {sql}'
+    else:
+        return None
+    if not sql:
+        return None
+    try:
+        with transaction.atomic(using=queryset.db), connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    if not row or row[0] is None:
+        return None
+    value = row[0]
+    if connection.vendor == 'sqlite':
+        value = value.split()[0]
+    elif queryset.query.where:
+        plan = json.loads(value) if isinstance(value, str) else value
+        value = plan[0]['Plan']['Plan Rows']
+    value = int(value)
+    return value if value >= 0 else None
+
+
+class ChangelistCounts:
+
+    """Changelist counts of a model kept in the Django cache as
+    (count, approximate).
+
+    Counts are keyed on the SQL of the counted queryset and stored
+    under the model's current generation; `invalidate` starts a new
+    generation so earlier counts are no longer found and expire.
+    """
+
+    cache_alias = 'default'
+    timeout = 60 * 5
+
+    def __init__(self, model, cache_alias=None, timeout=None):
+        self.label_lower = model._meta.label_lower
+        self.cache = caches[cache_alias or self.cache_alias]
+        if timeout is not None:
+            self.timeout = timeout
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.label_lower})'
+
+    @property
+    def generation_key(self):
+        return f'{CACHE_KEY}.{self.label_lower}'
+
+    def generation(self):
+        generation = uuid4().hex
+        if not self.cache.add(self.generation_key, generation, None):
+            generation = self.cache.get(self.generation_key) or generation
+        return generation
+
+    def invalidate(self):
+        self.cache.delete(self.generation_key)
+
+    def key(self, queryset, *extra):
+        sql, params = queryset.order_by().query.sql_with_params()
+        digest = hashlib.md5(repr((extra, sql, params)).encode('utf-8')).hexdigest()
+        return f'{CACHE_KEY}.{self.label_lower}.{self.generation()}.{digest}'
+
+    def get(self, key):
+        return self.cache.get(key)
+
+    def set(self, key, value):
+        self.cache.set(key, value, self.timeout)
+
+
+class ChangeListCountMixin:
+
+    """A ChangeList mixin that takes result_count and
+    full_result_count from `model_admin.get_changelist_count`.
+
+    Sets `count_is_approximate` if either is an estimate.
+    """
+
+    def get_results(self, request):
+        paginator = self.model_admin.get_paginator(
+            request, self.queryset, self.list_per_page)
+        result_count, approximate = self.model_admin.get_changelist_count(
+            request, self.queryset)
+        paginator.count = result_count
+        if self.model_admin.show_full_result_count:
+            full_result_count, full_approximate = (
+                self.model_admin.get_changelist_count(request, self.root_queryset))
+            approximate = approximate or full_approximate
+        else:
+            full_result_count = None
+        can_show_all = result_count <= self.list_max_show_all
+        multi_page = result_count > self.list_per_page
+        if (self.show_all and can_show_all) or not multi_page:
+            result_list = self.queryset._clone()
+        else:
+            try:
+                result_list = paginator.page(self.page_num + 1).object_list
+            except InvalidPage:
+                raise IncorrectLookupParameters
+        self.result_count = result_count
+        self.show_full_result_count = self.model_admin.show_full_result_count
+        self.show_admin_actions = not self.show_full_result_count or bool(full_result_count)
+        self.full_result_count = full_result_count
+        self.count_is_approximate = approximate
+        self.result_list = result_list
+        self.can_show_all = can_show_all
+        self.multi_page = multi_page
+        self.paginator = paginator
@@ -0,0 +1,131 @@
+from django.apps import apps as django_apps
+from django.core.checks import Error, Tags, Warning, register
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DatabaseError
+from django.urls import reverse, NoReverseMatch
+
+from .next_url import url_patterns
+
+# AppConfig.ready imports this module; the mixins are imported in
+# the check functions so that django.setup() does not import them
+
+
+def url_name_exists(url_name):
+    """Returns True if `url_name`, with or without namespaces, is
+    in the resolver regardless of its args.
+    """
+    return url_patterns(url_name) is not None
+
+
+@register(Tags.admin)
+def check_model_admins(app_configs=None, **kwargs):
+    from .startup import get_model_admins
+    errors = []
+    for model_admin in get_model_admins():
+        for check in [check_model_redirect, check_redirect_on_delete,
+                      check_next_url_redirect, check_changelist_model_buttons,
+                      check_search_strategies, check_search_fulltext]:
+            errors.extend(check(model_admin))
+    return errors
+
+
+def check_model_redirect(model_admin):
+    from .model_admin_model_redirect_mixin import ModelAdminModelRedirectMixin
+    if not isinstance(model_admin, ModelAdminModelRedirectMixin):
+        return []
+    label = f'{model_admin.redirect_app_label}.{model_admin.redirect_model_name}'
+    try:
+        django_apps.get_model(label)
+    except (LookupError, ValueError):
+        return [Error(
+            f'Invalid redirect model. Got {label}.',
+            hint='Set redirect_app_label and redirect_model_name to a model.',
+            obj=model_admin.__class__, id='edc_model_admin.E001')]
+    try:
+        model_admin.redirect_url_on_delete(None, None, None)
+    except NoReverseMatch as e:
+        return [Error(
+            f'Redirect changelist url does not reverse. Got {e}',
+            hint=f'Is {label} registered on the {model_admin.redirect_namespace} site?',
+            obj=model_admin.__class__, id='edc_model_admin.E002')]
+    return []
+
+
+def check_redirect_on_delete(model_admin):
+    from .model_admin_redirect_on_delete_mixin import ModelAdminRedirectOnDeleteMixin
+    url_name = getattr(model_admin, 'post_url_on_delete_name', None)
+    if (isinstance(model_admin, ModelAdminRedirectOnDeleteMixin)
+            and url_name and not url_name_exists(url_name)):
+        return [Warning(
+            f'post_url_on_delete_name is not a url name. Got {url_name}.',
+            hint='Ignore if it is a key of request.url_name_data.',
+            obj=model_admin.__class__, id='edc_model_admin.W003')]
+    return []
+
+
+def check_next_url_redirect(model_admin):
+    from .model_admin_next_url_redirect_mixin import ModelAdminNextUrlRedirectMixin
+    if (isinstance(model_admin, ModelAdminNextUrlRedirectMixin)
+            and model_admin.show_save_next and not model_admin.next_form_getter_cls):
+        return [Error(
+            'show_save_next=True requires next_form_getter_cls.',
+            hint='For example, edc_metadata\'s NextFormGetter.',
+            obj=model_admin.__class__, id='edc_model_admin.E004')]
+    return []
+
+
+def check_changelist_model_buttons(model_admin):
+    from .changelist_buttons import ModelAdminChangelistModelButtonMixin
+    errors = []
+    if isinstance(model_admin, ModelAdminChangelistModelButtonMixin):
+        for name, options in model_admin.changelist_model_buttons.items():
+            try:
+                model_cls = django_apps.get_model(options['model'])
+                model_cls._meta.get_field(options['lookup'])
+            except (KeyError, LookupError, ValueError, FieldDoesNotExist) as e:
+                errors.append(Error(
+                    f'Invalid changelist_model_buttons[\'{name}\']. Got {e}',
+                    obj=model_admin.__class__, id='edc_model_admin.E005'))
+                continue
+            try:
+                reverse(f'admin:{model_cls._meta.app_label}_'
+                        f'{model_cls._meta.model_name}_add')
+            except NoReverseMatch:
+                errors.append(Error(
+                    f'changelist_model_buttons[\'{name}\'] model is not registered '
+                    f'on the admin site. Got {options["model"]}.',
+                    obj=model_admin.__class__, id='edc_model_admin.E006'))
+    return errors
+
+
+def check_search_strategies(model_admin):
+    from .model_admin_basic_mixin import ModelAdminBasicMixin
+    from .search import parse_strategy
+    errors = []
+    if isinstance(model_admin, ModelAdminBasicMixin):
+        for field_name, strategy in model_admin.search_strategies.items():
+            try:
+                parse_strategy(strategy)
+            except ValueError as e:
+                errors.append(Error(
+                    f'Invalid search_strategies[\'{field_name}\']. {e}',
+                    obj=model_admin.__class__, id='edc_model_admin.E007'))
+    return errors
+
+
+def check_search_fulltext(model_admin):
+    from .model_admin_basic_mixin import ModelAdminBasicMixin
+    if (not isinstance(model_admin, ModelAdminBasicMixin)
+            or not model_admin.search_fulltext):
+        return []
+    try:
+        exists = model_admin.search_fulltext.exists(model_admin.model)
+    except DatabaseError:
+        return []
+    if not exists:
+        return [Warning(
+            f'Full-text search index of {model_admin.model._meta.label_lower} '
+            f'does not exist. Searches fall back to search_fields.',
+            hint='Run the edc_model_admin_search_index management command.',
+            obj=model_admin.__class__, id='edc_model_admin.W008')]
+    return []
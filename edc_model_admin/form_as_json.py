@@ -0,0 +1,97 @@
+import json
+import zlib
+
+from base64 import b64decode, b64encode
+from django.core.cache import caches
+
+# stored value prefix of zlib compressed, base64 encoded JSON
+ZLIB_HEADER = 'edc-z1:'
+
+CACHE_KEY = 'edc_model_admin.form_as_json'
+COUNTERS = ('saves', 'skipped', 'json_bytes', 'stored_bytes')
+
+
+def encode(value, compress=False):
+    """Returns (compact, stored) for the JSON string `value`, e.g.
+    of form.as_json(), where compact is the same data without
+    whitespace and stored, if `compress` and smaller, compact zlib
+    compressed behind ZLIB_HEADER.
+    """
+    value = json.dumps(json.loads(value), separators=(',', ':'))
+    if compress:
+        compressed = ZLIB_HEADER + b64encode(
+            zlib.compress(value.encode('utf-8'))).decode('ascii')
+        if len(compressed) < len(value):
+            return value, compressed
+    return value, value
+
+
+def decode(value):
+    """Returns the data of a form_as_json value stored by any
+    storage mode.
+    """
+    if not value:
+        return None
+    if value.startswith(ZLIB_HEADER):
+        value = zlib.decompress(b64decode(value[len(ZLIB_HEADER):])).decode('utf-8')
+    return json.loads(value)
+
+
+class FormAsJSONStats:
+
+    """Per model counters of form_as_json saves kept in the Django
+    cache so they add up over processes.
+
+    Each model's label is stored once under its own numbered key
+    (`cache.incr`), as AuditValues.add does, so labels registered
+    concurrently by several workers are not lost.
+    """
+
+    def __init__(self, cache_alias=None):
+        self.cache = caches[cache_alias or 'default']
+
+    def incr(self, label_lower, **counts):
+        for name, value in counts.items():
+            key = f'{CACHE_KEY}.{label_lower}.{name}'
+            try:
+                self.cache.incr(key, value)
+            except ValueError:
+                if self.cache.add(key, value, None):
+                    self.add_label(label_lower)
+                else:
+                    self.cache.incr(key, value)
+
+    def add_label(self, label_lower):
+        if self.cache.add(f'{CACHE_KEY}.label.{label_lower}', True, None):
+            self.cache.add(f'{CACHE_KEY}.labels', 0, None)
+            index = self.cache.incr(f'{CACHE_KEY}.labels')
+            self.cache.set(f'{CACHE_KEY}.labels.{index}', label_lower, None)
+
+    def labels(self):
+        count = self.cache.get(f'{CACHE_KEY}.labels') or 0
+        labels = self.cache.get_many(
+            [f'{CACHE_KEY}.labels.{index}' for index in range(1, count + 1)])
+        return sorted(set(labels.values()))
+
+    def as_dict(self):
+        """Returns {label_lower: {counter: value, 'saved_bytes': ...}}.
+        """
+        stats = {}
+        for label_lower in self.labels():
+            values = self.cache.get_many(
+                [f'{CACHE_KEY}.{label_lower}.{name}' for name in COUNTERS])
+            counters = {name: values.get(f'{CACHE_KEY}.{label_lower}.{name}', 0)
+                        for name in COUNTERS}
+            counters['saved_bytes'] = counters['json_bytes'] - counters['stored_bytes']
+            stats[label_lower] = counters
+        return stats
+
+    def clear(self):
+        count = self.cache.get(f'{CACHE_KEY}.labels') or 0
+        labels = self.labels()
+        self.cache.delete_many(
+            [f'{CACHE_KEY}.{label_lower}.{name}'
+             for label_lower in labels for name in COUNTERS]
+            + [f'{CACHE_KEY}.label.{label_lower}' for label_lower in labels]
+            + [f'{CACHE_KEY}.labels.{index}' for index in range(1, count + 1)]
+            + [f'{CACHE_KEY}.labels'])
@@ -1,11 +1,46 @@
+from .form_as_json import FormAsJSONStats, decode, encode
+from .instrumentation import instrument
+
+
 class FormAsJSONModelAdminMixin:
 
     """Use with FormAsJSONModelformMixin, FormAsJSONModelMixin.
+
+    By default stores `form.as_json()`. Set `form_as_json_storage`
+    to 'compact' to store the same data as compact JSON and skip
+    serializing an unchanged form on change, or to 'zlib' to also
+    compress it. Read stored values of any mode with `decode`.
     """
 
+    form_as_json_storage = None
+    form_as_json_stats_cache = 'default'
+
+    @instrument
     def save_model(self, request, obj, form, change):
-        try:
-            obj.form_as_json = form.as_json()
-        except AttributeError:
-            pass
+        if self.form_as_json_storage:
+            self.update_form_as_json(obj, form, change)
+        else:
+            try:
+                obj.form_as_json = form.as_json()
+            except AttributeError:
+                pass
         super().save_model(request, obj, form, change)
+
+    def update_form_as_json(self, obj, form, change):
+        stats = FormAsJSONStats(self.form_as_json_stats_cache)
+        label_lower = obj._meta.label_lower
+        if change and obj.form_as_json and not form.has_changed():
+            stats.incr(label_lower, skipped=1)
+        else:
+            try:
+                value = form.as_json()
+            except AttributeError:
+                return
+            _, stored = encode(value, compress=self.form_as_json_storage == 'zlib')
+            obj.form_as_json = stored
+            stats.incr(label_lower, saves=1, json_bytes=len(value.encode('utf-8')),
+                       stored_bytes=len(stored.encode('utf-8')))
+
+    @staticmethod
+    def decode_form_as_json(value):
+        return decode(value)
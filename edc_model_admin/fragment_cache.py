@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.utils import timezone, translation
+
+from .utils import LRUCache
+
+# rendered template tag fragments keyed on
+# (template name, language, timezone, content)
+_fragments = LRUCache(maxsize=4096)
+
+
+def clear_fragment_cache():
+    _fragments.clear()
+
+
+def render_fragment(context, template_name, values, key=None):
+    """Returns `template_name` rendered with `values`, from the
+    cache if it was rendered before for the same content.
+
+    If `key` is None the key is the items of `values` which then
+    must be hashable.
+
+    Set settings.EDC_MODEL_ADMIN_CACHE_FRAGMENTS = False to always
+    render, e.g. if a project template uses other context.
+    """
+    enabled = getattr(settings, 'EDC_MODEL_ADMIN_CACHE_FRAGMENTS', True)
+    if enabled:
+        if key is None:
+            key = tuple(values.items())
+        key = (template_name, translation.get_language(),
+               timezone.get_current_timezone_name(), context.autoescape, key)
+        fragment = _fragments.get(key)
+        if fragment is not None:
+            return fragment
+    template = context.template.engine.get_template(template_name)
+    fragment = template.render(context.new(values))
+    if enabled:
+        _fragments.set(key, fragment)
+    return fragment
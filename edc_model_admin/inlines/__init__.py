@@ -1,3 +1,13 @@
-from .limited_admin_inline_mixin import LimitedAdminInlineMixin
-from .stacked_inline_mixin import StackedInlineMixin
-from .tabular_inline_mixin import TabularInlineMixin
+from ..lazy import lazy_exports
+
+_exports = {
+    'LimitedAdminInlineMixin': '.limited_admin_inline_mixin',
+    'ModelAdminPaginatedInlinesMixin': '.paginated_inline_mixin',
+    'PaginatedInlineMixin': '.paginated_inline_mixin',
+    'StackedInlineMixin': '.stacked_inline_mixin',
+    'TabularInlineMixin': '.tabular_inline_mixin',
+}
+
+__all__ = sorted(_exports)
+
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -1,5 +1,43 @@
+import copy
 
-class LimitedAdminInlineMixin:
+from django.contrib.admin.widgets import AutocompleteSelect, ForeignKeyRawIdWidget
+from django.forms.models import ModelChoiceIterator
+from functools import partial
+
+from ..instrumentation import instrument
+from .paginated_inline_mixin import PaginatedInlineMixin
+
+
+class SharedChoices:
+
+    def __init__(self):
+        self.choices = None
+
+
+class SharedModelChoiceIterator(ModelChoiceIterator):
+
+    """Evaluates the choices on the first iteration and shares
+    them with every copy of the field made from the same
+    formset class.
+    """
+
+    def __init__(self, field, shared=None):
+        super().__init__(field)
+        self.shared = shared or SharedChoices()
+
+    def __iter__(self):
+        if self.shared.choices is None:
+            self.shared.choices = list(super().__iter__())
+        return iter(self.shared.choices)
+
+    def __len__(self):
+        return len(list(self))
+
+    def __bool__(self):
+        return bool(list(self))
+
+
+class LimitedAdminInlineMixin(PaginatedInlineMixin):
     """Limit choices on a foreignkey field in an inline to a value
     on the parent model.
 
@@ -23,18 +61,51 @@ class LimitedAdminInlineMixin:
         class CsvFormatAdmin(admin.ModelAdmin):
             inlines = [CsvDictionaryInline]
         admin_site.register(CsvFormat, CsvFormatAdmin)
+
+    The limited field is a copy. A field declared on the form class
+    is shared by every form class built from it and is not changed.
+    Its choices are queried once per formset and shared by the forms.
+
+    If `limit_inline_choices_threshold` is set and a limited field
+    has more choices, the select is replaced by the
+    `limit_inline_choices_widget`, 'raw_id' or 'autocomplete'. The
+    lookup popup and autocomplete list unlimited choices but the
+    value is still validated against the limited queryset.
     """
 
+    limit_inline_choices_threshold = None
+    limit_inline_choices_widget = 'raw_id'
+
     @staticmethod
     def limit_inline_choices(formset, field, empty=False, **filters):
         assert field in formset.form.base_fields
-        qs = formset.form.base_fields[field].queryset
+        form_field = copy.deepcopy(formset.form.base_fields[field])
         if empty:
-            formset.form.base_fields[field].queryset = qs.none()
+            form_field.queryset = form_field.queryset.none()
         else:
-            qs = qs.filter(**filters)
-            formset.form.base_fields[field].queryset = qs
+            form_field.queryset = form_field.queryset.filter(**filters)
+        form_field.iterator = partial(
+            SharedModelChoiceIterator, shared=SharedChoices())
+        form_field.queryset = form_field.queryset  # resets widget choices
+        formset.form.base_fields[field] = form_field
+
+    def limit_inline_widget(self, formset, field):
+        """Replaces the select of a limited field with more choices
+        than `limit_inline_choices_threshold`.
+        """
+        form_field = formset.form.base_fields[field]
+        if form_field.queryset.count() > self.limit_inline_choices_threshold:
+            rel = self.model._meta.get_field(field).remote_field
+            if self.limit_inline_choices_widget == 'autocomplete':
+                widget = AutocompleteSelect(rel, self.admin_site)
+            else:
+                widget = ForeignKeyRawIdWidget(rel, self.admin_site)
+            widget.is_required = form_field.required
+            widget.attrs.update(form_field.widget_attrs(widget))
+            form_field.widget = widget
+            form_field.queryset = form_field.queryset
 
+    @instrument
     def get_formset(self, request, obj=None, **kwargs):
         formset = super(LimitedAdminInlineMixin, self).get_formset(
             request, obj, **kwargs)
@@ -42,6 +113,8 @@ class LimitedAdminInlineMixin:
         for (field, filters) in self.get_filters(obj):
             if obj:
                 self.limit_inline_choices(formset, field, **filters)
+                if self.limit_inline_choices_threshold is not None:
+                    self.limit_inline_widget(formset, field)
             else:
                 self.limit_inline_choices(formset, field, empty=True)
 
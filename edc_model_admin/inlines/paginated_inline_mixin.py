@@ -0,0 +1,158 @@
+from django import forms
+from django.contrib.admin.utils import quote, unquote
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.http import Http404, JsonResponse
+from django.template.loader import render_to_string
+from django.urls import path, reverse
+
+
+class PaginatedInlineFormSetMixin:
+
+    """Limits an unbound inline formset to `per_page` rows from
+    `start` and a bound one to the rows that were posted.
+
+    Form prefixes are numbered from `start` so a page fetched later
+    continues the numbering of the rows already on the page.
+    """
+
+    per_page = None
+    start = 0
+    pages_url_name = None
+
+    def get_queryset(self):
+        if not hasattr(self, '_queryset'):
+            queryset = super().get_queryset()
+            if self.is_bound:
+                queryset = queryset.filter(pk__in=self.get_posted_pks())
+            else:
+                queryset = queryset[self.start:self.start + self.per_page]
+            self._queryset = queryset
+        return self._queryset
+
+    def get_posted_pks(self):
+        pk_field = self.model._meta.pk
+        pks = []
+        for i in range(self.initial_form_count()):
+            try:
+                pks.append(pk_field.to_python(
+                    self.data[f'{self.add_prefix(i)}-{pk_field.name}']))
+            except (KeyError, ValidationError):
+                pass
+        return pks
+
+    def add_prefix(self, index):
+        if isinstance(index, int):
+            index += self.start
+        return super().add_prefix(index)
+
+    @property
+    def remaining(self):
+        """Returns the number of rows not yet on the page.
+        """
+        return self.queryset.count() - self.start - self.initial_form_count()
+
+    @property
+    def pages_url(self):
+        if self.instance.pk is None or not self.pages_url_name:
+            return None
+        return reverse(self.pages_url_name, args=(quote(self.instance.pk), self.prefix))
+
+
+class PaginatedInlineMixin:
+
+    """Renders the first `inline_per_page` rows of an inline and
+    fetches the others a page at a time on "Show more".
+
+    Only rows on the page are posted, validated and, if changed,
+    saved. The parent ModelAdmin must declare
+    ModelAdminPaginatedInlinesMixin for the pages url.
+
+        class CsvDictionaryInline(TabularInlineMixin, admin.TabularInline):
+            model = CsvDictionary
+            inline_per_page = 25
+    """
+
+    inline_per_page = None
+    paginated_template = 'edc_model_admin/admin/edit_inline/paginated.html'
+
+    def __init__(self, parent_model, admin_site):
+        super().__init__(parent_model, admin_site)
+        if self.inline_per_page:
+            self.paginated_inline_template = self.template
+            self.template = self.paginated_template
+
+    @property
+    def media(self):
+        media = super().media
+        if self.inline_per_page:
+            media += forms.Media(js=['edc_model_admin/js/paginated_inline.js'])
+        return media
+
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+        if self.inline_per_page:
+            opts = self.parent_model._meta
+            formset = type(formset.__name__, (PaginatedInlineFormSetMixin, formset), {
+                'per_page': self.inline_per_page,
+                'pages_url_name': (f'{self.admin_site.name}:{opts.app_label}_'
+                                   f'{opts.model_name}_inline_page')})
+        return formset
+
+
+class ModelAdminPaginatedInlinesMixin:
+
+    """Adds the url that returns a page of a PaginatedInlineMixin
+    inline as JSON, {'html', 'rows', 'remaining'}.
+
+    `start` in the querystring is the number of rows already on the
+    page, that is the INITIAL_FORMS of the inline's management form.
+    """
+
+    def get_urls(self):
+        info = self.model._meta.app_label, self.model._meta.model_name
+        return [
+            path('<path:object_id>/inline/<str:prefix>/',
+                 self.admin_site.admin_view(self.inline_page_view),
+                 name='%s_%s_inline_page' % info),
+        ] + super().get_urls()
+
+    def get_inline_formset_for_prefix(self, request, obj, prefix):
+        """Returns (FormSet, inline) for `prefix` numbered as
+        in `_create_formsets`.
+        """
+        prefixes = {}
+        for FormSet, inline in self.get_formsets_with_inlines(request, obj):
+            formset_prefix = FormSet.get_default_prefix()
+            prefixes[formset_prefix] = prefixes.get(formset_prefix, 0) + 1
+            if prefixes[formset_prefix] != 1 or not formset_prefix:
+                formset_prefix = f'{formset_prefix}-{prefixes[formset_prefix]}'
+            if formset_prefix == prefix:
+                return FormSet, inline
+        raise Http404(f'Unknown inline. Got {prefix}.')
+
+    def inline_page_view(self, request, object_id, prefix):
+        obj = self.get_object(request, unquote(object_id))
+        if obj is None:
+            raise Http404(f'{self.model._meta.verbose_name} not found.')
+        if not self.has_change_permission(request, obj):
+            raise PermissionDenied
+        FormSet, inline = self.get_inline_formset_for_prefix(request, obj, prefix)
+        if not issubclass(FormSet, PaginatedInlineFormSetMixin):
+            raise Http404(f'Inline is not paginated. Got {prefix}.')
+        try:
+            start = max(int(request.GET.get('start', 0)), 0)
+        except ValueError:
+            raise Http404('Invalid start.')
+        PageFormSet = type(FormSet.__name__, (FormSet, ), {
+            'start': start, 'extra': 0, 'min_num': 0})
+        formset = PageFormSet(
+            instance=obj, prefix=prefix, queryset=inline.get_queryset(request))
+        inline_admin_formset = self.get_inline_formsets(
+            request, [formset], [inline], obj)[0]
+        context = dict(self.admin_site.each_context(request),
+                       inline_admin_formset=inline_admin_formset)
+        html = render_to_string(
+            inline.paginated_inline_template, context, request=request)
+        return JsonResponse(dict(
+            html=html, rows=formset.initial_form_count(),
+            remaining=formset.remaining))
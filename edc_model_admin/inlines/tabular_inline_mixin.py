@@ -1,5 +1,6 @@
 from ..model_admin_audit_fields_mixin import ModelAdminAuditFieldsMixin
+from .paginated_inline_mixin import PaginatedInlineMixin
 
 
-class TabularInlineMixin(ModelAdminAuditFieldsMixin):
+class TabularInlineMixin(PaginatedInlineMixin, ModelAdminAuditFieldsMixin):
     pass
@@ -0,0 +1,219 @@
+"""Opt-in timing and query counts for the mixin hooks.
+
+Hooks decorated with `instrument` record wall time and queries per
+(admin class, hook) into in-process histograms when enabled. Set
+settings.EDC_MODEL_ADMIN_INSTRUMENTATION = True or call `enable()`.
+When disabled a hook costs one flag check.
+
+Add `edc_model_admin.middleware.InstrumentationMiddleware` for a
+structured log line per request and to publish this process's
+histograms to the cache for the `edc_model_admin_stats` command.
+"""
+import os
+import socket
+
+from contextvars import ContextVar
+from django.core.cache import caches
+from django.db import connection
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, None)
+CACHE_KEY = 'edc_model_admin.instrumentation'
+
+state = {'enabled': False}
+
+# seconds a published snapshot is kept if its process stops publishing
+PUBLISH_TIMEOUT = 300
+
+# per request {(admin class, hook): [calls, seconds, queries]}
+request_hooks = ContextVar('edc_model_admin_request_hooks', default=None)
+
+# (id of admin, hook name) being recorded, inner super() calls are not
+active_hooks = ContextVar('edc_model_admin_active_hooks', default=frozenset())
+
+
+class Histogram:
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.queries = 0
+        self.buckets = [0] * len(BUCKETS_MS)
+
+    def add(self, seconds, queries):
+        self.count += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.queries += queries
+        ms = seconds * 1000
+        for index, bucket in enumerate(BUCKETS_MS):
+            if bucket is None or ms <= bucket:
+                self.buckets[index] += 1
+                break
+
+    def merge(self, data):
+        self.count += data['count']
+        self.seconds += data['seconds']
+        self.max_seconds = max(self.max_seconds, data['max_seconds'])
+        self.queries += data['queries']
+        self.buckets = [a + b for a, b in zip(self.buckets, data['buckets'])]
+
+    def as_dict(self):
+        return dict(count=self.count, seconds=self.seconds,
+                    max_seconds=self.max_seconds, queries=self.queries,
+                    buckets=list(self.buckets))
+
+
+class Registry:
+
+    """In-process histograms keyed on (admin class, hook).
+    """
+
+    def __init__(self):
+        self.histograms = {}
+        self.lock = Lock()
+
+    def add(self, key, seconds, queries):
+        with self.lock:
+            try:
+                histogram = self.histograms[key]
+            except KeyError:
+                histogram = self.histograms[key] = Histogram()
+            histogram.add(seconds, queries)
+
+    def snapshot(self):
+        with self.lock:
+            return {'|'.join(key): histogram.as_dict()
+                    for key, histogram in self.histograms.items()}
+
+    def clear(self):
+        with self.lock:
+            self.histograms.clear()
+
+
+registry = Registry()
+
+
+def enable():
+    state['enabled'] = True
+
+
+def disable():
+    state['enabled'] = False
+
+
+def is_enabled():
+    return state['enabled']
+
+
+def record(key, func, *args, **kwargs):
+    queries = [0]
+
+    def count_queries(execute, sql, params, many, context):
+        queries[0] += 1
+        return execute(sql, params, many, context)
+
+    start = perf_counter()
+    try:
+        with connection.execute_wrapper(count_queries):
+            return func(*args, **kwargs)
+    finally:
+        seconds = perf_counter() - start
+        registry.add(key, seconds, queries[0])
+        hooks = request_hooks.get()
+        if hooks is not None:
+            totals = hooks.setdefault(key, [0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += queries[0]
+
+
+def instrument(func):
+    """Decorates a mixin hook. Recorded on
+    (admin class label, hook qualname).
+
+    Only the outermost call of a hook name is recorded, the same hook
+    of other mixins called through super() is part of its time.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not state['enabled']:
+            return func(self, *args, **kwargs)
+        active = active_hooks.get()
+        name = (id(self), func.__name__)
+        if name in active:
+            return func(self, *args, **kwargs)
+        cls = self.__class__
+        key = (f'{cls.__module__}.{cls.__qualname__}', func.__qualname__)
+        token = active_hooks.set(active | {name})
+        try:
+            return record(key, func, self, *args, **kwargs)
+        finally:
+            active_hooks.reset(token)
+    return wrapper
+
+
+def instrument_tag(func):
+    """Decorates a template tag that takes context. Recorded on
+    (tag module, tag name).
+
+    The wrapper names `context` for the template Library.
+    """
+    @wraps(func)
+    def wrapper(context, *args, **kwargs):
+        if not state['enabled']:
+            return func(context, *args, **kwargs)
+        key = (func.__module__, func.__qualname__)
+        return record(key, func, context, *args, **kwargs)
+    return wrapper
+
+
+def get_pid_key():
+    return f'{CACHE_KEY}.{socket.gethostname()}.{os.getpid()}'
+
+
+def publish(cache_alias='default', timeout=PUBLISH_TIMEOUT):
+    """Writes this process's histograms to the cache for `timeout`
+    seconds.
+
+    The list of published keys is rewritten with the keys that have
+    not expired, so the snapshots of stopped processes drop out. A
+    key lost to a concurrent publish is added again on the next one.
+    """
+    cache = caches[cache_alias]
+    pid_key = get_pid_key()
+    cache.set(pid_key, registry.snapshot(), timeout)
+    pid_keys = cache.get(f'{CACHE_KEY}.pids') or []
+    live_keys = list(cache.get_many(pid_keys))
+    if pid_key not in live_keys:
+        live_keys.append(pid_key)
+    if sorted(live_keys) != sorted(pid_keys):
+        cache.set(f'{CACHE_KEY}.pids', live_keys, None)
+
+
+def collect(cache_alias='default'):
+    """Returns the histograms published by all processes merged as
+    {'admin class|hook': Histogram}.
+    """
+    cache = caches[cache_alias]
+    histograms = {}
+    snapshots = [registry.snapshot()]
+    pid_keys = cache.get(f'{CACHE_KEY}.pids') or []
+    own_key = get_pid_key()
+    snapshots.extend(
+        snapshot for key, snapshot in cache.get_many(pid_keys).items()
+        if key != own_key)
+    for snapshot in snapshots:
+        for key, data in snapshot.items():
+            histograms.setdefault(key, Histogram()).merge(data)
+    return histograms
+
+
+def reset(cache_alias='default'):
+    cache = caches[cache_alias]
+    registry.clear()
+    pid_keys = cache.get(f'{CACHE_KEY}.pids') or []
+    cache.delete_many(pid_keys + [f'{CACHE_KEY}.pids'])
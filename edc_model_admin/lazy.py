@@ -0,0 +1,27 @@
+import sys
+
+from importlib import import_module
+
+
+def lazy_exports(package, exports):
+    """Returns the module `__getattr__` and `__dir__` of a package
+    that imports its public names on first access.
+
+    `exports` maps each name to the module, relative to `package`,
+    that defines it.
+    """
+    package_globals = sys.modules[package].__dict__
+
+    def __getattr__(name):
+        try:
+            module_name = exports[name]
+        except KeyError:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        value = getattr(import_module(module_name, package), name)
+        package_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(package_globals) | set(exports))
+
+    return __getattr__, __dir__
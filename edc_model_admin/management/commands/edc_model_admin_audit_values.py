@@ -0,0 +1,32 @@
+from django.apps import apps as django_apps
+from django.contrib.admin.sites import all_sites
+from django.core.management.base import BaseCommand
+
+from ...audit_values import AuditValues, audit_value_fields
+from ...model_admin_audit_fields_mixin import ModelAdminAuditFieldsMixin
+
+
+class Command(BaseCommand):
+
+    help = ('Rebuild the cached choices of the audit list filters. '
+            'Schedule to run more often than AuditValues.timeout.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models', nargs='*', metavar='app_label.model_name',
+            help='Models to rebuild. Defaults to all with an audit fields admin')
+
+    def handle(self, *args, **options):
+        if options['models']:
+            targets = [(django_apps.get_model(label), None) for label in options['models']]
+        else:
+            targets = [
+                (model, model_admin.audit_values_cache)
+                for site in all_sites
+                for model, model_admin in site._registry.items()
+                if isinstance(model_admin, ModelAdminAuditFieldsMixin)]
+        for model, cache_alias in targets:
+            for field_name in audit_value_fields:
+                values = AuditValues(model, field_name, cache_alias).rebuild()
+                self.stdout.write(
+                    f'{model._meta.label_lower}.{field_name}: {len(values)} values')
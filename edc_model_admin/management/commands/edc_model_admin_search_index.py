@@ -0,0 +1,28 @@
+from django.contrib.admin.sites import all_sites
+from django.core.management.base import BaseCommand
+
+from ...model_admin_basic_mixin import ModelAdminBasicMixin
+
+
+class Command(BaseCommand):
+
+    help = ('Create or rebuild the full-text search index of each admin with '
+            'search_fulltext, e.g. after declaring it on existing data.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models', nargs='*', metavar='app_label.model_name',
+            help='Models to rebuild. Defaults to all with search_fulltext')
+
+    def handle(self, *args, **options):
+        backends = {}
+        for site in all_sites:
+            for model, model_admin in site._registry.items():
+                if (isinstance(model_admin, ModelAdminBasicMixin)
+                        and model_admin.search_fulltext):
+                    backends[model] = model_admin.search_fulltext
+        for model, backend in backends.items():
+            if options['models'] and model._meta.label_lower not in options['models']:
+                continue
+            count = backend.rebuild(model)
+            self.stdout.write(f'{model._meta.label_lower}: {count} rows indexed')
@@ -0,0 +1,66 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from ...form_as_json import FormAsJSONStats
+from ...instrumentation import BUCKETS_MS, collect, reset
+
+
+class Command(BaseCommand):
+
+    help = ('Show time and queries per admin class and hook recorded by '
+            'edc_model_admin instrumentation.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--json', action='store_true', dest='json',
+            help='Output as JSON')
+        parser.add_argument(
+            '--reset', action='store_true', dest='reset',
+            help='Clear the recorded histograms')
+        parser.add_argument(
+            '--cache', dest='cache_alias', default='default',
+            help='Cache alias the histograms are published to')
+        parser.add_argument(
+            '--form-as-json', action='store_true', dest='form_as_json',
+            help='Show form_as_json bytes per model instead')
+
+    def handle(self, *args, **options):
+        if options['form_as_json']:
+            return self.handle_form_as_json(**options)
+        if options['reset']:
+            reset(cache_alias=options['cache_alias'])
+            self.stdout.write('Cleared.')
+            return
+        histograms = collect(cache_alias=options['cache_alias'])
+        if options['json']:
+            self.stdout.write(json.dumps(
+                {key: histogram.as_dict() for key, histogram in histograms.items()},
+                indent=2))
+            return
+        buckets = ' '.join(f'<={b}' if b else 'more' for b in BUCKETS_MS)
+        self.stdout.write(f'admin class|hook  calls  mean_ms  max_ms  queries  [{buckets}]')
+        for key, histogram in sorted(
+                histograms.items(), key=lambda item: -item[1].seconds):
+            mean_ms = histogram.seconds / histogram.count * 1000
+            self.stdout.write(
+                f'{key}  {histogram.count}  {mean_ms:.2f}  '
+                f'{histogram.max_seconds * 1000:.2f}  {histogram.queries}  '
+                f'{histogram.buckets}')
+
+    def handle_form_as_json(self, **options):
+        stats = FormAsJSONStats(options['cache_alias'])
+        if options['reset']:
+            stats.clear()
+            self.stdout.write('Cleared.')
+            return
+        data = stats.as_dict()
+        if options['json']:
+            self.stdout.write(json.dumps(data, indent=2))
+            return
+        self.stdout.write('model  saves  skipped  json_bytes  stored_bytes  saved_bytes')
+        for label_lower, counters in sorted(data.items()):
+            self.stdout.write(
+                f'{label_lower}  {counters["saves"]}  {counters["skipped"]}  '
+                f'{counters["json_bytes"]}  {counters["stored_bytes"]}  '
+                f'{counters["saved_bytes"]}')
@@ -0,0 +1,47 @@
+import json
+import logging
+
+from django.conf import settings
+from time import monotonic
+
+from .instrumentation import PUBLISH_TIMEOUT, is_enabled, publish, request_hooks
+
+logger = logging.getLogger('edc_model_admin.instrumentation')
+
+
+class InstrumentationMiddleware:
+
+    """Logs one JSON line per request with the time and queries
+    per (admin class, hook) and publishes this process's histograms
+    to the cache at most every
+    `EDC_MODEL_ADMIN_INSTRUMENTATION_PUBLISH_SECONDS`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.publish_seconds = getattr(
+            settings, 'EDC_MODEL_ADMIN_INSTRUMENTATION_PUBLISH_SECONDS', 30)
+        self.published = monotonic()
+
+    def __call__(self, request):
+        if not is_enabled():
+            return self.get_response(request)
+        token = request_hooks.set({})
+        try:
+            response = self.get_response(request)
+            hooks = request_hooks.get()
+        finally:
+            request_hooks.reset(token)
+        if hooks:
+            logger.info(json.dumps({
+                'path': request.path,
+                'method': request.method,
+                'status': response.status_code,
+                'hooks': [
+                    dict(admin=admin, hook=hook, calls=calls,
+                         ms=round(seconds * 1000, 3), queries=queries)
+                    for (admin, hook), (calls, seconds, queries) in hooks.items()]}))
+        if monotonic() - self.published > self.publish_seconds:
+            self.published = monotonic()
+            publish(timeout=max(self.publish_seconds * 10, PUBLISH_TIMEOUT))
+        return response
@@ -1,5 +1,12 @@
+import socket
+
+from django.contrib.admin.options import IS_POPUP_VAR
+from django.db import transaction
 from edc_base.utils import get_utcnow
 
+from .audit_values import AuditValues, AuditValuesListFilter, audit_value_fields
+from .instrumentation import instrument
+
 audit_fields = ('user_created', 'user_modified',
                 'created', 'modified', 'hostname_created', 'hostname_modified')
 
@@ -11,6 +18,28 @@ audit_fieldset_tuple = (
 
 class ModelAdminAuditFieldsMixin:
 
+    """Stamps the audit fields on save and adds audit list filters.
+
+    Declare `bulk_update_actions` for changelist actions that update
+    the selected rows with a queryset UPDATE, stamping
+    user_modified, modified and hostname_modified in the same
+    statement. Values may be callables that take the request.
+
+        bulk_update_actions = {
+            'mark_reviewed': dict(description='Mark reviewed',
+                                  values={'reviewed': True})}
+
+    Like any queryset update, save() and the model signals are not
+    run.
+    """
+
+    # cache alias for the choices of the user and hostname list filters
+    audit_values_cache = 'default'
+
+    bulk_update_actions = {}
+    bulk_update_chunk_size = 1000
+
+    @instrument
     def save_model(self, request, obj, form, change):
         if not change:
             obj.user_created = request.user.username
@@ -19,18 +48,66 @@ class ModelAdminAuditFieldsMixin:
             obj.user_modified = request.user.username
             obj.modified = get_utcnow()
         super().save_model(request, obj, form, change)
+        for field_name in audit_value_fields:
+            AuditValues(self.model, field_name, self.audit_values_cache).add(
+                getattr(obj, field_name, None))
 
+    @instrument
     def get_list_filter(self, request):
-        columns = ['created', 'modified', 'user_created',
-                   'user_modified', 'hostname_created', 'hostname_modified']
-        self.list_filter = list(self.list_filter or [])
-        self.list_filter = self.list_filter + \
-            [item for item in columns if item not in self.list_filter]
-        return tuple(self.list_filter)
+        columns = ['created', 'modified'] + [
+            (field_name, AuditValuesListFilter) for field_name in audit_value_fields]
+        list_filter = list(self.list_filter or [])
+        names = [item[0] if isinstance(item, (list, tuple)) else item
+                 for item in list_filter]
+        return tuple(list_filter + [
+            item for item in columns
+            if (item[0] if isinstance(item, tuple) else item) not in names])
 
+    @instrument
     def get_readonly_fields(self, request, obj=None):
         # FIXME: somewhere the readonly_fields is being changed to a list
         readonly_fields = super().get_readonly_fields(request, obj=obj)
         if readonly_fields:
             readonly_fields = tuple(readonly_fields)
         return readonly_fields + audit_fields
+
+    def get_actions(self, request):
+        actions = super().get_actions(request)
+        if (self.actions is not None and IS_POPUP_VAR not in request.GET
+                and self.has_change_permission(request)):
+            for name, options in self.bulk_update_actions.items():
+                actions[name] = (self.bulk_update_action(name, options['values']),
+                                 name, options.get('description', name))
+        return actions
+
+    def bulk_update_action(self, name, values):
+        def action(modeladmin, request, queryset):
+            count = modeladmin.bulk_update(request, queryset, **{
+                k: v(request) if callable(v) else v for k, v in values.items()})
+            opts = modeladmin.model._meta
+            modeladmin.message_user(
+                request, f'{count} {opts.verbose_name_plural} updated.')
+        action.__name__ = name
+        return action
+
+    def bulk_update(self, request, queryset, **values):
+        """Updates the rows of `queryset` with `values` and the
+        audit fields in chunks of `bulk_update_chunk_size`.
+
+        Returns the number of rows updated.
+        """
+        values.update(
+            user_modified=request.user.username,
+            modified=get_utcnow(),
+            hostname_modified=socket.gethostname())
+        manager = self.model._default_manager
+        pks = list(queryset.order_by().values_list('pk', flat=True))
+        count = 0
+        for index in range(0, len(pks), self.bulk_update_chunk_size):
+            chunk = pks[index:index + self.bulk_update_chunk_size]
+            with transaction.atomic():
+                count += manager.filter(pk__in=chunk).update(**values)
+        for field_name in ['user_modified', 'hostname_modified']:
+            AuditValues(self.model, field_name, self.audit_values_cache).add(
+                values[field_name])
+        return count
@@ -1,3 +1,22 @@
+from .instrumentation import instrument
+from .search import Search
+
+
+# compiled layouts keyed on (admin class, attr, tuple of super() result)
+_layouts = {}
+
+
+def clear_layout_cache(admin_cls=None):
+    """Clears compiled layouts for `admin_cls` or for all admin classes.
+
+    Call if mixin_* attributes are changed at runtime.
+    """
+    if admin_cls is None:
+        _layouts.clear()
+    else:
+        for key in [key for key in _layouts if key[0] is admin_cls]:
+            del _layouts[key]
+
 
 class ModelAdminBasicMixin:
 
@@ -9,6 +28,22 @@ class ModelAdminBasicMixin:
 
     Use for a ModelAdmin mixin prepared for an abstract models,
     e.g. edc_consent.models.BaseConsent.
+
+    The merged result is compiled once per admin class and per
+    distinct value returned by super() and returned as a tuple. If
+    the mixin_* attributes are changed at runtime, call
+    `clear_layout_cache`.
+
+    Nothing is written to the instance or class per request;
+    `radio_fields` is merged once on init.
+
+    Declare `search_strategies` and/or `search_fulltext` to search
+    the merged search fields by the shape of the term instead of
+    `icontains` on every field, see `search.py`.
+
+        mixin_search_fields = ['subject_identifier', 'first_name']
+        search_strategies = {'subject_identifier': 'prefix'}
+        search_fulltext = fulltext(['first_name', 'last_name'])
     """
 
     mixin_fields = []
@@ -22,20 +57,32 @@ class ModelAdminBasicMixin:
     list_filter_pos = []
 
     mixin_search_fields = []
+    search_strategies = {}
+    search_fulltext = None
 
     mixin_exclude_fields = []
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        radio_fields = dict(self.radio_fields)
+        radio_fields.update(self.mixin_radio_fields)
+        for key in self.mixin_exclude_fields:
+            radio_fields.pop(key, None)
+        self.radio_fields = radio_fields
+        if self.search_fulltext:
+            self.search_fulltext.connect(self.model)
+
     def reorder(self, original_list):
         """Return an ordered list after inserting list items from the
         original that were passed tuples of (index, item).
         """
         new_list = []
         items_with_pos = []
-        for index, item in enumerate(original_list):
-            try:
-                _, _ = item
+        for item in original_list:
+            if (isinstance(item, (tuple, list)) and len(item) == 2
+                    and isinstance(item[0], int)):
                 items_with_pos.append(item)
-            except (ValueError, TypeError):
+            else:
                 new_list.append(item)
         for index, item in items_with_pos:
             try:
@@ -45,38 +92,64 @@ class ModelAdminBasicMixin:
             new_list.insert(index, item)
         return new_list
 
+    def compiled_layout(self, name, field_list, positioned=None, mixin_field_list=None):
+        """Returns a tuple of `field_list` reordered by `positioned`,
+        extended by `mixin_field_list` and less `mixin_exclude_fields`.
+
+        The result is cached on (admin class, name, field_list).
+        """
+        try:
+            key = (self.__class__, name, tuple(field_list or []))
+            layout = _layouts.get(key)
+        except TypeError:
+            # unhashable item, e.g. a list in fields
+            key, layout = None, None
+        if layout is None:
+            layout = self.reorder(
+                list(field_list or []) + list(positioned or []))
+            layout = self.update_from_mixin(layout, mixin_field_list)
+            if key:
+                _layouts[key] = layout
+        return layout
+
+    @instrument
     def get_list_display(self, request):
-        self.list_display = list(
-            super(ModelAdminBasicMixin, self).get_list_display(request) or [])
-        self.list_display = self.reorder(
-            list(self.list_display) + list(self.list_display_pos or []))
-        self.list_display = self.extend_from(
-            self.list_display, self.mixin_list_display or [])
-        self.list_display = self.remove_from(self.list_display)
-        return tuple(self.list_display)
+        return self.compiled_layout(
+            'list_display',
+            super(ModelAdminBasicMixin, self).get_list_display(request),
+            positioned=self.list_display_pos,
+            mixin_field_list=self.mixin_list_display)
 
+    @instrument
     def get_list_filter(self, request):
-        self.list_filter = list(
-            super(ModelAdminBasicMixin, self).get_list_filter(request) or [])
-        self.list_filter = self.reorder(
-            list(self.list_filter) + list(self.list_filter_pos or []))
-        self.list_filter = self.update_from_mixin(
-            self.list_filter, self.mixin_list_filter or [])
-        return tuple(self.list_filter)
+        return self.compiled_layout(
+            'list_filter',
+            super(ModelAdminBasicMixin, self).get_list_filter(request),
+            positioned=self.list_filter_pos,
+            mixin_field_list=self.mixin_list_filter)
 
+    @instrument
     def get_search_fields(self, request):
-        self.search_fields = list(
-            super(ModelAdminBasicMixin, self).get_search_fields(request) or [])
-        self.search_fields = self.update_from_mixin(
-            self.search_fields, self.mixin_search_fields or [])
-        return tuple(self.search_fields)
-
+        return self.compiled_layout(
+            'search_fields',
+            super(ModelAdminBasicMixin, self).get_search_fields(request),
+            mixin_field_list=self.mixin_search_fields)
+
+    @instrument
+    def get_search_results(self, request, queryset, search_term):
+        if not self.search_strategies and not self.search_fulltext:
+            return super(ModelAdminBasicMixin, self).get_search_results(
+                request, queryset, search_term)
+        return Search(
+            self.model, self.get_search_fields(request),
+            strategies=self.search_strategies,
+            fulltext=self.search_fulltext).filter(queryset, search_term)
+
+    @instrument
     def get_fields(self, request, obj=None):
-        self.radio_fields = self.get_radio_fields(request, obj)
         if self.mixin_fields:
-            self.fields = self.update_from_mixin(
-                self.fields, self.mixin_fields or [])
-            return self.fields
+            return self.compiled_layout(
+                'fields', self.fields, mixin_field_list=self.mixin_fields)
         elif self.fields:
             return self.fields
         form = self.get_form(request, obj, fields=None)
@@ -88,23 +161,18 @@ class ModelAdminBasicMixin:
         return tuple(field_list)
 
     def extend_from(self, field_list, mixin_field_list):
-        return (list(field_list)
-                + list([fld for fld in mixin_field_list if fld not in field_list]))
+        field_list = list(field_list)
+        try:
+            existing = set(field_list)
+        except TypeError:
+            existing = field_list
+        return field_list + [fld for fld in mixin_field_list if fld not in existing]
 
     def remove_from(self, field_list):
-        field_list = list(field_list)
-        for field in self.mixin_exclude_fields:
-            try:
-                field_list.remove(field)
-            except ValueError:
-                pass
-        return tuple(field_list)
+        exclude_fields = set(self.mixin_exclude_fields)
+        return tuple(
+            fld for fld in field_list
+            if not isinstance(fld, str) or fld not in exclude_fields)
 
     def get_radio_fields(self, request, obj=None):
-        self.radio_fields.update(self.mixin_radio_fields)
-        for key in self.mixin_exclude_fields:
-            try:
-                del self.mixin_radio_fields[key]
-            except KeyError:
-                pass
         return self.radio_fields
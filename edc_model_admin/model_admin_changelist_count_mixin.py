@@ -0,0 +1,92 @@
+from django.contrib import messages
+from django.db import router, transaction
+
+from .changelist_count import ChangeListCountMixin, ChangelistCounts, estimate_count
+
+# ChangeList classes with ChangeListCountMixin keyed on the base class
+_changelists = {}
+
+
+class ModelAdminChangelistCountMixin:
+
+    """Takes the changelist counts, filtered and "N total", from the
+    `changelist_count_cache` instead of a COUNT(*) on every load.
+
+    Counts are cached per admin and counted queryset, i.e. filters,
+    search and anything `get_queryset` adds, for
+    `changelist_count_timeout` seconds and invalidated for the model
+    when the transaction of `save_model`, `delete_model` or
+    `delete_queryset` commits. Changes made elsewhere show after the
+    timeout.
+
+    If `changelist_count_estimate_above` is set, a queryset the
+    database estimates at more rows than that is not counted; the
+    estimate is shown and `changelist_view` adds a message that the
+    counts are approximate.
+    """
+
+    changelist_count_cache = 'default'
+    changelist_count_timeout = 60 * 5
+    changelist_count_estimate_above = None
+
+    def get_changelist(self, request, **kwargs):
+        changelist_cls = super().get_changelist(request, **kwargs)
+        try:
+            return _changelists[changelist_cls]
+        except KeyError:
+            _changelists[changelist_cls] = type(
+                changelist_cls.__name__, (ChangeListCountMixin, changelist_cls), {})
+        return _changelists[changelist_cls]
+
+    def changelist_view(self, request, extra_context=None):
+        response = super().changelist_view(request, extra_context=extra_context)
+        cl = (getattr(response, 'context_data', None) or {}).get('cl')
+        if getattr(cl, 'count_is_approximate', False):
+            self.message_user(
+                request, 'Counts are approximate.', level=messages.INFO,
+                fail_silently=True)
+        return response
+
+    def get_changelist_counts(self):
+        return ChangelistCounts(
+            self.model, self.changelist_count_cache, self.changelist_count_timeout)
+
+    def get_changelist_count(self, request, queryset):
+        """Returns (count, approximate) for `queryset`.
+        """
+        counts = self.get_changelist_counts()
+        key = counts.key(
+            queryset, self.admin_site.name,
+            f'{self.__class__.__module__}.{self.__class__.__qualname__}')
+        value = counts.get(key)
+        if value is None:
+            estimate = None
+            if self.changelist_count_estimate_above is not None:
+                estimate = estimate_count(queryset)
+            if estimate is not None and estimate > self.changelist_count_estimate_above:
+                value = (estimate, True)
+            else:
+                value = (queryset.count(), False)
+            counts.set(key, value)
+        return value
+
+    def invalidate_changelist_counts(self):
+        """Invalidates the counts of the model once the current
+        transaction commits so a count taken before then is not
+        cached under the new generation.
+        """
+        transaction.on_commit(
+            self.get_changelist_counts().invalidate,
+            using=router.db_for_write(self.model))
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        self.invalidate_changelist_counts()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        self.invalidate_changelist_counts()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        self.invalidate_changelist_counts()
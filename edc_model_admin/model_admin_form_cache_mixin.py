@@ -0,0 +1,88 @@
+from django.db import connection
+from time import perf_counter
+
+from .instrumentation import instrument
+
+
+def freeze(value):
+    """Returns a hashable version of a get_form kwarg.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    elif isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    return value
+
+
+class ModelAdminFormCacheMixin:
+
+    """Memoizes `get_form` for the duration of a request.
+
+    A change view calls `get_form` several times, e.g. from
+    `get_fields` and again to build the form. The form class from
+    super(), including any post-processing by mixins after this one
+    in the MRO, is built once per (admin, obj, kwargs) per request.
+    Declare first in the bases.
+
+    Counters are kept on the request, see `get_form_cache_stats`.
+    """
+
+    form_cache_attr = 'edc_form_cache'
+    form_cache_stats_attr = 'edc_form_cache_stats'
+
+    @instrument
+    def get_form(self, request, obj=None, **kwargs):
+        try:
+            key = (self, id(obj), freeze(kwargs))
+            hash(key)
+        except TypeError:
+            return super().get_form(request, obj, **kwargs)
+        cache = getattr(request, self.form_cache_attr, None)
+        if cache is None:
+            cache = {}
+            setattr(request, self.form_cache_attr, cache)
+        stats = self.get_form_cache_stats(request)
+        try:
+            cached_obj, form = cache[key]
+        except KeyError:
+            pass
+        else:
+            if cached_obj is obj:
+                stats['hits'] += 1
+                return form
+        stats['misses'] += 1
+        if stats['depth']:
+            # nested miss, e.g. get_fields, is timed by the outer miss
+            form = super().get_form(request, obj, **kwargs)
+        else:
+            form = self.timed_get_form(stats, request, obj, **kwargs)
+        cache[key] = (obj, form)
+        return form
+
+    def timed_get_form(self, stats, request, obj=None, **kwargs):
+        queries = []
+
+        def count_queries(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        stats['depth'] += 1
+        start = perf_counter()
+        try:
+            with connection.execute_wrapper(count_queries):
+                form = super().get_form(request, obj, **kwargs)
+        finally:
+            stats['depth'] -= 1
+            stats['seconds'] += perf_counter() - start
+            stats['queries'] += len(queries)
+        return form
+
+    def get_form_cache_stats(self, request):
+        """Returns a dictionary of hits, misses and the seconds and
+        queries spent on misses for this request.
+        """
+        stats = getattr(request, self.form_cache_stats_attr, None)
+        if stats is None:
+            stats = dict(hits=0, misses=0, seconds=0.0, queries=0, depth=0)
+            setattr(request, self.form_cache_stats_attr, stats)
+        return stats
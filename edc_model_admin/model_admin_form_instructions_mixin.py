@@ -1,6 +1,7 @@
+from .model_admin_static_context_mixin import ModelAdminStaticContextMixin
 
 
-class ModelAdminFormInstructionsMixin:
+class ModelAdminFormInstructionsMixin(ModelAdminStaticContextMixin):
     """Add instructions to the add view context.
 
     Override the change_form.html to add instructions.
@@ -54,12 +55,8 @@ class ModelAdminFormInstructionsMixin:
             self.change_additional_instructions or self.additional_instructions)
         return extra_context
 
-    def add_view(self, request, form_url='', extra_context=None):
-        extra_context = self.update_add_instructions(extra_context)
-        return super().add_view(
-            request, form_url=form_url, extra_context=extra_context)
-
-    def change_view(self, request, object_id, form_url='', extra_context=None):
-        extra_context = self.update_change_instructions(extra_context)
-        return super().change_view(
-            request, object_id, form_url=form_url, extra_context=extra_context)
+    def get_static_context(self, view):
+        context = super().get_static_context(view)
+        if view == 'add':
+            return self.update_add_instructions(context)
+        return self.update_change_instructions(context)
@@ -1,7 +1,9 @@
 from django.apps import apps as django_apps
 
+from .model_admin_static_context_mixin import ModelAdminStaticContextMixin
 
-class ModelAdminInstitutionMixin:
+
+class ModelAdminInstitutionMixin(ModelAdminStaticContextMixin):
 
     """Adds instituion attrs to the ModelAdmin context.
     """
@@ -15,14 +17,6 @@ class ModelAdminInstitutionMixin:
             'disclaimer': app_config.disclaimer})
         return extra_context
 
-    def add_view(self, request, form_url='', extra_context=None):
-        extra_context = extra_context or {}
-        extra_context = self.get_institution_extra_context(extra_context)
-        return super().add_view(
-            request, form_url=form_url, extra_context=extra_context)
-
-    def change_view(self, request, object_id, form_url='', extra_context=None):
-        extra_context = extra_context or {}
-        extra_context = self.get_institution_extra_context(extra_context)
-        return super().change_view(
-            request, object_id, form_url=form_url, extra_context=extra_context)
+    def get_static_context(self, view):
+        return self.get_institution_extra_context(
+            super().get_static_context(view))
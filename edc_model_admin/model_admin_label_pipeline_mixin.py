@@ -0,0 +1,118 @@
+import re
+
+from django.forms.forms import pretty_name
+from django.utils import translation
+from django.utils.safestring import mark_safe
+
+from .instrumentation import instrument
+from .utils import copy_declared_fields
+
+numbered_label = re.compile(r'^\d+\.')
+linked_label = re.compile(r'\<a\ title\=\"')
+
+# compiled labels keyed on (admin class, form class, fields, language)
+_labels = {}
+
+
+def clear_label_cache(admin_cls=None):
+    """Clears compiled labels for `admin_cls` or for all admin classes.
+    """
+    if admin_cls is None:
+        _labels.clear()
+    else:
+        for key in [key for key in _labels if key[0] is admin_cls]:
+            del _labels[key]
+
+
+class LabelPipeline:
+
+    """Transforms form field labels by numbering then by replacing
+    text.
+
+    `replacements` is a list of (old, new) or (old, new, skip_fields).
+    """
+
+    def __init__(self, auto_number=None, replacements=None):
+        self.auto_number = auto_number
+        self.replacements = []
+        for replacement in replacements or []:
+            old, new, skip_fields = (list(replacement) + [None])[:3]
+            self.replacements.append((old, new, skip_fields or []))
+
+    def compile(self, form):
+        """Returns a dictionary of {field name: label} for fields in
+        `form.base_fields` whose label is changed.
+        """
+        labels = {}
+        for index, (name, form_field) in enumerate(form.base_fields.items()):
+            label = form_field.label
+            label = pretty_name(name) if label is None else str(label)
+            new_label = label
+            if (self.auto_number and not numbered_label.match(label)
+                    and not linked_label.match(label)):
+                new_label = f'<a title="{name}">{index + 1}</a>. {label}'
+            for old, new, skip_fields in self.replacements:
+                if name not in skip_fields and old in new_label:
+                    new_label = new_label.replace(old, new)
+            if new_label != label:
+                labels[name] = mark_safe(new_label)
+        return labels
+
+    @staticmethod
+    def apply(form, labels):
+        """Sets the compiled labels on `form.base_fields`.
+        """
+        if labels:
+            copy_declared_fields(form)
+            base_fields = form.base_fields
+            for name, label in labels.items():
+                base_fields[name].label = label
+        return form
+
+
+class ModelAdminLabelPipelineMixin:
+
+    """Applies one label pipeline to the form class from `get_form`.
+
+    Labels are compiled once per admin class, form base class, field
+    list and language and assigned from the cache on later requests.
+    If labels change at runtime, call `clear_label_cache`.
+
+    See ModelAdminFormAutoNumberMixin and
+    ModelAdminReplaceLabelTextMixin.
+    """
+
+    auto_number_labels = False
+
+    # list of (old, new) or (old, new, skip_fields)
+    replace_label_text_rules = []
+
+    def get_label_pipeline(self, form):
+        return LabelPipeline(
+            auto_number=getattr(
+                getattr(form, '_meta', None), 'auto_number',
+                self.auto_number_labels),
+            replacements=self.replace_label_text_rules)
+
+    def get_labels(self, form, base_form=None):
+        """Returns the compiled labels for this form class.
+
+        `base_form` is the form class passed to `get_form`, defaults
+        to `self.form`.
+        """
+        key = (self.__class__, self.model._meta.label_lower, base_form or self.form,
+               tuple(form.base_fields), translation.get_language())
+        try:
+            labels = _labels[key]
+        except KeyError:
+            labels = _labels[key] = self.get_label_pipeline(form).compile(form)
+        return labels
+
+    def apply_label_pipeline(self, form, base_form=None):
+        return LabelPipeline.apply(
+            form, self.get_labels(form, base_form=base_form))
+
+    @instrument
+    def get_form(self, request, obj=None, **kwargs):
+        form = super().get_form(request, obj, **kwargs)
+        return self.apply_label_pipeline(form, base_form=kwargs.get('form'))
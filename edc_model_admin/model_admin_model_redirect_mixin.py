@@ -1,19 +1,39 @@
+from django.core.exceptions import FieldError
 from django.urls import reverse
+from urllib.parse import urlencode
 
 from .base_model_admin_redirect_mixin import BaseModelAdminRedirectMixin
+from .instrumentation import instrument
 
 
 class ModelAdminModelRedirectMixin(BaseModelAdminRedirectMixin):
 
     """Redirect to another model's changelist on add, change or delete.
+
+    The changelist is searched for the value of
+    `redirect_search_field` on the saved obj with `q`, or, if
+    `redirect_exact_lookup` is the name of a field on the redirect
+    model, filtered with `<redirect_exact_lookup>__exact`.
     """
 
     redirect_app_label = None
     redirect_model_name = None
     redirect_search_field = None
+    redirect_exact_lookup = None
     redirect_namespace = 'admin'
 
     def search_value(self, obj):
+        """Returns the value of `redirect_search_field` for obj.
+
+        A path over relations is resolved in one query on obj's pk.
+        """
+        if '__' in self.redirect_search_field and obj.pk is not None:
+            try:
+                return obj.__class__._default_manager.filter(pk=obj.pk).values_list(
+                    self.redirect_search_field, flat=True).first()
+            except FieldError:
+                pass  # not all fields, e.g. a property
+
         def objattr(inst):
             my_inst = inst
             for name in self.redirect_search_field.split('__'):
@@ -25,16 +45,23 @@ class ModelAdminModelRedirectMixin(BaseModelAdminRedirectMixin):
             value = None
         return value
 
+    @instrument
     def redirect_url(self, request, obj, post_url_continue=None, namespace=None):
         namespace = namespace or self.redirect_namespace
-        return '{}?q={}'.format(
+        if self.redirect_exact_lookup:
+            querystring = {
+                f'{self.redirect_exact_lookup}__exact': self.search_value(obj) or ''}
+        else:
+            querystring = {'q': self.search_value(obj) or ''}
+        return '{}?{}'.format(
             reverse(
                 '{namespace}:{app_label}_{model_name}_changelist'.format(
                     namespace=namespace,
                     app_label=self.redirect_app_label,
                     model_name=self.redirect_model_name)),
-            self.search_value(obj) or '')
+            urlencode(querystring))
 
+    @instrument
     def redirect_url_on_delete(self, request, obj_display, obj_id, namespace=None):
         namespace = namespace or self.redirect_namespace
         return reverse(
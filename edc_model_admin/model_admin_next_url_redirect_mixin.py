@@ -5,6 +5,10 @@ from django.urls import reverse, NoReverseMatch
 from urllib.parse import urlencode
 
 from .base_model_admin_redirect_mixin import BaseModelAdminRedirectMixin
+from .instrumentation import instrument
+from .model_admin_static_context_mixin import ModelAdminStaticContextMixin
+from .navigation_plan import NavigationPlan, get_visit_key
+from .next_url import NextUrl
 
 
 class ModelAdminNextUrlRedirectError(Exception):
@@ -15,7 +19,8 @@ class ModelAdminNextUrlError(Exception):
     pass
 
 
-class ModelAdminNextUrlRedirectMixin(BaseModelAdminRedirectMixin):
+class ModelAdminNextUrlRedirectMixin(BaseModelAdminRedirectMixin,
+                                     ModelAdminStaticContextMixin):
 
     """Redirect on add, change, delete by reversing a url_name
     in the querystring OR clicking Save Next.
@@ -34,6 +39,9 @@ class ModelAdminNextUrlRedirectMixin(BaseModelAdminRedirectMixin):
 
     next_querystring_attr = 'next'
 
+    # cache alias for the save next navigation plan
+    navigation_plan_cache = 'default'
+
     def extra_context(self, extra_context=None):
         """Adds the booleans for the savenext and cancel buttons
         to the context.
@@ -47,6 +55,10 @@ class ModelAdminNextUrlRedirectMixin(BaseModelAdminRedirectMixin):
             extra_context.update(show_cancel=self.show_cancel)
         return extra_context
 
+    def get_static_context(self, view):
+        return self.extra_context(super().get_static_context(view))
+
+    @instrument
     def add_view(self, request, form_url='', extra_context=None):
         """Redirect before save on "cancel", otherwise return
         normal behavior.
@@ -54,9 +66,9 @@ class ModelAdminNextUrlRedirectMixin(BaseModelAdminRedirectMixin):
         if self.show_cancel and request.POST.get('_cancel'):
             redirect_url = self.get_next_redirect_url(request=request)
             return HttpResponseRedirect(redirect_url)
-        extra_context = self.extra_context(extra_context)
         return super().add_view(request, form_url=form_url, extra_context=extra_context)
 
+    @instrument
     def change_view(self, request, object_id, form_url='', extra_context=None):
         """Redirect before save on "cancel", otherwise return
         normal behavior.
@@ -64,7 +76,6 @@ class ModelAdminNextUrlRedirectMixin(BaseModelAdminRedirectMixin):
         if self.show_cancel and request.POST.get('_cancel'):
             redirect_url = self.get_next_redirect_url(request=request)
             return HttpResponseRedirect(redirect_url)
-        extra_context = self.extra_context(extra_context)
         return super().change_view(request, object_id, form_url=form_url, extra_context=extra_context)
 
     def render_delete_form(self, request, context):
@@ -73,6 +84,7 @@ class ModelAdminNextUrlRedirectMixin(BaseModelAdminRedirectMixin):
     def delete_view(self, request, object_id, extra_context=None):
         return super().delete_view(request, object_id, extra_context=extra_context)
 
+    @instrument
     def redirect_url(self, request, obj, post_url_continue=None):
         redirect_url = None
         if self.show_save_next and request.POST.get('_savenext'):
@@ -82,63 +94,103 @@ class ModelAdminNextUrlRedirectMixin(BaseModelAdminRedirectMixin):
                 redirect_url = self.get_next_redirect_url(request=request)
         elif self.show_cancel and request.POST.get('_cancel'):
             redirect_url = self.get_next_redirect_url(request=request)
-        elif request.GET.dict().get(self.next_querystring_attr):
+        elif self.get_next_url(request):
             redirect_url = self.get_next_redirect_url(request=request)
         if not redirect_url:
             redirect_url = super().redirect_url(
                 request, obj, post_url_continue=post_url_continue)
         return redirect_url
 
+    def get_next_url(self, request):
+        """Returns the NextUrl for this request or None.
+        """
+        return NextUrl.from_request(request, attr=self.next_querystring_attr)
+
     def get_next_redirect_url(self, request=None):
         """Returns a redirect url determined from the "next" attr
         in the querystring.
         """
-        url_name = request.GET.dict().get(
-            self.next_querystring_attr).split(',')[0]
-        options = self.get_next_options(request=request)
+        next_url = self.get_next_url(request)
+        if not next_url:
+            raise ModelAdminNextUrlRedirectError(
+                f'Expected "{self.next_querystring_attr}" in the querystring. '
+                f'Got {request.GET.dict()}.')
         try:
-            redirect_url = reverse(url_name, kwargs=options)
+            return next_url.url
         except NoReverseMatch as e:
-            msg = f'{e}. Got url_name={url_name}, kwargs={options}.'
+            raise ModelAdminNextUrlRedirectError(str(e))
+
+    @instrument
+    def save_model(self, request, obj, form, change):
+        """Updates the visit's navigation plan with the url of
+        the saved CRF.
+        """
+        super().save_model(request, obj, form, change)
+        if self.show_save_next:
             try:
-                redirect_url = reverse(url_name)  # retry without kwargs
-            except NoReverseMatch:
-                # raise with first exception msg
-                raise ModelAdminNextUrlRedirectError(msg)
-        return redirect_url
+                plan = self.get_navigation_plan(obj)
+            except AttributeError:
+                pass
+            else:
+                url_name = self.get_savenext_url_name(obj._meta.label_lower)
+                plan.set_url(
+                    (self.admin_site.name, obj._meta.label_lower,
+                     getattr(obj, 'panel_name', None)),
+                    reverse(f'{url_name}_change', args=(obj.id, )))
+                plan.save()
+
+    def delete_model(self, request, obj):
+        """Drops the url of the deleted CRF from the visit's
+        navigation plan.
+        """
+        super().delete_model(request, obj)
+        if self.show_save_next:
+            try:
+                plan = self.get_navigation_plan(obj)
+            except (AttributeError, ObjectDoesNotExist):
+                pass
+            else:
+                plan.drop_urls(obj._meta.label_lower, getattr(obj, 'panel_name', None))
+                plan.save()
+
+    def get_navigation_plan(self, obj):
+        return NavigationPlan(
+            get_visit_key(obj), cache_alias=self.navigation_plan_cache)
 
+    def get_savenext_url_name(self, label_lower):
+        url_name = '_'.join(label_lower.split('.'))
+        return f'{self.admin_site.name}:{url_name}'
+
+    @instrument
     def get_savenext_redirect_url(self, request=None, obj=None):
         """Returns a redirect_url for the next form in the visit schedule.
 
         This method expects a CRF model with model mixins from edc_visit_tracking
         and edc_visit_schedule.
 
-        Requires edc_metadata. Queries Metadata models.
+        Requires edc_metadata. Queries Metadata models once per
+        form per visit; the next form and its url are kept in the
+        visit's NavigationPlan.
         """
         panel_name = None
         redirect_url = self.get_next_redirect_url(request=request)
-        getter = self.next_form_getter_cls()
-        next_form = getter.next_form(model_obj=obj)
+        plan = self.get_navigation_plan(obj)
+        current = (obj._meta.label_lower, getattr(obj, 'panel_name', None))
+        try:
+            next_form = plan.next_forms[current]
+        except KeyError:
+            next_form = self.get_next_form(obj)
+            plan.set_next_form(current, next_form)
         if next_form:
+            model, panel_name = next_form
+            url_key = (self.admin_site.name, model, panel_name)
             try:
-                panel_name = next_form.panel.name
-            except AttributeError:
-                panel_name = None
-            next_model_cls = django_apps.get_model(next_form.model)
-            url_name = '_'.join(
-                next_model_cls._meta.label_lower.split('.'))
-            url_name = f'{self.admin_site.name}:{url_name}'
-            opts = {obj.visit_model_attr(): obj.visit}
-            if panel_name:
-                opts.update(panel_name=panel_name)
-            try:
-                next_obj = next_model_cls.objects.get(**opts)
-            except ObjectDoesNotExist:
-                redirect_url = reverse(f'{url_name}_add')
-            else:
-                redirect_url = reverse(
-                    f'{url_name}_change', args=(next_obj.id, ))
-        next_querystring = request.GET.dict().get(self.next_querystring_attr)
+                redirect_url = plan.urls[url_key]
+            except KeyError:
+                redirect_url = self.get_next_form_url(obj, model, panel_name)
+                plan.set_url(url_key, redirect_url)
+        plan.save()
+        next_querystring = self.get_next_url(request).value
         options = self.get_next_options(request=request)
         if panel_name:
             options.update(panel_name=panel_name)
@@ -146,11 +198,41 @@ class ModelAdminNextUrlRedirectMixin(BaseModelAdminRedirectMixin):
         querystring = urlencode(options)
         return f'{redirect_url}?{self.next_querystring_attr}={next_querystring}&{querystring}'
 
+    def get_next_form(self, obj):
+        """Returns the next (model, panel_name) or None from
+        `next_form_getter_cls`.
+        """
+        getter = self.next_form_getter_cls()
+        next_form = getter.next_form(model_obj=obj)
+        if not next_form:
+            return None
+        try:
+            panel_name = next_form.panel.name
+        except AttributeError:
+            panel_name = None
+        return (django_apps.get_model(next_form.model)._meta.label_lower,
+                panel_name)
+
+    def get_next_form_url(self, obj, model, panel_name=None):
+        """Returns the change url of the next form for this visit,
+        if it exists, otherwise the add url.
+        """
+        next_model_cls = django_apps.get_model(model)
+        url_name = self.get_savenext_url_name(model)
+        opts = {obj.visit_model_attr(): obj.visit}
+        if panel_name:
+            opts.update(panel_name=panel_name)
+        try:
+            next_obj = next_model_cls.objects.get(**opts)
+        except ObjectDoesNotExist:
+            redirect_url = reverse(f'{url_name}_add')
+        else:
+            redirect_url = reverse(
+                f'{url_name}_change', args=(next_obj.id, ))
+        return redirect_url
+
     def get_next_options(self, request=None):
         """Returns the key/value pairs from the "next" querystring
         as a dictionary.
         """
-        attrs = request.GET.dict().get(
-            self.next_querystring_attr).split(',')[1:]
-        return {k: request.GET.dict().get(k)
-                for k in attrs if request.GET.dict().get(k)}
+        return dict(self.get_next_url(request).kwargs)
@@ -1,5 +1,30 @@
+import hashlib
+
+from django.contrib import messages
+from django.contrib.admin.utils import flatten_fieldsets, unquote
 from django.contrib.admin.widgets import AdminDateWidget
 from django.forms.widgets import DateInput
+from django.urls import NoReverseMatch
+from django.utils import timezone, translation
+
+from .instrumentation import instrument
+from .next_url import NextUrl
+from .readonly_view_cache import ReadOnlyViewCache
+from .utils import copy_declared_fields
+
+# read-only form classes keyed on get_readonly_form_key()
+_readonly_forms = {}
+
+
+def clear_readonly_form_cache(admin_cls=None):
+    """Clears read-only form classes for `admin_cls` or for all
+    admin classes.
+    """
+    if admin_cls is None:
+        _readonly_forms.clear()
+    else:
+        for key in [key for key in _readonly_forms if key[0] is admin_cls]:
+            del _readonly_forms[key]
 
 
 class ModelAdminReadOnlyMixin:
@@ -23,32 +48,167 @@ class ModelAdminReadOnlyMixin:
             {% endif %}
             {% endblock %}
 
-        to the admin url querystring add "next" and "edc_readonly=1"
+        to the admin url querystring add "next" and "edc_readonly=1".
+        `edc_readonly_next` is the reversed "next" url or, if it does
+        not reverse, the "next" value as is.
+
+    The read-only form class is built once per process for each
+    distinct `get_readonly_form_key` and reused. Extend the key if
+    the form class depends on anything else in the request, e.g. a
+    `formfield_for_foreignkey` that filters by user, or set
+    `cache_readonly_form = False`.
 
+    Set `cache_readonly_view = True` to also keep the rendered
+    read-only change view in the `readonly_view_cache` cache. A repeat
+    view then costs the object query and the permission checks; the
+    form and template are not rebuilt. The key is that of
+    `get_readonly_view_key`, i.e. admin, pk, `modified`, language,
+    timezone, path and user/permissions. Views are invalidated by
+    `save_model` and `delete_model`. Changes that do not go through
+    this admin and leave `modified` as is, e.g. inlines edited
+    elsewhere, show after `readonly_view_cache_timeout`.
     """
 
+    cache_readonly_form = True
+    cache_readonly_view = False
+    readonly_view_cache = 'default'
+    readonly_view_cache_timeout = 60 * 60
+
+    @instrument
     def get_form(self, request, obj=None, **kwargs):
-        form = super(ModelAdminReadOnlyMixin, self).get_form(
-            request, obj, **kwargs)
-        if request.GET.get('edc_readonly'):
-            for form_field in form.base_fields.values():
-                form_field.disabled = True
-                try:
-                    form_field.widget.can_add_related = False
-                    form_field.widget.can_change_related = False
-                    form_field.widget.can_delete_related = False
-                except AttributeError:
-                    pass
-                if isinstance(form_field.widget, AdminDateWidget):
-                    form_field.widget = DateInput()
+        if not request.GET.get('edc_readonly'):
+            return super(ModelAdminReadOnlyMixin, self).get_form(
+                request, obj, **kwargs)
+        key = None
+        if self.cache_readonly_form:
+            key = self.get_readonly_form_key(request, obj, **kwargs)
+        form = _readonly_forms.get(key) if key else None
+        if form is None:
+            form = self.readonly_form(
+                super(ModelAdminReadOnlyMixin, self).get_form(
+                    request, obj, **kwargs))
+            if key:
+                _readonly_forms[key] = form
         return form
 
+    def get_readonly_form_key(self, request, obj=None, **kwargs):
+        """Returns a hashable key for everything the read-only form
+        class depends on or None to not cache.
+        """
+        if 'fields' in kwargs:
+            fields = kwargs['fields']
+        else:
+            fields = flatten_fieldsets(self.get_fieldsets(request, obj))
+        can_change = None
+        if obj is not None and hasattr(request, 'user'):
+            can_change = self.has_change_permission(request, obj)
+        key = (self.__class__,
+               tuple(fields) if fields is not None else None,
+               tuple(self.get_readonly_fields(request, obj)),
+               obj is not None, can_change, translation.get_language(),
+               tuple(sorted((k, v) for k, v in kwargs.items() if k != 'fields')))
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+        return key
+
+    def readonly_form(self, form):
+        """Returns the form class with all fields disabled.
+        """
+        copy_declared_fields(form)
+        for form_field in form.base_fields.values():
+            form_field.disabled = True
+            try:
+                form_field.widget.can_add_related = False
+                form_field.widget.can_change_related = False
+                form_field.widget.can_delete_related = False
+            except AttributeError:
+                pass
+            if isinstance(form_field.widget, AdminDateWidget):
+                form_field.widget = DateInput()
+        return form
+
+    @instrument
     def change_view(self, request, object_id, form_url='', extra_context=None):
         extra_context = extra_context or {}
         if request.GET.get('edc_readonly'):
             extra_context.update(
                 {'edc_readonly': request.GET.get('edc_readonly')})
             extra_context.update(
-                {'edc_readonly_next': request.GET.get(self.next_querystring_attr)})
+                {'edc_readonly_next': self.get_readonly_next(request)})
+            if self.cache_readonly_view and request.method == 'GET':
+                return self.readonly_change_view(
+                    request, object_id, form_url, extra_context)
         return super().change_view(
             request, object_id, form_url=form_url, extra_context=extra_context)
+
+    def readonly_change_view(self, request, object_id, form_url, extra_context):
+        """Returns the cached rendered change view or renders and
+        caches it.
+        """
+        view_cache = self.get_readonly_view_cache()
+        key = self.get_readonly_view_key(request, object_id, view_cache)
+        response = view_cache.get(request, key) if key else None
+        if response is None:
+            response = super().change_view(
+                request, object_id, form_url=form_url, extra_context=extra_context)
+            if key and response.status_code == 200 and hasattr(response, 'render'):
+                view_cache.set(key, response.render().content)
+        return response
+
+    def get_readonly_view_cache(self):
+        return ReadOnlyViewCache(
+            self.model, self.readonly_view_cache, self.readonly_view_cache_timeout)
+
+    def get_readonly_view_key(self, request, object_id, view_cache):
+        """Returns a key for everything the rendered read-only view
+        depends on or None to not cache.
+
+        Not cached if the object is not found, the user may not view
+        it or there are messages to show.
+        """
+        if len(messages.get_messages(request)):
+            return None
+        obj = self.get_object(request, unquote(object_id))
+        if obj is None:
+            return None
+        can_change = self.has_change_permission(request, obj)
+        can_view = can_change
+        if hasattr(self, 'has_view_permission'):
+            can_view = self.has_view_permission(request, obj)
+        if not (can_change or can_view):
+            return None
+        # the inlines depend on permissions on other models
+        permissions = (self.has_add_permission(request), can_change,
+                       self.has_delete_permission(request, obj), can_view,
+                       request.user.is_superuser,
+                       sorted(request.user.get_all_permissions()))
+        key = (self.admin_site.name, self.model._meta.label_lower,
+               f'{self.__class__.__module__}.{self.__class__.__qualname__}',
+               str(obj.pk), str(getattr(obj, 'modified', None)),
+               view_cache.generation(obj.pk),
+               translation.get_language(), timezone.get_current_timezone_name(),
+               request.get_full_path(), request.user.pk, permissions)
+        return hashlib.md5(repr(key).encode('utf-8')).hexdigest()
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change and self.cache_readonly_view:
+            self.get_readonly_view_cache().invalidate(obj.pk)
+
+    def delete_model(self, request, obj):
+        pk = obj.pk
+        super().delete_model(request, obj)
+        if self.cache_readonly_view:
+            self.get_readonly_view_cache().invalidate(pk)
+
+    def get_readonly_next(self, request):
+        next_url = NextUrl.from_request(
+            request, attr=getattr(self, 'next_querystring_attr', None))
+        if not next_url:
+            return None
+        try:
+            return next_url.url
+        except NoReverseMatch:
+            return next_url.value
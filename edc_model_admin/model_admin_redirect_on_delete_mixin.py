@@ -1,18 +1,44 @@
 from django.contrib import messages
+from django.contrib.admin.actions import delete_selected as django_delete_selected
+from django.db import transaction
 from django.http.response import HttpResponseRedirect
 from django.urls import reverse, NoReverseMatch
 from django.utils.encoding import force_str
 
+from .instrumentation import instrument
+
+
+def delete_selected(modeladmin, request, queryset):
+    """Django's delete_selected action redirecting to
+    `post_url_on_delete` after the rows are deleted.
+    """
+    response = django_delete_selected(modeladmin, request, queryset)
+    if response is None:
+        post_url_on_delete = modeladmin.get_post_url_on_delete(request)
+        if post_url_on_delete:
+            return HttpResponseRedirect(post_url_on_delete)
+    return response
+
+
+delete_selected.short_description = django_delete_selected.short_description
+delete_selected.allowed_permissions = getattr(
+    django_delete_selected, 'allowed_permissions', ())
+
 
 class ModelAdminRedirectOnDeleteMixin:
 
     """A mixin to redirect on delete.
+
+    The reversed post_url is kept on the request, not on the
+    ModelAdmin instance.
+
+    The delete_selected action deletes the rows in chunks of
+    `delete_chunk_size` in one transaction and redirects to the
+    post_url reversed once for the first row.
     """
     post_url_on_delete_name = None
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.post_url_on_delete = None
+    post_url_on_delete_attr = 'edc_post_url_on_delete'
+    delete_chunk_size = 1000
 
     def post_url_on_delete_kwargs(self, request, obj):
         """Returns kwargs needed to reverse the post_url,
@@ -22,8 +48,8 @@ class ModelAdminRedirectOnDeleteMixin:
         """
         return {}
 
-    def delete_model(self, request, obj):
-        """Overridden to intercept the obj to reverse the post_url
+    def set_post_url_on_delete(self, request, obj):
+        """Reverses the post_url for `obj` and keeps it on the request
         if `post_url_on_delete_name` is not None.
         """
         if self.post_url_on_delete_name:
@@ -36,19 +62,59 @@ class ModelAdminRedirectOnDeleteMixin:
                 self.post_url_on_delete_name) or self.post_url_on_delete_name
             kwargs = self.post_url_on_delete_kwargs(request, obj)
             try:
-                self.post_url_on_delete = reverse(url_name, kwargs=kwargs)
+                setattr(request, self.post_url_on_delete_attr,
+                        reverse(url_name, kwargs=kwargs))
             except NoReverseMatch:
                 pass
+
+    @instrument
+    def delete_model(self, request, obj):
+        """Overridden to intercept the obj to reverse the post_url
+        if `post_url_on_delete_name` is not None.
+        """
+        self.set_post_url_on_delete(request, obj)
         obj.delete()
 
+    @instrument
+    def delete_queryset(self, request, queryset):
+        """Deletes the rows of `queryset` in chunks in one
+        transaction.
+
+        The post_url is reversed once, for the first row.
+        """
+        obj = queryset.first()
+        if obj is not None:
+            self.set_post_url_on_delete(request, obj)
+        pks = list(queryset.order_by().values_list('pk', flat=True))
+        manager = self.model._default_manager
+        with transaction.atomic():
+            for index in range(0, len(pks), self.delete_chunk_size):
+                manager.filter(
+                    pk__in=pks[index:index + self.delete_chunk_size]).delete()
+
+    def get_actions(self, request):
+        actions = super().get_actions(request)
+        if 'delete_selected' in actions:
+            actions['delete_selected'] = (
+                delete_selected, 'delete_selected', actions['delete_selected'][2])
+        return actions
+
+    def get_post_url_on_delete(self, request):
+        """Returns the post_url reversed in `delete_model` for this
+        request or None.
+        """
+        return getattr(request, self.post_url_on_delete_attr, None)
+
+    @instrument
     def response_delete(self, request, obj_display, obj_id):
         """Overridden to redirect to `post_url_on_delete`, if not None.
         """
-        if self.post_url_on_delete:
+        post_url_on_delete = self.get_post_url_on_delete(request)
+        if post_url_on_delete:
             opts = self.model._meta
             msg = ('The %(name)s "%(obj)s" was deleted successfully.') % {
                 'name': force_str(opts.verbose_name),
                 'obj': force_str(obj_display)}
             messages.add_message(request, messages.SUCCESS, msg)
-            return HttpResponseRedirect(self.post_url_on_delete)
+            return HttpResponseRedirect(post_url_on_delete)
         return super().response_delete(request, obj_display, obj_id)
@@ -1,16 +1,15 @@
-from django.utils.safestring import mark_safe
+from .model_admin_label_pipeline_mixin import LabelPipeline, ModelAdminLabelPipelineMixin
 
 
-class ModelAdminReplaceLabelTextMixin:
+class ModelAdminReplaceLabelTextMixin(ModelAdminLabelPipelineMixin):
+
+    """Replaces text in form field labels.
+
+    Declare `replace_label_text_rules` as a list of (old, new) or
+    (old, new, skip_fields) to have them compiled with the other
+    label rules, or call `replace_label_text` on a form class.
+    """
 
     def replace_label_text(self, form=None, old=None, new=None, skip_fields=None):
-        NAME = 0
-        WIDGET = 1
-        skip_fields = skip_fields or []
-        for fld in form.base_fields.items():
-            if fld[NAME] not in skip_fields:
-                label = str(fld[WIDGET].label)
-                if old in label:
-                    label = label.replace(old, new)
-                    fld[WIDGET].label = mark_safe(label)
-        return form
+        pipeline = LabelPipeline(replacements=[(old, new, skip_fields)])
+        return pipeline.apply(form, pipeline.compile(form))
@@ -0,0 +1,56 @@
+from types import MappingProxyType
+
+from .instrumentation import instrument
+
+# read-only view context keyed on (admin class, view)
+_static_contexts = {}
+
+
+def clear_static_context_cache(admin_cls=None):
+    if admin_cls is None:
+        _static_contexts.clear()
+    else:
+        for key in [k for k in _static_contexts if k[0] is admin_cls]:
+            del _static_contexts[key]
+
+
+class ModelAdminStaticContextMixin:
+
+    """Merges the add/change view context that does not depend on
+    the request into one read-only mapping per admin class and view.
+
+    Mixins contribute by extending `get_static_context`. The
+    `extra_context` of a request is layered on top.
+    """
+
+    def get_static_context(self, view):
+        """Returns a dict of context for `view`, 'add' or 'change'.
+        """
+        return {}
+
+    def static_context(self, view):
+        key = (self.__class__, view)
+        try:
+            context = _static_contexts[key]
+        except KeyError:
+            context = _static_contexts[key] = MappingProxyType(
+                self.get_static_context(view))
+        return context
+
+    def layer_static_context(self, view, extra_context=None):
+        context = dict(self.static_context(view))
+        if extra_context:
+            context.update(extra_context)
+        return context
+
+    @instrument
+    def add_view(self, request, form_url='', extra_context=None):
+        extra_context = self.layer_static_context('add', extra_context)
+        return super().add_view(
+            request, form_url=form_url, extra_context=extra_context)
+
+    @instrument
+    def change_view(self, request, object_id, form_url='', extra_context=None):
+        extra_context = self.layer_static_context('change', extra_context)
+        return super().change_view(
+            request, object_id, form_url=form_url, extra_context=extra_context)
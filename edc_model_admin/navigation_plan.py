@@ -0,0 +1,111 @@
+from django.core.cache import caches
+from django.core.exceptions import ObjectDoesNotExist
+
+
+def get_visit_key(obj):
+    """Returns (subject_identifier, visit_code, visit_code_sequence)
+    for a CRF, a visit or a metadata instance.
+    """
+    visit = getattr(obj, 'visit', obj)
+    return (visit.subject_identifier, visit.visit_code,
+            getattr(visit, 'visit_code_sequence', 0) or 0)
+
+
+class NavigationPlan:
+
+    """Save-next navigation for a visit kept in the Django cache.
+
+    `next_forms` maps (model, panel_name) to the next
+    (model, panel_name) or None and depends on metadata. `urls` maps
+    (admin site, model, panel_name) to the add or change url and
+    depends on which CRFs exist for the visit.
+
+    Clear the plan when metadata for the visit changes, see
+    `clear_navigation_plan`. The url of a CRF is dropped when a CRF
+    is added or deleted anywhere, see `drop_crf_url`.
+    """
+
+    cache_alias = 'default'
+    timeout = 60 * 60 * 12
+
+    def __init__(self, visit_key, cache_alias=None):
+        self.cache = caches[cache_alias or self.cache_alias]
+        self.key = 'edc_model_admin.navigation_plan.{}.{}.{}'.format(*visit_key)
+        data = self.cache.get(self.key) or {}
+        self.next_forms = data.get('next_forms', {})
+        self.urls = data.get('urls', {})
+        self.changed = False
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.key})'
+
+    def set_next_form(self, current, next_form):
+        self.next_forms[current] = next_form
+        self.changed = True
+
+    def set_url(self, key, url):
+        if self.urls.get(key) != url:
+            self.urls[key] = url
+            self.changed = True
+
+    def drop_urls(self, label_lower, panel_name=None):
+        """Drops the urls of model `label_lower` and `panel_name`
+        on any admin site.
+        """
+        for key in [key for key in self.urls
+                    if key[1:] == (label_lower, panel_name)]:
+            del self.urls[key]
+            self.changed = True
+
+    def clear_next_forms(self):
+        self.next_forms = {}
+        self.changed = True
+
+    def clear(self):
+        self.next_forms = {}
+        self.urls = {}
+        self.changed = True
+
+    def save(self):
+        if self.changed:
+            self.cache.set(
+                self.key, dict(next_forms=self.next_forms, urls=self.urls),
+                self.timeout)
+            self.changed = False
+
+
+def clear_navigation_plan(sender=None, instance=None, cache_alias=None, **kwargs):
+    """Clears the next forms and urls of the visit's navigation plan.
+
+    Connect as a post_save/post_delete receiver to the metadata
+    models, e.g. edc_metadata's CrfMetadata and RequisitionMetadata.
+    """
+    try:
+        visit_key = get_visit_key(instance)
+    except (AttributeError, ObjectDoesNotExist):
+        pass
+    else:
+        plan = NavigationPlan(visit_key, cache_alias=cache_alias)
+        plan.clear()
+        plan.save()
+
+
+def drop_crf_url(sender=None, instance=None, created=True, cache_alias=None, **kwargs):
+    """Drops the url of a CRF from its visit's navigation plan when
+    the CRF is added or deleted, the cached url being the add or
+    the change url.
+
+    Connected by AppConfig.ready to the post_save and post_delete of
+    models with `visit_model_attr`.
+    """
+    if not created:
+        return
+    try:
+        visit_key = get_visit_key(instance)
+    except (AttributeError, ObjectDoesNotExist):
+        pass
+    else:
+        plan = NavigationPlan(visit_key, cache_alias=cache_alias)
+        plan.drop_urls(
+            instance._meta.label_lower, getattr(instance, 'panel_name', None))
+        plan.save()
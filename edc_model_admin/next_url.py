@@ -0,0 +1,138 @@
+from django.urls import get_resolver, get_urlconf, reverse, NoReverseMatch
+
+from .utils import LRUCache
+
+KWARGS = 'kwargs'
+NO_KWARGS = 'no_kwargs'
+UNRESOLVABLE = 'unresolvable'
+
+
+def url_patterns(url_name, urlconf=None):
+    """Returns the reverse_dict entries of `url_name`, with or
+    without namespaces, or None if it is not in the resolver.
+    """
+    *namespaces, name = url_name.split(':')
+    resolver = get_resolver(urlconf)
+    for namespace in namespaces:
+        try:
+            resolver = resolver.namespace_dict[namespace][1]
+        except KeyError:
+            try:
+                instance = resolver.app_dict[namespace][0]
+                resolver = resolver.namespace_dict[instance][1]
+            except (KeyError, IndexError):
+                return None
+    if name not in resolver.reverse_dict:
+        return None
+    return resolver.reverse_dict.getlist(name)
+
+
+def takes_kwargs(patterns, names):
+    """Returns True if one of `patterns` reverses with kwargs
+    `names`, regardless of their values.
+    """
+    names = set(names)
+    for possibilities, pattern, defaults, *_ in patterns:
+        for result, params in possibilities:
+            if not names.symmetric_difference(params).difference(defaults):
+                return True
+    return False
+
+
+class ReverseCache(LRUCache):
+
+    """An LRU of how a (url_name, kwargs names) pair reverses.
+
+    Stores (KWARGS, None, no_args) if a pattern of url_name takes the
+    kwargs names, where no_args is True if another takes no
+    arguments, (NO_KWARGS, None, True) if none does and
+    (UNRESOLVABLE, error, False) if url_name is not in the resolver.
+    Only the url_name and kwargs names decide, never the kwargs
+    values, so a value that does not match a pattern falls back to
+    the no argument pattern, or raises, for that request only.
+    """
+
+
+reverse_cache = ReverseCache()
+
+
+class NextUrl:
+
+    """The "next" querystring value parsed once per request.
+
+    In your url &next=my_url_name,arg1,arg2&arg1=value1&arg2=value2,
+    `url_name` is my_url_name and `kwargs` those of arg1, arg2 with
+    a value in the querystring.
+    """
+
+    def __init__(self, value, query=None):
+        self.value = value
+        url_name, *names = value.split(',')
+        self.url_name = url_name
+        query = query or {}
+        self.kwargs = {k: query.get(k) for k in names if query.get(k)}
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.value})'
+
+    @classmethod
+    def from_request(cls, request, attr=None):
+        """Returns the NextUrl for the querystring `attr` or None.
+
+        Parsed once and kept on the request.
+        """
+        attr = attr or 'next'
+        next_urls = getattr(request, 'edc_next_urls', None)
+        if next_urls is None:
+            next_urls = {}
+            request.edc_next_urls = next_urls
+        try:
+            next_url = next_urls[attr]
+        except KeyError:
+            query = request.GET.dict()
+            value = query.get(attr)
+            next_url = next_urls[attr] = cls(value, query) if value else None
+        return next_url
+
+    @property
+    def url(self):
+        """Returns the reversed url, reversed without the kwargs if
+        they do not match and url_name also takes no arguments.
+
+        Raises NoReverseMatch.
+        """
+        state, error, no_args = self.reverses()
+        if state == UNRESOLVABLE:
+            raise NoReverseMatch(self.error_message(error))
+        try:
+            if state == KWARGS:
+                try:
+                    return reverse(self.url_name, kwargs=self.kwargs)
+                except NoReverseMatch:
+                    if not no_args:
+                        raise
+            return reverse(self.url_name)
+        except NoReverseMatch as e:
+            raise NoReverseMatch(self.error_message(e))
+
+    def reverses(self):
+        """Returns the cached (state, error, no_args) of url_name and
+        the kwargs names, see ReverseCache.
+        """
+        urlconf = get_urlconf()
+        key = (self.url_name, tuple(sorted(self.kwargs)), urlconf)
+        cached = reverse_cache.get(key)
+        if cached is None:
+            patterns = url_patterns(self.url_name, urlconf)
+            if patterns is None:
+                cached = (UNRESOLVABLE,
+                          f'\'{self.url_name}\' is not a valid url name', False)
+            elif takes_kwargs(patterns, self.kwargs):
+                cached = (KWARGS, None, takes_kwargs(patterns, []))
+            else:
+                cached = (NO_KWARGS, None, True)
+            reverse_cache.set(key, cached)
+        return cached
+
+    def error_message(self, error):
+        return f'{error}. Got url_name={self.url_name}, kwargs={self.kwargs}.'
@@ -0,0 +1,61 @@
+import re
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from uuid import uuid4
+
+CACHE_KEY = 'edc_model_admin.readonly_view'
+
+CSRF_INPUT = re.compile(r'(name="csrfmiddlewaretoken" value=")[^"]*(")')
+
+
+class ReadOnlyViewCache:
+
+    """Rendered read-only change views of a model kept in the Django
+    cache.
+
+    Views of an instance are stored under the instance's current
+    generation; `invalidate` starts a new generation so earlier views
+    are no longer found and expire. The CSRF token is removed before
+    storing and the requesting user's token put back on `get`.
+    """
+
+    cache_alias = 'default'
+    timeout = 60 * 60
+
+    def __init__(self, model, cache_alias=None, timeout=None):
+        self.label_lower = model._meta.label_lower
+        self.cache = caches[cache_alias or self.cache_alias]
+        if timeout is not None:
+            self.timeout = timeout
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.label_lower})'
+
+    def generation_key(self, pk):
+        return f'{CACHE_KEY}.{self.label_lower}.{pk}'
+
+    def generation(self, pk):
+        key = self.generation_key(pk)
+        generation = uuid4().hex
+        if not self.cache.add(key, generation, self.timeout):
+            generation = self.cache.get(key) or generation
+        return generation
+
+    def invalidate(self, pk):
+        self.cache.delete(self.generation_key(pk))
+
+    def get(self, request, key):
+        content = self.cache.get(f'{CACHE_KEY}.{key}')
+        if content is None:
+            return None
+        token = get_token(request)
+        return HttpResponse(CSRF_INPUT.sub(
+            lambda m: f'{m.group(1)}{token}{m.group(2)}', content))
+
+    def set(self, key, content):
+        if isinstance(content, bytes):
+            content = content.decode('utf-8')
+        self.cache.set(
+            f'{CACHE_KEY}.{key}', CSRF_INPUT.sub(r'\1\2', content), self.timeout)
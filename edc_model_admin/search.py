@@ -0,0 +1,316 @@
+"""Search strategies for ModelAdminBasicMixin.
+
+The Django admin searches every search field with `icontains`,
+i.e. a table scan per term. `Search` instead picks a strategy from
+the shape of the search term:
+
+    identifier: a single term with a digit and no spaces, e.g.
+        066-12345678-9, is looked up on the fields declared in
+        `search_strategies` only, with `exact` or `startswith` so
+        an index on the column is used. The lookups are case
+        sensitive; for a column stored in one case append `:upper`
+        or `:lower` to the strategy, e.g. 'prefix:upper', to convert
+        the term instead. On PostgreSQL 'prefix' needs a
+        varchar_pattern_ops index unless the database collation is
+        C.
+    fulltext: any other term, if `search_fulltext` is a backend and
+        its index exists, see `FullTextBackend.exists`.
+    tokenized: otherwise each term, or "quoted phrase", must match
+        one of the search fields, identifier fields with their
+        strategy and the others as the Django admin does.
+"""
+import re
+
+from django.contrib.admin.utils import lookup_needs_distinct
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections, router
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+from django.utils.text import smart_split, unescape_string_literal
+
+IDENTIFIER = 'identifier'
+FULLTEXT = 'fulltext'
+TOKENIZED = 'tokenized'
+
+# search_strategies values, `strategy` or `strategy:case`, and
+# their lookup and term conversion
+strategy_lookups = {'exact': 'exact', 'prefix': 'startswith'}
+strategy_cases = {'upper': str.upper, 'lower': str.lower}
+
+# Django admin search_fields prefixes and their lookup
+prefix_lookups = {'^': 'istartswith', '=': 'iexact', '@': 'search'}
+
+
+def split_terms(search_term):
+    """Returns the terms of `search_term` split on whitespace with
+    quoted phrases kept together and unquoted.
+    """
+    terms = []
+    for term in smart_split(search_term):
+        if len(term) > 1 and term[0] in '"\'' and term[0] == term[-1]:
+            term = unescape_string_literal(term)
+        if term:
+            terms.append(term)
+    return terms
+
+
+def parse_strategy(value):
+    """Returns (lookup, convert) for a search_strategies value.
+
+    Raises ValueError.
+    """
+    strategy, _, case = value.partition(':')
+    try:
+        return strategy_lookups[strategy], strategy_cases[case] if case else None
+    except KeyError:
+        raise ValueError(
+            f'Expected one of {list(strategy_lookups)}, optionally with '
+            f'one of {[":" + case for case in strategy_cases]}. Got {value}.')
+
+
+class Search:
+
+    """Filters a queryset by a search term on `search_fields`.
+
+    `strategies` is a dict of {field_name: 'exact' | 'prefix'}, see
+    `parse_strategy`, for identifier-like fields and `fulltext` an optional
+    FullTextBackend.
+    """
+
+    identifier_pattern = re.compile(r'^[\w/.-]*\d[\w/.-]*$')
+
+    def __init__(self, model, search_fields, strategies=None, fulltext=None):
+        self.model = model
+        self.search_fields = list(search_fields or [])
+        self.strategies = strategies or {}
+        self.fulltext = fulltext
+        self.identifier_fields = [
+            field_name for field_name in self.search_fields
+            if field_name in self.strategies]
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.model._meta.label_lower})'
+
+    def get_strategy(self, terms, using=None):
+        if (len(terms) == 1 and self.identifier_fields
+                and self.identifier_pattern.match(terms[0])):
+            return IDENTIFIER
+        elif self.fulltext and self.fulltext.exists(self.model, using=using):
+            return FULLTEXT
+        return TOKENIZED
+
+    def get_lookup(self, field_name):
+        """Returns (lookup, convert) where convert is a function
+        applied to the term or None.
+        """
+        if field_name in self.strategies:
+            lookup, convert = parse_strategy(self.strategies[field_name])
+            return f'{field_name}__{lookup}', convert
+        elif field_name[0] in prefix_lookups:
+            return f'{field_name[1:]}__{prefix_lookups[field_name[0]]}', None
+        return f'{field_name}__icontains', None
+
+    def filter(self, queryset, search_term):
+        """Returns (queryset, use_distinct) as
+        ModelAdmin.get_search_results.
+        """
+        terms = split_terms(search_term)
+        if not terms:
+            return queryset, False
+        strategy = self.get_strategy(terms, using=queryset.db)
+        if strategy == FULLTEXT:
+            return self.fulltext.filter(queryset, terms), False
+        elif strategy == IDENTIFIER:
+            lookups = [self.get_lookup(f) for f in self.identifier_fields]
+        else:
+            lookups = [self.get_lookup(f) for f in self.search_fields]
+        for term in terms:
+            q = Q()
+            for lookup, convert in lookups:
+                q |= Q(**{lookup: convert(term) if convert else term})
+            queryset = queryset.filter(q)
+        use_distinct = any(
+            lookup_needs_distinct(self.model._meta, lookup) for lookup, _ in lookups)
+        return queryset, use_distinct
+
+
+class FullTextBackend:
+
+    """A full-text search backend for `fields` of a model.
+    """
+
+    def __init__(self, fields):
+        self.fields = list(fields)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.fields})'
+
+    def filter(self, queryset, terms):
+        """Returns `queryset` filtered to rows that match all
+        `terms`.
+        """
+        raise NotImplementedError()
+
+    def connect(self, model):
+        """Connects what keeps the index of `model` up to date.
+        """
+        pass
+
+    def disconnect(self, model):
+        pass
+
+    def exists(self, model, using=None):
+        """Returns True if the index of `model` can be searched.
+        """
+        return True
+
+    def rebuild(self, model):
+        """Indexes all rows of `model`. Returns the number of rows.
+        """
+        return 0
+
+
+class SqliteFTS5Backend(FullTextBackend):
+
+    """Searches an SQLite FTS5 table, by default `<db_table>_fts`,
+    kept up to date on post_save and post_delete.
+
+    The table is created, and rows saved before the backend was
+    declared are indexed, by `rebuild` or the
+    `edc_model_admin_search_index` command. Until then saves are not
+    indexed and searches fall back to the tokenized strategy. Each
+    term is a prefix query.
+    """
+
+    def __init__(self, fields, table=None):
+        super().__init__(fields)
+        self.table = table
+
+    def get_table(self, model):
+        return self.table or f'{model._meta.db_table}_fts'
+
+    def create_table(self, model, cursor, connection):
+        qn = connection.ops.quote_name
+        columns = ', '.join(qn(f) for f in self.fields)
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {qn(self.get_table(model))} '
+            f'USING fts5(pk UNINDEXED, {columns})')
+
+    def table_exists(self, model, cursor):
+        cursor.execute(
+            'SELECT 1 FROM sqlite_master WHERE type = %s AND name = %s',
+            ['table', self.get_table(model)])
+        return cursor.fetchone() is not None
+
+    def exists(self, model, using=None):
+        connection = connections[using or router.db_for_read(model)]
+        with connection.cursor() as cursor:
+            return self.table_exists(model, cursor)
+
+    def filter(self, queryset, terms):
+        connection = connections[queryset.db]
+        table = connection.ops.quote_name(self.get_table(queryset.model))
+        match = ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+        return queryset.filter(pk__in=RawSQL(
+            f'SELECT pk FROM {table} WHERE {table} MATCH %s', [match]))
+
+    def connect(self, model):
+        uid = f'edc_model_admin.search.{self.get_table(model)}'
+        post_save.connect(self.post_save, sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(self.post_delete, sender=model, weak=False, dispatch_uid=uid)
+
+    def disconnect(self, model):
+        uid = f'edc_model_admin.search.{self.get_table(model)}'
+        post_save.disconnect(sender=model, dispatch_uid=uid)
+        post_delete.disconnect(sender=model, dispatch_uid=uid)
+
+    def post_save(self, sender, instance, raw=False, using=None, **kwargs):
+        if not raw:
+            self.index(instance, using=using)
+
+    def post_delete(self, sender, instance, using=None, **kwargs):
+        self.index(instance, using=using, delete=True)
+
+    def index(self, instance, using=None, delete=False):
+        model = instance.__class__
+        connection = connections[using or router.db_for_write(model)]
+        table = connection.ops.quote_name(self.get_table(model))
+        pk = model._meta.pk.get_db_prep_value(instance.pk, connection)
+        with connection.cursor() as cursor:
+            if not self.table_exists(model, cursor):
+                return
+            cursor.execute(f'DELETE FROM {table} WHERE pk = %s', [pk])
+            if not delete:
+                self.insert(cursor, connection, table, [instance])
+
+    def insert(self, cursor, connection, table, instances):
+        pk_field = instances[0]._meta.pk
+        columns = ', '.join(connection.ops.quote_name(f) for f in self.fields)
+        placeholders = ', '.join(['%s'] * (len(self.fields) + 1))
+        cursor.executemany(
+            f'INSERT INTO {table} (pk, {columns}) VALUES ({placeholders})',
+            [[pk_field.get_db_prep_value(obj.pk, connection)]
+             + [getattr(obj, f) for f in self.fields] for obj in instances])
+
+    def rebuild(self, model, chunk_size=1000):
+        connection = connections[router.db_for_write(model)]
+        table = connection.ops.quote_name(self.get_table(model))
+        count = 0
+        with connection.cursor() as cursor:
+            self.create_table(model, cursor, connection)
+            cursor.execute(f'DELETE FROM {table}')
+            instances = []
+            for obj in model._default_manager.only(*self.fields).iterator():
+                instances.append(obj)
+                if len(instances) == chunk_size:
+                    self.insert(cursor, connection, table, instances)
+                    count, instances = count + len(instances), []
+            if instances:
+                self.insert(cursor, connection, table, instances)
+                count += len(instances)
+        return count
+
+
+class PostgresFullTextBackend(FullTextBackend):
+
+    """Searches a SearchVector of `fields`, requires
+    django.contrib.postgres.
+
+    There is nothing to keep up to date. For large tables add a
+    GinIndex on the same SearchVector expression.
+    """
+
+    def __init__(self, fields, config='english'):
+        super().__init__(fields)
+        self.config = config
+
+    def filter(self, queryset, terms):
+        from django.contrib.postgres.search import SearchQuery, SearchVector
+        query = SearchQuery(terms[0], config=self.config)
+        for term in terms[1:]:
+            query &= SearchQuery(term, config=self.config)
+        return queryset.annotate(
+            edc_search=SearchVector(*self.fields, config=self.config)).filter(
+                edc_search=query)
+
+
+fulltext_backends = {
+    'sqlite': SqliteFTS5Backend,
+    'postgresql': PostgresFullTextBackend}
+
+
+def fulltext(fields, using=None, **options):
+    """Returns the full-text backend for the vendor of database
+    `using`.
+
+        search_fulltext = fulltext(['first_name', 'last_name'])
+    """
+    vendor = connections[using or DEFAULT_DB_ALIAS].vendor
+    try:
+        backend_cls = fulltext_backends[vendor]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f'No full-text search backend for {vendor}. '
+            f'Expected one of {list(fulltext_backends)}.')
+    return backend_cls(fields, **options)
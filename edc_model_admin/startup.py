@@ -0,0 +1,98 @@
+"""Warm-up of the admin mixins at server start.
+
+`warm_up` populates the url resolver and, for every admin
+registered on an AdminSite, compiles the layouts, static view
+context and redirect/button urls that are otherwise built by the
+first admin request. Call it from the project's wsgi.py, after
+get_wsgi_application(), so it runs when the server loads the
+application and not in management commands:
+
+    application = get_wsgi_application()
+    warm_up()
+
+With gunicorn --preload it runs once in the master before the
+workers fork.
+
+If it has not run, `warm_up_on_first_request` warms up on the
+first request of each process instead, which that request waits
+for. Set EDC_MODEL_ADMIN_WARM_UP = False to disable this fallback.
+
+Admins that fail are logged and skipped; the system checks in
+`checks.py` report the cause.
+"""
+import logging
+
+from django.core.signals import request_started
+from django.http import HttpRequest
+from django.urls import get_resolver, NoReverseMatch
+
+logger = logging.getLogger(__name__)
+
+state = {'warmed_up': False}
+
+
+def get_model_admins(sites=None):
+    from django.contrib.admin.sites import all_sites
+    for site in (all_sites if sites is None else sites):
+        for model_admin in site._registry.values():
+            yield model_admin
+
+
+def warm_up(sites=None):
+    """Compiles what the mixins would otherwise compile on the first
+    request. Returns the number of model admins warmed up.
+
+    Warms up the admins of `sites`, default all AdminSites.
+    """
+    try:
+        get_resolver().reverse_dict  # populates the resolver
+    except Exception as e:
+        logger.warning(f'Skipped warm up. Url resolver failed. Got {e}')
+        return 0
+    count = 0
+    request = HttpRequest()
+    for model_admin in get_model_admins(sites):
+        try:
+            warm_up_model_admin(model_admin, request)
+        except Exception as e:
+            logger.warning(f'Skipped warm up of {model_admin}. Got {e}')
+        else:
+            count += 1
+    if sites is None:
+        state['warmed_up'] = True
+    return count
+
+
+def warm_up_model_admin(model_admin, request):
+    from .changelist_buttons import ModelAdminChangelistModelButtonMixin
+    from .changelist_buttons.model_admin_changelist_button_mixin import PK_SLOTS
+    from .model_admin_basic_mixin import ModelAdminBasicMixin
+    from .model_admin_model_redirect_mixin import ModelAdminModelRedirectMixin
+    from .model_admin_static_context_mixin import ModelAdminStaticContextMixin
+    if isinstance(model_admin, ModelAdminBasicMixin):
+        model_admin.get_list_display(request)
+        model_admin.get_list_filter(request)
+        model_admin.get_search_fields(request)
+    if isinstance(model_admin, ModelAdminStaticContextMixin):
+        model_admin.static_context('add')
+        model_admin.static_context('change')
+    if isinstance(model_admin, ModelAdminModelRedirectMixin):
+        model_admin.redirect_url_on_delete(request, None, None)
+    if isinstance(model_admin, ModelAdminChangelistModelButtonMixin):
+        for options in model_admin.changelist_model_buttons.values():
+            app_label, model_name = options['model'].split('.')
+            try:
+                model_admin.button_url(
+                    f'admin:{app_label}_{model_name}_change', (PK_SLOTS[0], ))
+                model_admin.button_url(f'admin:{app_label}_{model_name}_add')
+            except NoReverseMatch:
+                pass
+
+
+def warm_up_on_first_request(sender=None, **kwargs):
+    """request_started receiver connected by AppConfig.ready, warms
+    up if `warm_up` has not run at server start.
+    """
+    request_started.disconnect(dispatch_uid='edc_model_admin.warm_up')
+    if not state['warmed_up']:
+        warm_up()
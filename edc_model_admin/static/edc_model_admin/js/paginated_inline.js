@@ -0,0 +1,55 @@
+/*global django */
+/* Fetches the next page of a PaginatedInlineMixin inline and
+ * inserts its rows after the rows already on the page. New, unsaved
+ * rows are renumbered after the inserted rows and INITIAL_FORMS and
+ * TOTAL_FORMS are updated so the posted formset stays valid.
+ */
+(function($) {
+    'use strict';
+
+    var renumber = function(el, prefix, shift) {
+        var re = new RegExp('^(id_)?(' + prefix + '-)(\\d+)(-|$)');
+        $.each(['id', 'name', 'for'], function(i, attr) {
+            var value = $(el).attr(attr);
+            if (value) {
+                $(el).attr(attr, value.replace(re, function(match, id, start, index, end) {
+                    return (id || '') + start + (parseInt(index, 10) + shift) + end;
+                }));
+            }
+        });
+    };
+
+    $(document).on('click', '.edc-inline-next-page', function(e) {
+        e.preventDefault();
+        var pager = $(this).closest('.edc-inline-pages');
+        var prefix = pager.data('prefix');
+        var initialForms = $('#id_' + prefix + '-INITIAL_FORMS');
+        var totalForms = $('#id_' + prefix + '-TOTAL_FORMS');
+        var start = parseInt(initialForms.val(), 10);
+        $.getJSON(pager.data('url'), {start: start}, function(data) {
+            var group = $('#' + prefix + '-group');
+            var selector = '.form-row.has_original, .inline-related.has_original';
+            var rows = $('<div>').html(data.html).find(selector).not('.empty-form');
+            var existing = group.find(selector).not('.empty-form');
+            group.find('.form-row, .inline-related').not(selector).not('.empty-form')
+                .each(function() {
+                    renumber(this, prefix, data.rows);
+                    $(this).find('*').each(function() {
+                        renumber(this, prefix, data.rows);
+                    });
+                });
+            rows.addClass('dynamic-' + prefix);
+            rows.insertAfter(existing.last());
+            rows.each(function() {
+                $(document).trigger('formset:added', [$(this), prefix]);
+            });
+            initialForms.val(start + data.rows);
+            totalForms.val(parseInt(totalForms.val(), 10) + data.rows);
+            if (data.remaining > 0) {
+                pager.find('.edc-inline-remaining').text(data.remaining);
+            } else {
+                pager.remove();
+            }
+        });
+    });
+})(django.jQuery);
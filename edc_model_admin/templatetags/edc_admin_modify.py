@@ -1,35 +1,60 @@
 from django import template
 from django.contrib.admin.templatetags.admin_modify import submit_row as django_submit_row
 
+from ..fragment_cache import render_fragment
+from ..instrumentation import instrument_tag
+
 register = template.Library()
 
 
-@register.inclusion_tag('edc_submit_line.html', takes_context=True)
+@register.simple_tag(takes_context=True)
+@instrument_tag
 def edc_submit_row(context):
     request = context.get('request')
-    if int(request.site.id) == int(context.get('reviewer_site_id')):
+    site_id = getattr(getattr(request, 'site', None), 'id', None)
+    reviewer_site_id = context.get('reviewer_site_id')
+    reviewer = (site_id is not None and reviewer_site_id is not None
+                and int(site_id) == int(reviewer_site_id))
+    if reviewer:
         context['show_save'] = False
         context['show_delete'] = False
         context['show_save_next'] = False
-    return django_submit_row(context)
-
-
-@register.inclusion_tag('edc_revision_line.html', takes_context=True)
+    submit_row = django_submit_row(context)
+    key = (site_id, reviewer,
+           bool(submit_row.get('show_save')),
+           bool(submit_row.get('show_delete_link')),
+           bool(submit_row.get('show_cancel')),
+           bool(submit_row.get('show_save_next')))
+    if submit_row.get('show_delete_link'):
+        # the delete url is per object
+        key += (submit_row['opts'].label_lower,
+                str(submit_row['original'].pk),
+                submit_row.get('preserved_filters'))
+    return render_fragment(context, 'edc_submit_line.html', submit_row, key=key)
+
+
+@register.simple_tag(takes_context=True)
+@instrument_tag
 def revision_row(context):
-    return dict(
+    return render_fragment(context, 'edc_revision_line.html', dict(
         copyright=context.get('copyright'),
         institution=context.get('institution'),
         revision=context.get('revision'),
-        disclaimer=context.get('disclaimer'))
+        disclaimer=context.get('disclaimer')))
 
 
-@register.inclusion_tag('edc_instructions.html', takes_context=True)
+@register.simple_tag(takes_context=True)
+@instrument_tag
 def instructions(context):
     instructions = context.get('instructions')
-    return {'instructions': instructions}
+    return render_fragment(
+        context, 'edc_instructions.html', {'instructions': instructions})
 
 
-@register.inclusion_tag('edc_additional_instructions.html', takes_context=True)
+@register.simple_tag(takes_context=True)
+@instrument_tag
 def additional_instructions(context):
     additional_instructions = context.get('additional_instructions')
-    return {'additional_instructions': additional_instructions}
+    return render_fragment(
+        context, 'edc_additional_instructions.html',
+        {'additional_instructions': additional_instructions})
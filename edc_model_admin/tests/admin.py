@@ -0,0 +1,24 @@
+from django.contrib import admin
+
+from ..inlines import ModelAdminPaginatedInlinesMixin, TabularInlineMixin
+from .models import TestModel, TestInlineModel, SubjectVisit, CrfOne, CrfTwo
+from .models import CrfModel10, CrfModel100, CrfModel150, CrfModel500
+
+
+class TestInlineModelInline(TabularInlineMixin, admin.TabularInline):
+
+    model = TestInlineModel
+    fk_name = 'test_model'
+    fields = ('f1', )
+    inline_per_page = 10
+
+
+@admin.register(TestModel)
+class TestModelAdmin(ModelAdminPaginatedInlinesMixin, admin.ModelAdmin):
+
+    inlines = [TestInlineModelInline]
+
+
+for model in [TestInlineModel, SubjectVisit, CrfOne, CrfTwo,
+              CrfModel10, CrfModel100, CrfModel150, CrfModel500]:
+    admin.site.register(model)
@@ -10,3 +10,78 @@ class TestModel(BaseUuidModel):
     f4 = models.CharField(max_length=10, null=True, blank=False)
     f5 = models.CharField(max_length=10)
     f5_other = models.CharField(max_length=10, null=True)
+
+
+class TestInlineModel(BaseUuidModel):
+
+    test_model = models.ForeignKey(TestModel, on_delete=models.PROTECT)
+
+    related_model = models.ForeignKey(
+        TestModel, on_delete=models.PROTECT, related_name='+', null=True)
+
+    f1 = models.CharField(max_length=10, null=True)
+
+
+class SubjectVisit(BaseUuidModel):
+
+    subject_identifier = models.CharField(max_length=25)
+
+    visit_code = models.CharField(max_length=25)
+
+    visit_code_sequence = models.IntegerField(default=0)
+
+
+class CrfModelMixin(models.Model):
+
+    subject_visit = models.ForeignKey(SubjectVisit, on_delete=models.PROTECT)
+
+    @property
+    def visit(self):
+        return self.subject_visit
+
+    @classmethod
+    def visit_model_attr(cls):
+        return 'subject_visit'
+
+    class Meta:
+        abstract = True
+
+
+class CrfOne(CrfModelMixin, BaseUuidModel):
+
+    f1 = models.CharField(max_length=10, null=True)
+
+
+class CrfTwo(CrfModelMixin, BaseUuidModel):
+
+    f1 = models.CharField(max_length=10, null=True)
+
+
+class FormAsJSONModel(BaseUuidModel):
+
+    f1 = models.CharField(max_length=10)
+
+    f2 = models.DateField(null=True, blank=True)
+
+    related_model = models.ForeignKey(
+        TestModel, on_delete=models.PROTECT, null=True, blank=True)
+
+    form_as_json = models.TextField(null=True)
+
+
+def crf_model_factory(name, field_count):
+    """Returns a CRF model class with `field_count` CharFields for
+    tests and benchmarks on large CRFs.
+    """
+    attrs = {'__module__': __name__}
+    for index in range(field_count):
+        attrs[f'question{index}'] = models.CharField(
+            verbose_name=f'Question {index}: what is the answer?',
+            max_length=25, null=True)
+    return type(name, (CrfModelMixin, BaseUuidModel), attrs)
+
+
+CrfModel10 = crf_model_factory('CrfModel10', 10)
+CrfModel100 = crf_model_factory('CrfModel100', 100)
+CrfModel150 = crf_model_factory('CrfModel150', 150)
+CrfModel500 = crf_model_factory('CrfModel500', 500)
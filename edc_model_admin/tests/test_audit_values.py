@@ -0,0 +1,75 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from io import StringIO
+
+from ..audit_values import AuditValues
+from ..model_admin_audit_fields_mixin import ModelAdminAuditFieldsMixin
+from .models import TestModel
+
+
+class MyModelAdmin(ModelAdminAuditFieldsMixin, admin.ModelAdmin):
+    pass
+
+
+class TestAuditValues(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.model_admin = MyModelAdmin(TestModel, AdminSite())
+        self.user = User.objects.create_superuser('erik', 'erik@example.com', 'pass')
+        for username in ['erik', 'jude', 'erik']:
+            TestModel.objects.create(f1='1', user_created=username)
+
+    def request(self):
+        request = RequestFactory().get('/')
+        request.user = self.user
+        return request
+
+    def user_created_choices(self):
+        changelist = self.model_admin.get_changelist_instance(self.request())
+        list_filter = [spec for spec in changelist.filter_specs
+                       if spec.field_path == 'user_created'][0]
+        return [choice['display'] for choice in list_filter.choices(changelist)]
+
+    def test_choices_from_cache(self):
+        self.assertEqual(self.user_created_choices(), ['All', 'erik', 'jude'])
+        with CaptureQueriesContext(connection) as context:
+            self.user_created_choices()
+        self.assertFalse(
+            [q for q in context.captured_queries if 'DISTINCT' in q['sql']])
+
+    def test_save_model_adds_value(self):
+        self.user_created_choices()
+        user = User.objects.create(username='mary')
+        request = self.request()
+        request.user = user
+        self.model_admin.save_model(request, TestModel(f1='2'), None, False)
+        self.assertEqual(self.user_created_choices(), ['All', 'erik', 'jude', 'mary'])
+
+    def test_rebuild_command(self):
+        values = AuditValues(TestModel, 'user_created')
+        self.assertEqual(values.get(), ['erik', 'jude'])
+        TestModel.objects.create(f1='3', user_created='mary')
+        self.assertEqual(values.get(), ['erik', 'jude'])
+        call_command('edc_model_admin_audit_values', 'edc_model_admin.testmodel',
+                     stdout=StringIO())
+        self.assertEqual(values.get(), ['erik', 'jude', 'mary'])
+
+    def test_add_not_lost_between_workers(self):
+        values = AuditValues(TestModel, 'user_created')
+        values.get()
+        # two workers that read the list before either added
+        first = AuditValues(TestModel, 'user_created')
+        second = AuditValues(TestModel, 'user_created')
+        first.add('mary')
+        second.add('paul')
+        second.add('mary')
+        self.assertEqual(values.get(), ['erik', 'jude', 'mary', 'paul'])
+        self.assertEqual(cache.get(f'{values.key}.added'), 2)
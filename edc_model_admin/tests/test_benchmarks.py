@@ -0,0 +1,247 @@
+import json
+import os
+
+from django import forms
+from django.apps import apps as django_apps
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, tag
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from statistics import mean
+from time import perf_counter
+
+from ..changelist_buttons import ModelAdminChangelistModelButtonMixin
+from ..form_as_json_model_admin_mixin import FormAsJSONModelAdminMixin
+from ..model_admin_audit_fields_mixin import ModelAdminAuditFieldsMixin
+from ..model_admin_basic_mixin import ModelAdminBasicMixin
+from ..model_admin_form_auto_number_mixin import ModelAdminFormAutoNumberMixin
+from ..model_admin_form_cache_mixin import ModelAdminFormCacheMixin
+from ..model_admin_form_instructions_mixin import ModelAdminFormInstructionsMixin
+from ..model_admin_institution_mixin import ModelAdminInstitutionMixin
+from ..model_admin_model_redirect_mixin import ModelAdminModelRedirectMixin
+from ..model_admin_next_url_redirect_mixin import ModelAdminNextUrlRedirectMixin
+from ..model_admin_readonly_mixin import ModelAdminReadOnlyMixin
+from ..model_admin_redirect_on_delete_mixin import ModelAdminRedirectOnDeleteMixin
+from ..model_admin_replace_label_text_mixin import ModelAdminReplaceLabelTextMixin
+from .models import SubjectVisit, CrfModel10, CrfModel100, CrfModel150, CrfModel500
+from .test_changelist_buttons import legacy_change_model_button
+from .test_label_pipeline import legacy_auto_number, legacy_replace_label_text
+
+# set to a file path to run the full matrix and write the results as JSON
+BENCHMARK_FILE = os.environ.get('EDC_MODEL_ADMIN_BENCHMARK')
+
+if BENCHMARK_FILE:
+    FIELDS = {10: CrfModel10, 100: CrfModel100, 500: CrfModel500}
+    ROWS = [10, 100, 1000]
+    BUTTON_ROWS = 1000
+    ITERATIONS = 5
+else:
+    FIELDS = {10: CrfModel10}
+    ROWS = [10]
+    BUTTON_ROWS = 10
+    ITERATIONS = 1
+
+
+class NextFormGetter:
+
+    def next_form(self, model_obj=None):
+        return None
+
+
+class BenchmarkAdminMixin(ModelAdminChangelistModelButtonMixin):
+
+    """Attributes needed by the mixins under test.
+    """
+
+    show_save_next = True
+    show_cancel = True
+    next_form_getter_cls = NextFormGetter
+    redirect_app_label = 'edc_model_admin'
+    redirect_model_name = 'subjectvisit'
+    redirect_search_field = 'subject_visit__subject_identifier'
+    mixin_list_display = ['subject_visit']
+    replace_label_text_rules = [('answer', 'response')]
+
+    def get_list_display(self, request):
+        return tuple(super().get_list_display(request)) + ('visit_button', )
+
+    def visit_button(self, obj):
+        return self.change_model_button(
+            'edc_model_admin', 'subjectvisit', (obj.subject_visit_id, ))
+
+
+MIXINS = [
+    ModelAdminBasicMixin,
+    ModelAdminAuditFieldsMixin,
+    ModelAdminFormAutoNumberMixin,
+    ModelAdminFormCacheMixin,
+    ModelAdminFormInstructionsMixin,
+    ModelAdminModelRedirectMixin,
+    ModelAdminNextUrlRedirectMixin,
+    ModelAdminReadOnlyMixin,
+    ModelAdminRedirectOnDeleteMixin,
+    ModelAdminReplaceLabelTextMixin,
+    FormAsJSONModelAdminMixin,
+]
+
+PRODUCTION_STACK = [
+    ModelAdminFormCacheMixin,
+    ModelAdminNextUrlRedirectMixin,
+    ModelAdminFormInstructionsMixin,
+    ModelAdminFormAutoNumberMixin,
+    ModelAdminAuditFieldsMixin,
+    ModelAdminReadOnlyMixin,
+    ModelAdminRedirectOnDeleteMixin,
+    ModelAdminBasicMixin,
+]
+
+if django_apps.is_installed('edc_base'):
+    MIXINS.append(ModelAdminInstitutionMixin)
+    PRODUCTION_STACK.append(ModelAdminInstitutionMixin)
+
+
+def admin_class_factory(name, mixins):
+    return type(name, tuple(mixins) + (BenchmarkAdminMixin, admin.ModelAdmin), {
+        '__module__': __name__})
+
+
+STACKS = {mixin.__name__: admin_class_factory(
+    f'{mixin.__name__}Admin', [mixin]) for mixin in MIXINS}
+STACKS['production'] = admin_class_factory('ProductionAdmin', PRODUCTION_STACK)
+STACKS['none'] = admin_class_factory('NoMixinAdmin', [])
+
+
+@tag('benchmark')
+class TestBenchmarks(TestCase):
+
+    """Times and counts queries for add_view, change_view,
+    changelist_view and save next for each mixin, the production
+    stack and no mixin on CRFs of 10, 100 and 500 fields and
+    changelists of 10, 100 and 1000 rows.
+
+    Also times the legacy against the compiled form labels on a
+    150 field CRF and changelist buttons for 1000 rows.
+
+    Set EDC_MODEL_ADMIN_BENCHMARK=<path> to run all sizes and write
+    the results to <path>.
+    """
+
+    results = []
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('erik', 'erik@example.com', 'pass')
+        cls.subject_visit = SubjectVisit.objects.create(
+            subject_identifier='12345', visit_code='1000')
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        if BENCHMARK_FILE:
+            with open(BENCHMARK_FILE, 'w') as f:
+                json.dump(cls.results, f, indent=2)
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.site = AdminSite(name='admin')
+
+    def request(self, path='/', data=None):
+        if data is None:
+            request = self.factory.get(path)
+        else:
+            request = self.factory.post(path, data=data)
+        request.user = self.user
+        return request
+
+    def measure(self, func, **labels):
+        seconds = []
+        for _ in range(ITERATIONS):
+            with CaptureQueriesContext(connection) as context:
+                start = perf_counter()
+                func()
+                seconds.append(perf_counter() - start)
+        result = dict(labels, iterations=ITERATIONS, seconds_mean=mean(seconds),
+                      seconds_min=min(seconds), queries=len(context.captured_queries))
+        self.results.append(result)
+        return result
+
+    def test_benchmarks(self):
+        for stack, model_admin_cls in STACKS.items():
+            for fields, model_cls in FIELDS.items():
+                model_admin = model_admin_cls(model_cls, self.site)
+                obj = model_cls.objects.create(subject_visit=self.subject_visit)
+                self.measure(
+                    lambda: model_admin.add_view(self.request()).render(),
+                    stack=stack, scenario='add_view', fields=fields, rows=None)
+                self.measure(
+                    lambda: model_admin.change_view(
+                        self.request(), str(obj.pk)).render(),
+                    stack=stack, scenario='change_view', fields=fields, rows=None)
+                self.measure(
+                    lambda: model_admin.change_view(
+                        self.request('/?edc_readonly=1'), str(obj.pk)).render(),
+                    stack=stack, scenario='change_view_readonly', fields=fields,
+                    rows=None)
+                if isinstance(model_admin, ModelAdminNextUrlRedirectMixin):
+                    self.measure(
+                        lambda: model_admin.redirect_url(
+                            self.request('/?next=admin:index', {'_savenext': '1'}),
+                            obj),
+                        stack=stack, scenario='savenext', fields=fields, rows=None)
+                model_cls.objects.all().delete()
+            for rows in ROWS:
+                CrfModel10.objects.bulk_create(
+                    [CrfModel10(subject_visit=self.subject_visit)
+                     for _ in range(rows)])
+                model_admin = model_admin_cls(CrfModel10, self.site)
+                model_admin.list_per_page = rows
+                self.measure(
+                    lambda: model_admin.changelist_view(self.request()).render(),
+                    stack=stack, scenario='changelist_view', fields=10, rows=rows)
+                CrfModel10.objects.all().delete()
+        self.assertTrue(all(result['seconds_mean'] > 0 for result in self.results))
+
+    def test_labels_benchmark(self):
+        model_admin = STACKS['ModelAdminFormAutoNumberMixin'](CrfModel150, self.site)
+        model_admin.replace_label_text_rules = [('Field', 'Question', ['f1'])]
+
+        def form_classes():
+            return [forms.models.modelform_factory(CrfModel150, fields='__all__')
+                    for _ in range(ITERATIONS)]
+
+        def legacy(form):
+            legacy_auto_number(form)
+            for rule in model_admin.replace_label_text_rules:
+                legacy_replace_label_text(form, *rule)
+            return form
+
+        legacy_forms, compiled_forms = form_classes(), form_classes()
+        model_admin.get_labels(form_classes()[0])
+        legacy_result = self.measure(
+            lambda: legacy(legacy_forms.pop()),
+            stack='legacy', scenario='labels', fields=150, rows=None)
+        compiled_result = self.measure(
+            lambda: model_admin.apply_label_pipeline(compiled_forms.pop()),
+            stack='compiled', scenario='labels', fields=150, rows=None)
+        self.assertGreater(legacy_result['seconds_mean'], 0)
+        self.assertGreater(compiled_result['seconds_mean'], 0)
+
+    def test_changelist_buttons_benchmark(self):
+        model_admin = STACKS['none'](CrfModel10, self.site)
+        rows = [CrfModel10() for _ in range(BUTTON_ROWS)]
+        legacy_result = self.measure(
+            lambda: [legacy_change_model_button(
+                model_admin, 'edc_model_admin', 'crfmodel10', (obj.pk, ),
+                label='change') for obj in rows],
+            stack='legacy', scenario='changelist_buttons', fields=None,
+            rows=BUTTON_ROWS)
+        compiled_result = self.measure(
+            lambda: [model_admin.change_model_button(
+                'edc_model_admin', 'crfmodel10', (obj.pk, )) for obj in rows],
+            stack='compiled', scenario='changelist_buttons', fields=None,
+            rows=BUTTON_ROWS)
+        self.assertGreater(legacy_result['seconds_mean'], 0)
+        self.assertGreater(compiled_result['seconds_mean'], 0)
@@ -0,0 +1,129 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.urls import reverse, set_script_prefix
+from django.utils.html import format_html
+
+from ..changelist_buttons import ModelAdminChangelistModelButtonMixin, clear_button_cache
+from .models import TestModel, SubjectVisit, CrfOne
+
+
+def legacy_change_model_button(mixin, app_label, model_name, reverse_args, label=None):
+    """The per-row button replaced by the compiled button.
+    """
+    url = reverse(f'admin:{app_label}_{model_name}_change', args=reverse_args)
+    button_template = mixin.changelist_model_button_template.format(label=label)
+    return format_html(button_template, disabled='', title='', url=url)
+
+
+class TestChangelistButtons(TestCase):
+
+    def setUp(self):
+        clear_button_cache()
+        self.mixin = ModelAdminChangelistModelButtonMixin()
+
+    def test_change_model_button(self):
+        obj = TestModel()
+        self.assertEqual(
+            self.mixin.change_model_button(
+                'edc_model_admin', 'testmodel', (obj.pk, ), title='<b>'),
+            f'<a href="/admin/edc_model_admin/testmodel/{obj.pk}/change/" '
+            f'class="button" title="&lt;b&gt;" >change</a>')
+
+    def test_change_model_button_quotes_pk(self):
+        button = self.mixin.change_model_button(
+            'edc_model_admin', 'testmodel', ('a b"', ))
+        self.assertIn(
+            reverse('admin:edc_model_admin_testmodel_change', args=('a b"', )),
+            button)
+
+    def test_add_model_button(self):
+        self.assertEqual(
+            self.mixin.add_model_button(
+                'edc_model_admin', 'testmodel', querystring='?f1=1&f2=2'),
+            '<a href="/admin/edc_model_admin/testmodel/add/?f1=1&amp;f2=2" '
+            'class="button" title="" >add</a>')
+
+    def test_changelist_list_button(self):
+        self.assertIn(
+            'href="/admin/edc_model_admin/testmodel/?q=12345+6"',
+            self.mixin.changelist_list_button(
+                'edc_model_admin', 'testmodel', querystring_value='12345 6'))
+
+    def test_button_url_keyed_on_script_prefix(self):
+        obj = TestModel()
+        url = f'/admin/edc_model_admin/testmodel/{obj.pk}/change/'
+        url_name = 'admin:edc_model_admin_testmodel_change'
+        self.assertEqual(self.mixin.button_url(url_name, (obj.pk, )), url)
+        set_script_prefix('/mounted/')
+        try:
+            self.assertEqual(
+                self.mixin.button_url(url_name, (obj.pk, )), f'/mounted{url}')
+            self.assertEqual(
+                self.mixin.button_url('admin:index'), '/mounted/admin/')
+        finally:
+            set_script_prefix('/')
+        self.assertEqual(self.mixin.button_url(url_name, (obj.pk, )), url)
+        self.assertEqual(self.mixin.button_url('admin:index'), '/admin/')
+
+    def test_disabled_button(self):
+        self.assertEqual(
+            self.mixin.disabled_button('add'),
+            '<a href="#" class="button" title="" disabled>add</a>')
+
+    def test_compiled_matches_legacy_1000_rows(self):
+        rows = [TestModel() for _ in range(1000)]
+        legacy = [legacy_change_model_button(
+            self.mixin, 'edc_model_admin', 'testmodel', (obj.pk, ), label='change')
+            for obj in rows]
+        compiled = [self.mixin.change_model_button(
+            'edc_model_admin', 'testmodel', (obj.pk, )) for obj in rows]
+        self.assertEqual(legacy, compiled)
+
+
+class SubjectVisitAdmin(ModelAdminChangelistModelButtonMixin, admin.ModelAdmin):
+
+    list_display = ('subject_identifier', 'crf_one')
+
+    changelist_model_buttons = {
+        'crf_one': dict(model='edc_model_admin.crfone', lookup='subject_visit')}
+
+    def crf_one(self, obj):
+        return self.related_model_button(obj, 'crf_one')
+
+
+class TestChangelistModelButtonPrefetch(TestCase):
+
+    def setUp(self):
+        clear_button_cache()
+        self.factory = RequestFactory()
+        self.user = User.objects.create_superuser('erik', 'erik@example.com', 'pass')
+        self.crfs = {}
+        for index in range(10):
+            subject_visit = SubjectVisit.objects.create(
+                subject_identifier=str(index), visit_code='1000')
+            if index % 2:
+                self.crfs[subject_visit.pk] = CrfOne.objects.create(
+                    subject_visit=subject_visit)
+        self.model_admin = SubjectVisitAdmin(SubjectVisit, AdminSite())
+
+    def test_one_query_per_page(self):
+        request = self.factory.get('/')
+        request.user = self.user
+        changelist = self.model_admin.get_changelist_instance(request)
+        with self.assertNumQueries(0):
+            buttons = {obj.pk: self.model_admin.crf_one(obj)
+                       for obj in changelist.result_list}
+        for pk, button in buttons.items():
+            if pk in self.crfs:
+                self.assertIn(f'/crfone/{self.crfs[pk].pk}/change/', button)
+            else:
+                self.assertIn('/crfone/add/', button)
+
+    def test_not_prefetched(self):
+        subject_visit = CrfOne.objects.first().subject_visit
+        with self.assertNumQueries(1):
+            button = self.model_admin.crf_one(subject_visit)
+        self.assertIn('/change/', button)
@@ -0,0 +1,166 @@
+from concurrent.futures import ThreadPoolExecutor
+from django import forms
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.test import TestCase, tag
+from django.test.client import RequestFactory
+
+from ..audit_values import AuditValuesListFilter
+from ..inlines import LimitedAdminInlineMixin
+from ..model_admin_audit_fields_mixin import ModelAdminAuditFieldsMixin
+from ..model_admin_basic_mixin import ModelAdminBasicMixin
+from ..model_admin_form_auto_number_mixin import ModelAdminFormAutoNumberMixin
+from ..model_admin_readonly_mixin import ModelAdminReadOnlyMixin
+from ..model_admin_redirect_on_delete_mixin import ModelAdminRedirectOnDeleteMixin
+from .models import TestModel, TestInlineModel
+
+THREADS = 16
+REQUESTS = 400
+
+
+class TestModelForm(forms.ModelForm):
+
+    f1 = forms.CharField(label='Field one')
+
+    class Meta:
+        model = TestModel
+        fields = '__all__'
+
+
+class TestInlineModelForm(forms.ModelForm):
+
+    related_model = forms.ModelChoiceField(queryset=TestModel.objects.all())
+
+    class Meta:
+        model = TestInlineModel
+        fields = '__all__'
+
+
+class MyModelAdmin(ModelAdminBasicMixin, ModelAdminAuditFieldsMixin,
+                   ModelAdminFormAutoNumberMixin, ModelAdminReadOnlyMixin,
+                   ModelAdminRedirectOnDeleteMixin, admin.ModelAdmin):
+
+    form = TestModelForm
+    next_querystring_attr = 'next'
+    post_url_on_delete_name = 'admin:app_list'
+
+    list_display = ('f1', 'f2')
+    list_display_pos = [(0, 'f5')]
+    mixin_list_display = ['f3']
+    list_filter = ('f1', )
+    mixin_list_filter = ['f2']
+    mixin_search_fields = ['f1', 'f2']
+    radio_fields = {'f1': admin.VERTICAL}
+    mixin_radio_fields = {'f2': admin.VERTICAL, 'f4': admin.VERTICAL}
+    mixin_exclude_fields = ['f4']
+
+    def post_url_on_delete_kwargs(self, request, obj):
+        return {'app_label': request.GET.get('app_label')}
+
+
+class MyInlineAdmin(LimitedAdminInlineMixin, admin.TabularInline):
+
+    model = TestInlineModel
+    form = TestInlineModelForm
+    fk_name = 'test_model'
+
+    def get_filters(self, obj):
+        return (('related_model', dict(f1=obj.f1 if obj else None)),)
+
+
+class TestConcurrency(TestCase):
+
+    """Drives a single ModelAdmin instance from many threads, as
+    under threaded or ASGI workers, and checks that no request state
+    is kept on the instance, its class or shared form fields.
+    """
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.site = AdminSite()
+        self.user = User(username='erik', is_superuser=True, is_active=True)
+
+    def request(self, path='/'):
+        request = self.factory.get(path)
+        request.user = self.user
+        return request
+
+    def run_threads(self, func):
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            return list(executor.map(func, range(REQUESTS)))
+
+    def test_layouts(self):
+        model_admin = MyModelAdmin(TestModel, self.site)
+        before = dict(vars(model_admin))
+
+        def func(index):
+            request = self.request()
+            return (model_admin.get_list_display(request),
+                    model_admin.get_list_filter(request),
+                    model_admin.get_search_fields(request))
+
+        results = self.run_threads(func)
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(
+            results[0],
+            (('f5', 'f1', 'f2', 'f3'),
+             ('f1', 'created', 'modified',
+              ('user_created', AuditValuesListFilter),
+              ('user_modified', AuditValuesListFilter),
+              ('hostname_created', AuditValuesListFilter),
+              ('hostname_modified', AuditValuesListFilter), 'f2'),
+             ('f1', 'f2')))
+        self.assertEqual(vars(model_admin), before)
+
+    def test_radio_fields(self):
+        model_admin = MyModelAdmin(TestModel, self.site)
+        self.assertEqual(
+            model_admin.radio_fields,
+            {'f1': admin.VERTICAL, 'f2': admin.VERTICAL})
+        self.assertEqual(
+            MyModelAdmin.mixin_radio_fields,
+            {'f2': admin.VERTICAL, 'f4': admin.VERTICAL})
+        self.assertEqual(MyModelAdmin.radio_fields, {'f1': admin.VERTICAL})
+
+    def test_readonly_form(self):
+        model_admin = MyModelAdmin(TestModel, self.site)
+
+        def func(index):
+            readonly = index % 2
+            path = '/?edc_readonly=1' if readonly else '/'
+            form = model_admin.get_form(self.request(path))
+            return readonly, form.base_fields['f1'].disabled
+
+        for readonly, disabled in self.run_threads(func):
+            self.assertEqual(bool(readonly), disabled)
+        self.assertFalse(TestModelForm.base_fields['f1'].disabled)
+        self.assertEqual(TestModelForm.base_fields['f1'].label, 'Field one')
+
+    def test_redirect_on_delete(self):
+        model_admin = MyModelAdmin(TestModel, self.site)
+        request1 = self.request('/?app_label=auth')
+        request2 = self.request('/?app_label=sites')
+        for request in [request1, request2]:
+            obj = TestModel.objects.create()
+            model_admin.delete_model(request, obj)
+        self.assertEqual(
+            model_admin.get_post_url_on_delete(request1), '/admin/auth/')
+        self.assertEqual(
+            model_admin.get_post_url_on_delete(request2), '/admin/sites/')
+        self.assertFalse(hasattr(model_admin, 'post_url_on_delete'))
+
+    def test_limited_inline(self):
+        inline = MyInlineAdmin(TestModel, self.site)
+        declared = TestInlineModelForm.base_fields['related_model']
+        queryset = declared.queryset
+
+        def func(index):
+            obj = TestModel(f1=str(index))
+            formset = inline.get_formset(self.request(), obj)
+            return index, formset.form.base_fields['related_model'].queryset
+
+        for index, qs in self.run_threads(func):
+            self.assertIn(f"\"f1\" = {index}", str(qs.query).replace("'", ''))
+        self.assertIs(TestInlineModelForm.base_fields['related_model'], declared)
+        self.assertIs(declared.queryset, queryset)
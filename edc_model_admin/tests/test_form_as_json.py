@@ -0,0 +1,106 @@
+import json
+
+from django import forms
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.core import serializers
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.test.client import RequestFactory
+from io import StringIO
+
+from ..form_as_json import ZLIB_HEADER, FormAsJSONStats, decode, encode
+from ..form_as_json_model_admin_mixin import FormAsJSONModelAdminMixin
+from .models import FormAsJSONModel, TestModel
+
+
+class FormAsJSONModelForm(forms.ModelForm):
+
+    class Meta:
+        model = FormAsJSONModel
+        fields = ('f1', 'f2', 'related_model')
+
+    def as_json(self):
+        return serializers.serialize(
+            'json', [self.instance], fields=self._meta.fields, indent=4)
+
+
+class MyModelAdmin(FormAsJSONModelAdminMixin, admin.ModelAdmin):
+
+    form = FormAsJSONModelForm
+    form_as_json_storage = 'zlib'
+
+
+class TestFormAsJSON(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.model_admin = MyModelAdmin(FormAsJSONModel, AdminSite())
+        self.request = RequestFactory().post('/')
+        self.request.user = User.objects.create(username='erik')
+        self.related_model = TestModel.objects.create(f1='1')
+
+    def save(self, data, instance=None):
+        form = FormAsJSONModelForm(data, instance=instance)
+        self.assertTrue(form.is_valid())
+        obj = form.save(commit=False)
+        self.model_admin.save_model(self.request, obj, form, instance is not None)
+        return obj
+
+    def test_compressed_and_decoded(self):
+        data = {'f1': 'x' * 10, 'f2': '2018-01-01', 'related_model': self.related_model.pk}
+        obj = self.save(data)
+        obj.refresh_from_db()
+        self.assertEqual(decode(obj.form_as_json)[0]['fields'], {
+            'f1': 'x' * 10, 'f2': '2018-01-01', 'related_model': str(self.related_model.pk)})
+        self.assertEqual(decode('{"f1":"a"}'), {'f1': 'a'})
+
+    def test_modes_store_same_payload(self):
+        data = {'f1': 'x' * 10, 'f2': '2018-01-01', 'related_model': self.related_model.pk}
+        stored = {}
+        for storage in [None, 'compact', 'zlib']:
+            self.model_admin.form_as_json_storage = storage
+            stored[storage] = self.save(data).form_as_json
+        payload = json.loads(stored[None])
+        for storage in ['compact', 'zlib']:
+            value = decode(stored[storage])
+            value[0]['pk'] = payload[0]['pk']
+            self.assertEqual(value, payload)
+        self.assertNotIn(' ', stored['compact'])
+
+    def test_zlib_header_only_if_smaller(self):
+        self.assertEqual(encode('{"f1": "a"}', compress=True), ('{"f1":"a"}', '{"f1":"a"}'))
+        value, stored = encode(json.dumps([{'f1': 'x' * 10}] * 50), compress=True)
+        self.assertTrue(stored.startswith(ZLIB_HEADER))
+        self.assertEqual(decode(stored), json.loads(value))
+
+    def test_stats_labels(self):
+        stats = FormAsJSONStats()
+        stats.incr('app.one', saves=1, json_bytes=10)
+        stats.incr('app.two', saves=1)
+        cache.delete('edc_model_admin.form_as_json.app.one.saves')
+        stats.incr('app.one', saves=1)
+        self.assertEqual(stats.labels(), ['app.one', 'app.two'])
+        self.assertEqual(stats.as_dict()['app.one']['json_bytes'], 10)
+        stats.clear()
+        self.assertEqual(stats.as_dict(), {})
+
+    def test_unchanged_form_not_serialized(self):
+        obj = self.save({'f1': 'a'})
+        stored = obj.form_as_json
+        obj.form_as_json = 'previous'
+        obj = self.save({'f1': 'a'}, instance=obj)
+        self.assertEqual(obj.form_as_json, 'previous')
+        obj = self.save({'f1': 'b'}, instance=obj)
+        self.assertNotEqual(obj.form_as_json, stored)
+        stats = FormAsJSONStats().as_dict()['edc_model_admin.formasjsonmodel']
+        self.assertEqual((stats['saves'], stats['skipped']), (2, 1))
+
+    def test_stats_command(self):
+        self.save({'f1': 'y' * 10, 'f2': '2018-01-01'})
+        out = StringIO()
+        call_command('edc_model_admin_stats', '--form-as-json', '--json', stdout=out)
+        stats = json.loads(out.getvalue())['edc_model_admin.formasjsonmodel']
+        self.assertEqual(stats['saved_bytes'], stats['json_bytes'] - stats['stored_bytes'])
@@ -0,0 +1,69 @@
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+from django.test.client import RequestFactory
+from django.utils import translation
+
+from ..fragment_cache import _fragments, clear_fragment_cache
+
+
+class TestFragmentCache(TestCase):
+
+    def setUp(self):
+        clear_fragment_cache()
+
+    def render(self, source, **context):
+        return Template('{% load edc_admin_modify %}' + source).render(Context(context))
+
+    def submit_row_context(self, **kwargs):
+        request = RequestFactory().get('/')
+        context = dict(
+            request=request, add=True, change=False, is_popup=False, save_as=False,
+            has_add_permission=True, has_change_permission=True,
+            has_view_permission=True, has_delete_permission=True,
+            has_editable_inline_admin_formsets=False, show_cancel=True)
+        context.update(kwargs)
+        return context
+
+    def test_instructions_rendered_once(self):
+        html = self.render('{% instructions %}', instructions='Fill it in.')
+        self.assertIn('<p>Fill it in.</p>', html)
+        self.assertEqual(len(_fragments), 1)
+        self.assertEqual(self.render('{% instructions %}', instructions='Fill it in.'), html)
+        self.assertEqual(len(_fragments), 1)
+
+    def test_key_on_content_and_language(self):
+        self.render('{% instructions %}', instructions='Fill it in.')
+        html = self.render('{% instructions %}', instructions='Fill <b>it</b> in.')
+        self.assertIn('Fill &lt;b&gt;it&lt;/b&gt; in.', html)
+        with translation.override('fr'):
+            self.render('{% instructions %}', instructions='Fill it in.')
+        self.assertEqual(len(_fragments), 3)
+
+    def test_submit_row(self):
+        html = self.render('{% edc_submit_row %}', **self.submit_row_context())
+        self.assertIn('name="_save"', html)
+        self.assertIn('name="_cancel"', html)
+        self.assertNotIn('name="_savenext"', html)
+        html = self.render('{% edc_submit_row %}', **self.submit_row_context(
+            show_save_next=True))
+        self.assertIn('name="_savenext"', html)
+        self.assertEqual(len(_fragments), 2)
+
+    @override_settings(EDC_MODEL_ADMIN_CACHE_FRAGMENTS=False)
+    def test_disabled(self):
+        self.render('{% instructions %}', instructions='Fill it in.')
+        self.assertEqual(len(_fragments), 0)
+
+    def test_least_recently_used_evicted(self):
+        maxsize = _fragments.maxsize
+        _fragments.maxsize = 2
+        try:
+            self.render('{% instructions %}', instructions='one')
+            self.render('{% instructions %}', instructions='two')
+            self.render('{% instructions %}', instructions='one')
+            self.render('{% instructions %}', instructions='three')
+        finally:
+            _fragments.maxsize = maxsize
+        self.assertEqual(
+            [key[-1] for key in _fragments.data],
+            [(('instructions', 'one'), ), (('instructions', 'three'), )])
@@ -0,0 +1,81 @@
+import json
+import subprocess
+import sys
+
+from django.test import SimpleTestCase, tag
+
+# seconds for `import edc_model_admin` on top of its dependencies
+IMPORT_TIME_BUDGET = 0.05
+
+IMPORT_SCRIPT = """
+import json, sys
+from time import perf_counter
+import django
+start = perf_counter()
+import edc_model_admin
+seconds = perf_counter() - start
+print(json.dumps(dict(
+    seconds=seconds,
+    admin_imported='django.contrib.admin' in sys.modules,
+    modules=sorted(m for m in sys.modules if m.startswith('edc_model_admin')))))
+"""
+
+# django.setup() with the test settings less admin.autodiscover, which
+# imports the test project's admin.py and with it the mixins it uses
+SETUP_SCRIPT = """
+import json, sys
+import django
+from django.conf import settings
+from edc_model_admin import settings as test_settings
+options = {k: getattr(test_settings, k) for k in dir(test_settings) if k.isupper()}
+options['INSTALLED_APPS'] = [
+    'django.contrib.admin.apps.SimpleAdminConfig' if app == 'django.contrib.admin'
+    else app for app in options['INSTALLED_APPS']]
+settings.configure(**options)
+django.setup()
+print(json.dumps(dict(
+    modules=sorted(m for m in sys.modules if m.startswith('edc_model_admin')))))
+"""
+
+# modules of the package django.setup() may import, AppConfig.ready
+# registers the checks and connects the signal receivers
+SETUP_MODULES = [
+    'edc_model_admin', 'edc_model_admin.apps', 'edc_model_admin.checks',
+    'edc_model_admin.lazy', 'edc_model_admin.models',
+    'edc_model_admin.navigation_plan', 'edc_model_admin.next_url',
+    'edc_model_admin.startup', 'edc_model_admin.utils']
+
+
+def run(script):
+    output = subprocess.run(
+        [sys.executable, '-c', script], check=True, stdout=subprocess.PIPE,
+        env={'PATH': '', 'PYTHONPATH': ':'.join(sys.path)}).stdout
+    return json.loads(output)
+
+
+@tag('benchmark')
+class TestImportTime(SimpleTestCase):
+
+    """Imports the package and runs django.setup() in a fresh
+    interpreter.
+    """
+
+    def test_import_time(self):
+        result = run(IMPORT_SCRIPT)
+        self.assertLess(result['seconds'], IMPORT_TIME_BUDGET)
+        self.assertFalse(result['admin_imported'])
+        self.assertEqual(result['modules'], ['edc_model_admin', 'edc_model_admin.lazy'])
+
+    def test_django_setup_modules(self):
+        modules = [m for m in run(SETUP_SCRIPT)['modules']
+                   if m != 'edc_model_admin.settings'
+                   and not m.startswith('edc_model_admin.tests')]
+        self.assertEqual(modules, SETUP_MODULES)
+
+    def test_lazy_exports(self):
+        import edc_model_admin
+        from edc_model_admin.next_url import NextUrl
+        self.assertIs(edc_model_admin.NextUrl, NextUrl)
+        self.assertIn('NextUrl', dir(edc_model_admin))
+        with self.assertRaises(AttributeError):
+            edc_model_admin.NoSuchName
@@ -0,0 +1,106 @@
+import json
+
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import TestCase
+from django.test.client import RequestFactory
+from io import StringIO
+
+from ..instrumentation import CACHE_KEY, collect, enable, disable, get_pid_key
+from ..instrumentation import instrument, publish, registry, reset
+from ..middleware import InstrumentationMiddleware
+from ..model_admin_audit_fields_mixin import ModelAdminAuditFieldsMixin
+from ..model_admin_basic_mixin import ModelAdminBasicMixin
+from .models import TestModel
+
+
+class MyModelAdmin(ModelAdminAuditFieldsMixin, ModelAdminBasicMixin, admin.ModelAdmin):
+
+    mixin_list_display = ['f1']
+
+
+class OuterMixin:
+
+    @instrument
+    def get_list_display(self, request):
+        return super().get_list_display(request)
+
+
+class NestedModelAdmin(OuterMixin, ModelAdminBasicMixin, admin.ModelAdmin):
+
+    pass
+
+
+class TestInstrumentation(TestCase):
+
+    def setUp(self):
+        reset()
+        self.user = User.objects.create(username='erik')
+        self.model_admin = MyModelAdmin(TestModel, AdminSite())
+        self.request = RequestFactory().get('/')
+        self.request.user = self.user
+        self.key = f'{__name__}.MyModelAdmin|ModelAdminBasicMixin.get_list_display'
+
+    def tearDown(self):
+        disable()
+        reset()
+
+    def test_disabled_records_nothing(self):
+        self.model_admin.get_list_display(self.request)
+        self.assertEqual(registry.snapshot(), {})
+
+    def test_enabled_records_calls_and_queries(self):
+        enable()
+        self.model_admin.get_list_display(self.request)
+        self.model_admin.get_list_display(self.request)
+        obj = TestModel(f1='1')
+        self.model_admin.save_model(self.request, obj, None, False)
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot[self.key]['count'], 2)
+        self.assertEqual(snapshot[self.key]['queries'], 0)
+        save_key = f'{__name__}.MyModelAdmin|ModelAdminAuditFieldsMixin.save_model'
+        self.assertEqual(snapshot[save_key]['count'], 1)
+        self.assertGreaterEqual(snapshot[save_key]['queries'], 1)
+
+    def test_middleware_logs_hooks_per_request(self):
+        enable()
+
+        def get_response(request):
+            self.model_admin.get_list_display(request)
+            return HttpResponse()
+
+        middleware = InstrumentationMiddleware(get_response)
+        with self.assertLogs('edc_model_admin.instrumentation') as logs:
+            middleware(self.request)
+        line = json.loads(logs.records[0].getMessage())
+        self.assertEqual(line['path'], '/')
+        self.assertEqual(line['hooks'][0]['hook'], 'ModelAdminBasicMixin.get_list_display')
+        self.assertEqual(line['hooks'][0]['calls'], 1)
+
+    def test_stats_command(self):
+        enable()
+        self.model_admin.get_list_display(self.request)
+        out = StringIO()
+        call_command('edc_model_admin_stats', '--json', stdout=out)
+        self.assertEqual(json.loads(out.getvalue())[self.key]['count'], 1)
+        call_command('edc_model_admin_stats', '--reset', stdout=StringIO())
+        self.assertEqual(registry.snapshot(), {})
+
+    def test_nested_hook_recorded_once(self):
+        enable()
+        NestedModelAdmin(TestModel, AdminSite()).get_list_display(self.request)
+        self.assertEqual(
+            list(registry.snapshot()),
+            [f'{__name__}.NestedModelAdmin|OuterMixin.get_list_display'])
+
+    def test_publish_drops_expired_pids(self):
+        enable()
+        self.model_admin.get_list_display(self.request)
+        cache.set(f'{CACHE_KEY}.pids', [f'{CACHE_KEY}.otherhost.1'], None)
+        publish()
+        self.assertEqual(cache.get(f'{CACHE_KEY}.pids'), [get_pid_key()])
+        self.assertEqual(collect()[self.key].count, 1)
@@ -0,0 +1,126 @@
+import re
+
+from django import forms
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.utils import translation
+from django.utils.safestring import SafeText, mark_safe
+
+from ..model_admin_form_auto_number_mixin import ModelAdminFormAutoNumberMixin
+from ..model_admin_label_pipeline_mixin import clear_label_cache, _labels
+from ..model_admin_replace_label_text_mixin import ModelAdminReplaceLabelTextMixin
+from .models import TestModel, CrfModel150, CrfOne, CrfTwo
+
+
+class TestModelForm(forms.ModelForm):
+
+    f1 = forms.CharField(label='Field one')
+
+    class Meta:
+        model = TestModel
+        fields = ['f1', 'f2', 'f3']
+
+
+class MyModelAdmin(ModelAdminFormAutoNumberMixin,
+                   ModelAdminReplaceLabelTextMixin, admin.ModelAdmin):
+    form = TestModelForm
+    replace_label_text_rules = [('F2', 'Field two'), ('F3', 'F3?', ['f3'])]
+
+
+def legacy_auto_number(form):
+    """The per-request auto_number replaced by the label pipeline.
+    """
+    auto_number = True
+    if 'auto_number' in dir(form._meta):
+        auto_number = form._meta.auto_number
+    if auto_number:
+        for index, fld in enumerate(form.base_fields.items()):
+            label = str(fld[1].label)
+            if (not re.match(r'^\d+\.', label)
+                    and not re.match(r'\<a\ title\=\"', label)):
+                fld[1].label = mark_safe(
+                    '<a title="{0}">{1}</a>. {2}'.format(
+                        fld[0], str(index + 1), label))
+    return form
+
+
+def legacy_replace_label_text(form, old, new, skip_fields=None):
+    """The per-request replace_label_text replaced by the label
+    pipeline.
+    """
+    skip_fields = skip_fields or []
+    for name, form_field in form.base_fields.items():
+        if name not in skip_fields:
+            label = str(form_field.label)
+            if old in label:
+                form_field.label = mark_safe(label.replace(old, new))
+    return form
+
+
+class TestLabelPipeline(TestCase):
+
+    def setUp(self):
+        clear_label_cache()
+        self.factory = RequestFactory()
+        self.model_admin = MyModelAdmin(TestModel, AdminSite())
+
+    def test_labels(self):
+        form = self.model_admin.get_form(self.factory.get('/'))
+        self.assertEqual(
+            [form_field.label for form_field in form.base_fields.values()],
+            ['<a title="f1">1</a>. Field one',
+             '<a title="f2">2</a>. Field two',
+             '<a title="f3">3</a>. F3'])
+        self.assertIsInstance(form.base_fields['f1'].label, SafeText)
+        self.assertEqual(TestModelForm.base_fields['f1'].label, 'Field one')
+
+    def test_labels_cached(self):
+        form1 = self.model_admin.get_form(self.factory.get('/'))
+        form2 = self.model_admin.get_form(self.factory.get('/'))
+        self.assertIsNot(form1, form2)
+        self.assertIs(
+            form1.base_fields['f2'].label, form2.base_fields['f2'].label)
+
+    def test_labels_per_language(self):
+        self.model_admin.get_form(self.factory.get('/'))
+        with translation.override('fr'):
+            self.model_admin.get_form(self.factory.get('/'))
+        self.assertEqual(
+            {key[-1] for key in _labels if key[0] is MyModelAdmin},
+            {'en-us', 'fr'})
+
+    def test_replace_label_text(self):
+        form = forms.models.modelform_factory(TestModel, fields=['f1', 'f2'])
+        form = self.model_admin.replace_label_text(
+            form, 'F', 'Field ', skip_fields=['f2'])
+        self.assertEqual(form.base_fields['f1'].label, 'Field 1')
+        self.assertEqual(form.base_fields['f2'].label, 'F2')
+
+    def test_compiled_labels_match_legacy_150_fields(self):
+
+        class CrfModelAdmin(ModelAdminFormAutoNumberMixin, admin.ModelAdmin):
+            pass
+
+        model_admin = CrfModelAdmin(CrfModel150, AdminSite())
+        legacy = forms.models.modelform_factory(CrfModel150, fields='__all__')
+        compiled = forms.models.modelform_factory(CrfModel150, fields='__all__')
+        legacy_auto_number(legacy)
+        model_admin.apply_label_pipeline(compiled)
+        self.assertEqual(
+            [f.label for f in legacy.base_fields.values()],
+            [f.label for f in compiled.base_fields.values()])
+
+    def test_labels_keyed_on_model(self):
+
+        class CrfModelAdmin(ModelAdminFormAutoNumberMixin, admin.ModelAdmin):
+            pass
+
+        labels = {}
+        for model in [CrfOne, CrfTwo]:
+            model_admin = CrfModelAdmin(model, AdminSite())
+            form = forms.models.modelform_factory(model, fields=['f1'])
+            labels[model] = model_admin.get_labels(form)
+        self.assertIsNot(labels[CrfOne], labels[CrfTwo])
+        self.assertEqual(len([key for key in _labels if key[0] is CrfModelAdmin]), 2)
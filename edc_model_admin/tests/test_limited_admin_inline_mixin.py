@@ -0,0 +1,70 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.admin.widgets import ForeignKeyRawIdWidget
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from ..inlines import LimitedAdminInlineMixin
+from .models import TestModel, TestInlineModel
+
+
+class MyInlineAdmin(LimitedAdminInlineMixin, admin.TabularInline):
+
+    model = TestInlineModel
+    fk_name = 'test_model'
+    fields = ('related_model', 'f1')
+    extra = 40
+
+    def get_filters(self, obj):
+        return (('related_model', dict(f1=obj.f1)),)
+
+
+class TestLimitedAdminInlineMixin(TestCase):
+
+    def setUp(self):
+        self.site = AdminSite()
+        self.site.register(TestModel)
+        self.request = RequestFactory().get('/')
+        self.request.user = User.objects.create_superuser(
+            'erik', 'erik@example.com', 'pass')
+        self.obj = TestModel.objects.create(f1='A')
+        for f1 in ['A', 'A', 'B']:
+            TestModel.objects.create(f1=f1)
+
+    def related_model_selects(self, inline):
+        formset_cls = inline.get_formset(self.request, self.obj)
+        forms = formset_cls(instance=self.obj).forms
+        with CaptureQueriesContext(connection) as context:
+            html = [str(form['related_model']) for form in forms]
+        return html, context.captured_queries
+
+    def test_choices_queried_once_per_formset(self):
+        html, queries = self.related_model_selects(MyInlineAdmin(TestModel, self.site))
+        self.assertEqual(len(html), 40)
+        self.assertEqual(len(queries), 1)
+        # empty label and the three instances with f1='A'
+        self.assertEqual(html[0].count('<option'), 4)
+        self.assertEqual(html[-1].count('<option'), 4)
+
+    def test_choices_queried_again_for_the_next_formset(self):
+        inline = MyInlineAdmin(TestModel, self.site)
+        self.related_model_selects(inline)
+        TestModel.objects.create(f1='A')
+        html, queries = self.related_model_selects(inline)
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(html[0].count('<option'), 5)
+
+    def test_threshold_switches_to_raw_id_widget(self):
+        inline = MyInlineAdmin(TestModel, self.site)
+        inline.limit_inline_choices_threshold = 2
+        formset_cls = inline.get_formset(self.request, self.obj)
+        form_field = formset_cls.form.base_fields['related_model']
+        self.assertIsInstance(form_field.widget, ForeignKeyRawIdWidget)
+        self.assertEqual(form_field.queryset.count(), 3)
+        inline.limit_inline_choices_threshold = 3
+        formset_cls = inline.get_formset(self.request, self.obj)
+        self.assertNotIsInstance(
+            formset_cls.form.base_fields['related_model'].widget, ForeignKeyRawIdWidget)
@@ -0,0 +1,63 @@
+import socket
+
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.db import connection
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from ..model_admin_audit_fields_mixin import ModelAdminAuditFieldsMixin
+from .models import TestModel
+
+
+class MyModelAdmin(ModelAdminAuditFieldsMixin, admin.ModelAdmin):
+
+    bulk_update_chunk_size = 10
+    bulk_update_actions = {
+        'set_f2_reviewed': dict(
+            description='Set f2 to reviewed', values={'f2': 'reviewed'})}
+
+
+class TestModelAdminAuditFieldsMixin(TestCase):
+
+    def setUp(self):
+        self.model_admin = MyModelAdmin(TestModel, AdminSite())
+        self.user = User.objects.create_superuser('erik', 'erik@example.com', 'pass')
+        TestModel.objects.bulk_create([
+            TestModel(f1=str(i), user_modified='fixture', hostname_modified='fixture-host')
+            for i in range(25)])
+
+    def request(self):
+        request = RequestFactory().post('/')
+        request.user = self.user
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        return request
+
+    def test_bulk_update_stamps_audit_fields_in_chunks(self):
+        queryset = TestModel.objects.filter(f1__in=[str(i) for i in range(22)])
+        with CaptureQueriesContext(connection) as context:
+            count = self.model_admin.bulk_update(self.request(), queryset, f2='x')
+        self.assertEqual(count, 22)
+        updates = [q for q in context.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 3)
+        self.assertEqual(
+            TestModel.objects.filter(f2='x', user_modified='erik',
+                                     modified__isnull=False).count(), 22)
+        self.assertEqual(
+            TestModel.objects.filter(
+                f2='x', hostname_modified=socket.gethostname()).count(), 22)
+        self.assertEqual(
+            TestModel.objects.exclude(f1__in=[str(i) for i in range(22)]).filter(
+                user_modified='fixture', hostname_modified='fixture-host').count(), 3)
+
+    def test_bulk_update_action(self):
+        request = self.request()
+        func, name, description = self.model_admin.get_actions(request)['set_f2_reviewed']
+        self.assertEqual(description, 'Set f2 to reviewed')
+        func(self.model_admin, request, TestModel.objects.all())
+        self.assertEqual(TestModel.objects.filter(f2='reviewed').count(), 25)
+        self.assertEqual([str(m) for m in request._messages], ['25 test models updated.'])
@@ -0,0 +1,81 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.test import TestCase, tag
+from django.test.client import RequestFactory
+
+from ..model_admin_basic_mixin import ModelAdminBasicMixin, clear_layout_cache
+from .models import TestModel
+
+
+class TestModelAdminBasicMixin(TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.site = AdminSite()
+        clear_layout_cache()
+
+        class MyModelAdmin(ModelAdminBasicMixin, admin.ModelAdmin):
+            list_display = ('f1', 'f2')
+            list_display_pos = [(0, 'f5')]
+            mixin_list_display = ['f3', 'f4', 'f5_other']
+            list_filter = ('f1', )
+            mixin_list_filter = ['f2']
+            search_fields = ('f1', )
+            mixin_search_fields = ['f2', 'f3']
+            mixin_exclude_fields = ['f4', 'f3']
+
+        self.model_admin_cls = MyModelAdmin
+        self.model_admin = MyModelAdmin(TestModel, self.site)
+
+    def test_list_display(self):
+        request = self.factory.get('/')
+        self.assertEqual(
+            self.model_admin.get_list_display(request),
+            ('f5', 'f1', 'f2', 'f5_other'))
+
+    def test_list_filter(self):
+        request = self.factory.get('/')
+        self.assertEqual(
+            self.model_admin.get_list_filter(request), ('f1', 'f2'))
+
+    def test_search_fields(self):
+        request = self.factory.get('/')
+        self.assertEqual(
+            self.model_admin.get_search_fields(request), ('f1', 'f2'))
+
+    def test_reorder_ignores_two_character_names(self):
+        self.assertEqual(
+            self.model_admin.reorder(['id', 'f1', (0, 'f1')]), ['f1', 'id'])
+
+    def test_layout_is_cached_per_class(self):
+        request = self.factory.get('/')
+        list_display = self.model_admin.get_list_display(request)
+        other = self.model_admin_cls(TestModel, self.site)
+        self.assertIs(other.get_list_display(request), list_display)
+
+    def test_layout_cache_cleared(self):
+        request = self.factory.get('/')
+        self.model_admin.get_list_display(request)
+        self.model_admin_cls.mixin_list_display = ['f3']
+        clear_layout_cache(self.model_admin_cls)
+        self.assertEqual(
+            self.model_admin.get_list_display(request), ('f5', 'f1', 'f2'))
+
+    def test_layout_varies_with_super(self):
+
+        class VaryingListDisplayMixin:
+            def get_list_display(self, request):
+                return ('f1', ) if request.GET.get('a') else ('f2', )
+
+        class MyModelAdmin(ModelAdminBasicMixin, VaryingListDisplayMixin,
+                           admin.ModelAdmin):
+            list_display_pos = [(0, 'f5')]
+            mixin_list_display = ['f5_other']
+
+        model_admin = MyModelAdmin(TestModel, self.site)
+        self.assertEqual(
+            model_admin.get_list_display(self.factory.get('/?a=1')),
+            ('f5', 'f1', 'f5_other'))
+        self.assertEqual(
+            model_admin.get_list_display(self.factory.get('/')),
+            ('f5', 'f2', 'f5_other'))
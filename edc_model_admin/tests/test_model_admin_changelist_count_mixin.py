@@ -0,0 +1,113 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.test.client import RequestFactory
+from unittest import skipUnless
+
+from ..changelist_count import estimate_count
+from ..model_admin_changelist_count_mixin import ModelAdminChangelistCountMixin
+from .models import TestModel
+
+
+class CountModelAdmin(ModelAdminChangelistCountMixin, admin.ModelAdmin):
+
+    list_display = ('f1', )
+    list_filter = ('f2', )
+
+
+class TestModelAdminChangelistCountMixin(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.user = User.objects.create(
+            username='erik', is_superuser=True, is_staff=True, is_active=True)
+        self.model_admin = CountModelAdmin(TestModel, AdminSite())
+        for index in range(3):
+            TestModel.objects.create(f1=f'{index}', f2='yes' if index else 'no')
+
+    def changelist(self, path='/'):
+        request = self.factory.get(path)
+        request.user = self.user
+        return self.model_admin.get_changelist_instance(request)
+
+    def test_counts(self):
+        cl = self.changelist('/?f2=yes')
+        self.assertEqual((cl.result_count, cl.full_result_count), (2, 3))
+        self.assertFalse(cl.count_is_approximate)
+        self.assertEqual(len(cl.result_list), 2)
+
+    def test_counts_cached(self):
+        self.changelist('/?f2=yes')
+        with self.assertNumQueries(0):
+            cl = self.changelist('/?f2=yes&o=1')
+        self.assertEqual((cl.result_count, cl.full_result_count), (2, 3))
+        self.assertEqual(self.changelist('/?f2=no').result_count, 1)
+
+    @skipUnless(connection.vendor == 'sqlite', 'sqlite_stat1')
+    def test_estimate_above(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        self.assertEqual(estimate_count(TestModel.objects.all()), 3)
+        self.assertIsNone(estimate_count(TestModel.objects.filter(f2='no')))
+        self.model_admin.changelist_count_estimate_above = 2
+        TestModel.objects.create(f1='4', f2='no')
+        cl = self.changelist()
+        self.assertEqual(cl.result_count, 3)
+        self.assertTrue(cl.count_is_approximate)
+        cl = self.changelist('/?f2=no')
+        self.assertEqual(cl.result_count, 2)
+        self.assertTrue(cl.count_is_approximate)
+
+    @skipUnless(connection.vendor == 'sqlite', 'sqlite_stat1')
+    def test_approximate_shown(self):
+        request = self.factory.get('/')
+        request.user = self.user
+        request._messages = CookieStorage(request)
+        response = self.model_admin.changelist_view(request)
+        self.assertNotContains(response.render(), 'Counts are approximate.')
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        cache.clear()
+        self.model_admin.changelist_count_estimate_above = 0
+        response = self.model_admin.changelist_view(request)
+        self.assertEqual(
+            response.template_name[0],
+            'admin/edc_model_admin/testmodel/change_list.html')
+        self.assertContains(response.render(), 'Counts are approximate.')
+
+
+class TestChangelistCountInvalidation(TransactionTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.user = User.objects.create(
+            username='erik', is_superuser=True, is_staff=True, is_active=True)
+        self.model_admin = CountModelAdmin(TestModel, AdminSite())
+        for index in range(3):
+            TestModel.objects.create(f1=f'{index}', f2='yes' if index else 'no')
+
+    def changelist(self):
+        request = self.factory.get('/')
+        request.user = self.user
+        return self.model_admin.get_changelist_instance(request)
+
+    def test_invalidated_on_commit(self):
+        self.changelist()
+        request = self.factory.get('/')
+        request.user = self.user
+        with transaction.atomic():
+            self.model_admin.save_model(
+                request, TestModel(f1='4', f2='yes'), None, False)
+            self.assertEqual(self.changelist().result_count, 3)
+        self.assertEqual(self.changelist().result_count, 4)
+        self.model_admin.delete_queryset(request, TestModel.objects.filter(f2='no'))
+        self.assertEqual(self.changelist().result_count, 3)
+        obj = TestModel.objects.get(f1='4')
+        self.model_admin.delete_model(request, obj)
+        self.assertEqual(self.changelist().result_count, 2)
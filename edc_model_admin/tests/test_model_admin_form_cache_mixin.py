@@ -0,0 +1,70 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.test import TestCase, tag
+from django.test.client import RequestFactory
+
+from ..model_admin_form_auto_number_mixin import ModelAdminFormAutoNumberMixin
+from ..model_admin_form_cache_mixin import ModelAdminFormCacheMixin
+from .models import TestModel
+
+
+class CountingMixin:
+
+    calls = 0
+
+    def get_form(self, request, obj=None, **kwargs):
+        self.__class__.calls += 1
+        return super().get_form(request, obj, **kwargs)
+
+
+class UncachedModelAdmin(ModelAdminFormAutoNumberMixin, CountingMixin,
+                         admin.ModelAdmin):
+    pass
+
+
+class CachedModelAdmin(ModelAdminFormCacheMixin, ModelAdminFormAutoNumberMixin,
+                       CountingMixin, admin.ModelAdmin):
+    pass
+
+
+class TestModelAdminFormCacheMixin(TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_superuser('erik', 'erik@example.com', 'pass')
+        self.obj = TestModel.objects.create(f1='1', f2='2', f5='5')
+
+    def request(self):
+        request = self.factory.get('/')
+        request.user = self.user
+        return request
+
+    def change_view(self, model_admin_cls):
+        model_admin_cls.calls = 0
+        model_admin = model_admin_cls(TestModel, AdminSite())
+        request = self.request()
+        model_admin.change_view(request, str(self.obj.pk))
+        return request, model_admin_cls.calls
+
+    def test_get_form_once_per_kwargs(self):
+        _, uncached_calls = self.change_view(UncachedModelAdmin)
+        request, cached_calls = self.change_view(CachedModelAdmin)
+        stats = CachedModelAdmin(
+            TestModel, AdminSite()).get_form_cache_stats(request)
+        self.assertLess(cached_calls, uncached_calls)
+        self.assertEqual(stats['misses'], cached_calls)
+        self.assertEqual(stats['hits'], uncached_calls - cached_calls)
+
+    def test_not_shared_between_requests(self):
+        model_admin = CachedModelAdmin(TestModel, AdminSite())
+        self.assertIsNot(
+            model_admin.get_form(self.request(), self.obj),
+            model_admin.get_form(self.request(), self.obj))
+
+    def test_obj_identity(self):
+        model_admin = CachedModelAdmin(TestModel, AdminSite())
+        request = self.request()
+        form = model_admin.get_form(request, self.obj)
+        self.assertIs(model_admin.get_form(request, self.obj), form)
+        self.assertIsNot(model_admin.get_form(request, None), form)
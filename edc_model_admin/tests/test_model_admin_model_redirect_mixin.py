@@ -0,0 +1,40 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.test import TestCase
+
+from ..model_admin_model_redirect_mixin import ModelAdminModelRedirectMixin
+from .models import CrfOne, SubjectVisit
+
+
+class MyModelAdmin(ModelAdminModelRedirectMixin, admin.ModelAdmin):
+
+    redirect_app_label = 'edc_model_admin'
+    redirect_model_name = 'subjectvisit'
+    redirect_search_field = 'subject_visit__subject_identifier'
+
+
+class TestModelAdminModelRedirectMixin(TestCase):
+
+    def setUp(self):
+        self.model_admin = MyModelAdmin(CrfOne, AdminSite())
+        subject_visit = SubjectVisit.objects.create(
+            subject_identifier='123 45', visit_code='1000')
+        self.obj = CrfOne.objects.get(
+            pk=CrfOne.objects.create(subject_visit=subject_visit).pk)
+
+    def test_search_value_one_query(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.model_admin.search_value(self.obj), '123 45')
+
+    def test_search_value_property_path(self):
+        self.model_admin.redirect_search_field = 'visit__subject_identifier'
+        self.assertEqual(self.model_admin.search_value(self.obj), '123 45')
+
+    def test_redirect_url(self):
+        self.assertEqual(
+            self.model_admin.redirect_url(None, self.obj),
+            '/admin/edc_model_admin/subjectvisit/?q=123+45')
+        self.model_admin.redirect_exact_lookup = 'subject_identifier'
+        self.assertEqual(
+            self.model_admin.redirect_url(None, self.obj),
+            '/admin/edc_model_admin/subjectvisit/?subject_identifier__exact=123+45')
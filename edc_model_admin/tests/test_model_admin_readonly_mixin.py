@@ -0,0 +1,157 @@
+from django import forms
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import Permission, User
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.test import TestCase, tag
+from django.test.client import RequestFactory
+
+from ..model_admin_readonly_mixin import ModelAdminReadOnlyMixin, clear_readonly_form_cache
+from ..readonly_view_cache import CSRF_INPUT
+from .models import TestModel
+
+
+class TestModelForm(forms.ModelForm):
+
+    f1 = forms.CharField(label='Field one')
+
+    class Meta:
+        model = TestModel
+        fields = '__all__'
+
+
+class MyModelAdmin(ModelAdminReadOnlyMixin, admin.ModelAdmin):
+
+    form = TestModelForm
+    fields = ('f1', 'f2', 'f3')
+
+
+class TestModelAdminReadOnlyMixin(TestCase):
+
+    def setUp(self):
+        clear_readonly_form_cache()
+        self.factory = RequestFactory()
+        self.model_admin = MyModelAdmin(TestModel, AdminSite())
+        self.user = User(username='erik', is_superuser=True, is_active=True)
+
+    def request(self, path='/?edc_readonly=1'):
+        request = self.factory.get(path)
+        request.user = self.user
+        return request
+
+    def test_readonly_form(self):
+        form = self.model_admin.get_form(self.request())
+        self.assertTrue(
+            all(form_field.disabled for form_field in form.base_fields.values()))
+        self.assertFalse(TestModelForm.base_fields['f1'].disabled)
+
+    def test_readonly_form_cached(self):
+        form = self.model_admin.get_form(self.request())
+        self.assertIs(self.model_admin.get_form(self.request()), form)
+        self.assertIsNot(self.model_admin.get_form(self.request('/')), form)
+
+    def test_readonly_form_key_fields(self):
+        form = self.model_admin.get_form(self.request())
+        other = self.model_admin.get_form(self.request(), fields=['f1'])
+        self.assertIsNot(form, other)
+        self.assertEqual(list(other.base_fields), ['f1'])
+
+    def test_readonly_form_key_permissions(self):
+        obj = TestModel()
+        form = self.model_admin.get_form(self.request(), obj)
+        request = self.request()
+        request.user = User.objects.create(username='other', is_active=True)
+        self.assertIsNot(self.model_admin.get_form(request, obj), form)
+
+    def test_readonly_form_not_cached(self):
+        self.model_admin.cache_readonly_form = False
+        form = self.model_admin.get_form(self.request())
+        self.assertIsNot(self.model_admin.get_form(self.request()), form)
+
+
+class CachedViewModelAdmin(ModelAdminReadOnlyMixin, admin.ModelAdmin):
+
+    fields = ('f1', 'f2')
+    cache_readonly_view = True
+
+
+class TestReadOnlyViewCache(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        clear_readonly_form_cache()
+        self.factory = RequestFactory()
+        self.model_admin = CachedViewModelAdmin(TestModel, AdminSite())
+        self.user = User.objects.create(
+            username='erik', is_superuser=True, is_staff=True, is_active=True)
+        self.obj = TestModel.objects.create(f1='one', f2='two')
+
+    def request(self, path='/?edc_readonly=1', user=None):
+        request = self.factory.get(path)
+        request.user = user or self.user
+        return request
+
+    def change_view(self, request=None):
+        return self.model_admin.change_view(
+            request or self.request(), str(self.obj.pk))
+
+    def test_repeat_view_cached(self):
+        response = self.change_view()
+        self.assertTrue(hasattr(response, 'template_name'))
+        with self.assertNumQueries(1):
+            cached = self.change_view()
+        self.assertFalse(hasattr(cached, 'template_name'))
+        self.assertContains(cached, 'name="f1"')
+
+    def test_not_cached_by_default(self):
+        self.model_admin.cache_readonly_view = False
+        self.change_view()
+        self.assertTrue(hasattr(self.change_view(), 'template_name'))
+
+    def test_not_cached_if_not_readonly(self):
+        self.change_view(self.request('/'))
+        self.assertTrue(hasattr(self.change_view(self.request('/')), 'template_name'))
+
+    def test_csrf_token_not_shared(self):
+        token = CSRF_INPUT.search(self.change_view().render().content.decode())
+        self.assertTrue(token.group(0)[len(token.group(1)):-1])
+        cached = self.change_view().content.decode()
+        self.assertTrue(CSRF_INPUT.search(cached))
+        self.assertNotIn(token.group(0), cached)
+
+    def test_key_user_and_path(self):
+        self.change_view()
+        other = User.objects.create(
+            username='other', is_superuser=True, is_staff=True, is_active=True)
+        self.assertTrue(hasattr(
+            self.change_view(self.request(user=other)), 'template_name'))
+        self.assertTrue(hasattr(
+            self.change_view(self.request('/?edc_readonly=1&next=x')), 'template_name'))
+
+    def test_key_all_permissions(self):
+        user = User.objects.create(username='staff', is_staff=True, is_active=True)
+        user.user_permissions.add(
+            Permission.objects.get(codename='change_testmodel'),
+            Permission.objects.get(codename='view_group'))
+        self.change_view(self.request(user=User.objects.get(pk=user.pk)))
+        self.assertFalse(hasattr(self.change_view(
+            self.request(user=User.objects.get(pk=user.pk))), 'template_name'))
+        user.user_permissions.remove(Permission.objects.get(codename='view_group'))
+        self.assertTrue(hasattr(self.change_view(
+            self.request(user=User.objects.get(pk=user.pk))), 'template_name'))
+
+    def test_invalidated_on_save(self):
+        self.change_view()
+        self.obj.f1 = 'changed'
+        self.model_admin.save_model(self.request(), self.obj, None, True)
+        response = self.change_view()
+        self.assertTrue(hasattr(response, 'template_name'))
+        self.assertContains(response.render(), 'changed')
+
+    def test_deleted_not_served(self):
+        self.change_view()
+        self.model_admin.delete_model(self.request(), self.obj)
+        request = self.request()
+        request._messages = CookieStorage(request)
+        self.assertEqual(self.change_view(request).status_code, 302)
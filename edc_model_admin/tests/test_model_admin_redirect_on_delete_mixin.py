@@ -0,0 +1,58 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.db import connection
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from ..model_admin_redirect_on_delete_mixin import ModelAdminRedirectOnDeleteMixin
+from .models import TestModel
+
+
+class MyModelAdmin(ModelAdminRedirectOnDeleteMixin, admin.ModelAdmin):
+
+    post_url_on_delete_name = 'admin:app_list'
+    delete_chunk_size = 10
+
+    def post_url_on_delete_kwargs(self, request, obj):
+        self.reversed_for.append(obj)
+        return {'app_label': 'edc_model_admin'}
+
+
+class TestModelAdminRedirectOnDeleteMixin(TestCase):
+
+    def setUp(self):
+        self.model_admin = MyModelAdmin(TestModel, AdminSite())
+        self.model_admin.reversed_for = []
+        self.user = User.objects.create_superuser('erik', 'erik@example.com', 'pass')
+        TestModel.objects.bulk_create([TestModel(f1=str(i)) for i in range(25)])
+
+    def request(self):
+        request = RequestFactory().post('/', data={'post': 'yes'})
+        request.user = self.user
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        return request
+
+    def test_delete_selected_redirects(self):
+        request = self.request()
+        func = self.model_admin.get_actions(request)['delete_selected'][0]
+        with CaptureQueriesContext(connection) as context:
+            response = func(self.model_admin, request, TestModel.objects.all())
+        self.assertEqual(response.url, '/admin/edc_model_admin/')
+        self.assertEqual(TestModel.objects.count(), 0)
+        self.assertEqual(len(self.model_admin.reversed_for), 1)
+        self.assertEqual([str(m) for m in request._messages],
+                         ['Successfully deleted 25 test models.'])
+        deletes = [q for q in context.captured_queries
+                   if q['sql'].startswith('DELETE FROM "edc_model_admin_testmodel"')]
+        self.assertEqual(len(deletes), 3)
+
+    def test_delete_model_redirects(self):
+        request = self.request()
+        self.model_admin.delete_model(request, TestModel.objects.first())
+        self.assertEqual(
+            self.model_admin.get_post_url_on_delete(request), '/admin/edc_model_admin/')
+        self.assertEqual(TestModel.objects.count(), 24)
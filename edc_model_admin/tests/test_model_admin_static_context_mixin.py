@@ -0,0 +1,52 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.test.client import RequestFactory
+
+from ..model_admin_form_instructions_mixin import ModelAdminFormInstructionsMixin
+from ..model_admin_next_url_redirect_mixin import ModelAdminNextUrlRedirectMixin
+from ..model_admin_static_context_mixin import clear_static_context_cache
+from .models import TestModel
+
+
+class MyModelAdmin(ModelAdminNextUrlRedirectMixin, ModelAdminFormInstructionsMixin,
+                   admin.ModelAdmin):
+
+    show_cancel = True
+    add_instructions = 'Add it.'
+
+
+class TestModelAdminStaticContextMixin(TestCase):
+
+    def setUp(self):
+        clear_static_context_cache()
+        self.model_admin = MyModelAdmin(TestModel, AdminSite())
+
+    def test_static_context_merges_mixins(self):
+        context = self.model_admin.static_context('add')
+        self.assertEqual(context['instructions'], 'Add it.')
+        self.assertTrue(context['show_cancel'])
+        self.assertNotIn('show_save_next', context)
+        self.assertEqual(self.model_admin.static_context('change')['instructions'],
+                         MyModelAdmin.instructions)
+
+    def test_static_context_computed_once_and_read_only(self):
+        context = self.model_admin.static_context('add')
+        self.assertIs(MyModelAdmin(TestModel, AdminSite()).static_context('add'), context)
+        with self.assertRaises(TypeError):
+            context['instructions'] = 'changed'
+
+    def test_extra_context_layered_on_top(self):
+        context = self.model_admin.layer_static_context(
+            'add', {'instructions': 'Per request.', 'title': 'Title'})
+        self.assertEqual(context['instructions'], 'Per request.')
+        self.assertEqual(context['title'], 'Title')
+        self.assertEqual(self.model_admin.static_context('add')['instructions'], 'Add it.')
+
+    def test_add_view_context(self):
+        request = RequestFactory().get('/')
+        request.user = User.objects.create_superuser('erik', 'erik@example.com', 'pass')
+        response = self.model_admin.add_view(request)
+        self.assertEqual(response.context_data['instructions'], 'Add it.')
+        self.assertTrue(response.context_data['show_cancel'])
@@ -0,0 +1,111 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, tag
+from django.test.client import RequestFactory
+
+from ..model_admin_next_url_redirect_mixin import ModelAdminNextUrlRedirectMixin
+from ..navigation_plan import NavigationPlan, clear_navigation_plan
+from .models import SubjectVisit, CrfOne, CrfTwo
+
+
+class NextForm:
+    def __init__(self, model):
+        self.model = model
+
+
+class NextFormGetter:
+
+    calls = 0
+
+    def next_form(self, model_obj=None):
+        NextFormGetter.calls += 1
+        if isinstance(model_obj, CrfOne):
+            return NextForm('edc_model_admin.crftwo')
+        return None
+
+
+class CrfModelAdmin(ModelAdminNextUrlRedirectMixin, admin.ModelAdmin):
+    show_save_next = True
+    next_form_getter_cls = NextFormGetter
+
+
+class TestNavigationPlan(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        NextFormGetter.calls = 0
+        self.factory = RequestFactory()
+        self.user = User.objects.create_superuser('erik', 'erik@example.com', 'pass')
+        self.subject_visit = SubjectVisit.objects.create(
+            subject_identifier='12345', visit_code='1000')
+        self.crf_one = CrfOne.objects.create(subject_visit=self.subject_visit)
+        site = AdminSite(name='admin')
+        self.crf_one_admin = CrfModelAdmin(CrfOne, site)
+        self.crf_two_admin = CrfModelAdmin(CrfTwo, site)
+
+    def request(self):
+        request = self.factory.post(
+            '/?next=admin:index', data={'_savenext': 'Save and next'})
+        request.user = self.user
+        return request
+
+    def test_savenext_add_url(self):
+        url = self.crf_one_admin.get_savenext_redirect_url(
+            request=self.request(), obj=self.crf_one)
+        self.assertTrue(url.startswith('/admin/edc_model_admin/crftwo/add/?'))
+
+    def test_savenext_cached(self):
+        self.crf_one_admin.get_savenext_redirect_url(
+            request=self.request(), obj=self.crf_one)
+        with self.assertNumQueries(0):
+            url = self.crf_one_admin.get_savenext_redirect_url(
+                request=self.request(), obj=self.crf_one)
+        self.assertEqual(NextFormGetter.calls, 1)
+        self.assertTrue(url.startswith('/admin/edc_model_admin/crftwo/add/?'))
+
+    def test_savenext_url_updated_on_save(self):
+        self.crf_one_admin.get_savenext_redirect_url(
+            request=self.request(), obj=self.crf_one)
+        crf_two = CrfTwo(subject_visit=self.subject_visit)
+        self.crf_two_admin.save_model(self.request(), crf_two, None, False)
+        with self.assertNumQueries(0):
+            url = self.crf_one_admin.get_savenext_redirect_url(
+                request=self.request(), obj=self.crf_one)
+        self.assertTrue(url.startswith(
+            f'/admin/edc_model_admin/crftwo/{crf_two.id}/change/?'))
+
+    def test_savenext_url_dropped_on_save_elsewhere(self):
+        self.crf_one_admin.get_savenext_redirect_url(
+            request=self.request(), obj=self.crf_one)
+        crf_two = CrfTwo.objects.create(subject_visit=self.subject_visit)
+        url = self.crf_one_admin.get_savenext_redirect_url(
+            request=self.request(), obj=self.crf_one)
+        self.assertTrue(url.startswith(
+            f'/admin/edc_model_admin/crftwo/{crf_two.id}/change/?'))
+
+    def test_savenext_url_dropped_on_delete(self):
+        crf_two = CrfTwo(subject_visit=self.subject_visit)
+        self.crf_two_admin.save_model(self.request(), crf_two, None, False)
+        self.crf_two_admin.delete_model(self.request(), crf_two)
+        url = self.crf_one_admin.get_savenext_redirect_url(
+            request=self.request(), obj=self.crf_one)
+        self.assertTrue(url.startswith('/admin/edc_model_admin/crftwo/add/?'))
+
+    def test_clear_navigation_plan(self):
+        self.crf_one_admin.get_savenext_redirect_url(
+            request=self.request(), obj=self.crf_one)
+        clear_navigation_plan(instance=self.subject_visit)
+        plan = NavigationPlan(('12345', '1000', 0))
+        self.assertEqual(plan.next_forms, {})
+        self.assertEqual(plan.urls, {})
+        self.crf_one_admin.get_savenext_redirect_url(
+            request=self.request(), obj=self.crf_one)
+        self.assertEqual(NextFormGetter.calls, 2)
+
+    def test_last_form(self):
+        crf_two = CrfTwo.objects.create(subject_visit=self.subject_visit)
+        url = self.crf_two_admin.get_savenext_redirect_url(
+            request=self.request(), obj=crf_two)
+        self.assertTrue(url.startswith('/admin/?next=admin:index'))
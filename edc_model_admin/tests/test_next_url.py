@@ -0,0 +1,59 @@
+from django.test import TestCase, override_settings, tag
+from django.test.client import RequestFactory
+from django.urls import NoReverseMatch
+from unittest.mock import patch
+
+from ..next_url import NextUrl, reverse_cache, KWARGS, UNRESOLVABLE, NO_KWARGS
+
+
+class TestNextUrl(TestCase):
+
+    def setUp(self):
+        reverse_cache.clear()
+        self.factory = RequestFactory()
+
+    def test_parse(self):
+        request = self.factory.get(
+            '/?next=admin:app_list,app_label,arg2&app_label=auth&arg3=value3')
+        next_url = NextUrl.from_request(request)
+        self.assertEqual(next_url.url_name, 'admin:app_list')
+        self.assertEqual(next_url.kwargs, {'app_label': 'auth'})
+        self.assertEqual(next_url.url, '/admin/auth/')
+
+    def test_parsed_once_per_request(self):
+        request = self.factory.get('/?next=admin:index')
+        self.assertIs(NextUrl.from_request(request), NextUrl.from_request(request))
+        self.assertIsNone(NextUrl.from_request(request, attr='other'))
+
+    def test_no_kwargs(self):
+        request = self.factory.get('/?next=admin:index,arg1&arg1=value1')
+        self.assertEqual(NextUrl.from_request(request).url, '/admin/')
+        self.assertEqual(list(reverse_cache.data.values()), [(NO_KWARGS, None, True)])
+
+    @override_settings(ROOT_URLCONF='edc_model_admin.tests.urls')
+    def test_bad_value_not_cached(self):
+        for value, url in [('bad', '/dashboard/'), ('066-123', '/dashboard/066-123/'),
+                           ('bad', '/dashboard/'), ('066-456', '/dashboard/066-456/')]:
+            request = self.factory.get(
+                f'/?next=dashboard_url,subject_identifier&subject_identifier={value}')
+            self.assertEqual(NextUrl.from_request(request).url, url)
+        self.assertEqual(list(reverse_cache.data.values()), [(KWARGS, None, True)])
+        request = self.factory.get('/?next=dashboard_url')
+        self.assertEqual(NextUrl.from_request(request).url, '/dashboard/')
+
+    def test_bad_value_without_no_args_pattern(self):
+        request = self.factory.get('/?next=admin:app_list,app_label&app_label=bad')
+        self.assertRaises(NoReverseMatch, getattr, NextUrl.from_request(request), 'url')
+        self.assertEqual(list(reverse_cache.data.values()), [(KWARGS, None, False)])
+
+    def test_unresolvable_cached(self):
+        request = self.factory.get('/?next=my_url_name,arg1&arg1=value1')
+        self.assertRaises(NoReverseMatch, getattr, NextUrl.from_request(request), 'url')
+        self.assertEqual(
+            [v[0] for v in reverse_cache.data.values()], [UNRESOLVABLE])
+        request = self.factory.get('/?next=my_url_name,arg1&arg1=value2')
+        with patch('edc_model_admin.next_url.reverse') as reverse:
+            with self.assertRaises(NoReverseMatch) as cm:
+                NextUrl.from_request(request).url
+        reverse.assert_not_called()
+        self.assertIn("kwargs={'arg1': 'value2'}", str(cm.exception))
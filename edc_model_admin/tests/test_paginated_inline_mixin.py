@@ -0,0 +1,67 @@
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.urls import reverse
+
+from .models import TestModel, TestInlineModel
+
+PREFIX = 'testinlinemodel_set'
+
+
+class TestPaginatedInlineMixin(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_superuser('erik', 'erik@example.com', 'pass')
+        self.model_admin = admin.site._registry[TestModel]
+        self.inline = self.model_admin.get_inline_instances(self.request())[0]
+        self.obj = TestModel.objects.create(f1='1')
+        TestInlineModel.objects.bulk_create(
+            [TestInlineModel(test_model=self.obj, f1=str(i)) for i in range(25)])
+        self.rows = list(TestInlineModel.objects.filter(
+            test_model=self.obj).order_by('pk'))
+
+    def request(self):
+        request = RequestFactory().get('/')
+        request.user = self.user
+        return request
+
+    def test_first_page(self):
+        response = self.model_admin.change_view(self.request(), str(self.obj.pk))
+        formset = response.context_data['inline_admin_formsets'][0].formset
+        self.assertEqual(formset.initial_form_count(), 10)
+        self.assertEqual(formset.remaining, 15)
+        self.assertEqual(formset.forms[0].instance, self.rows[0])
+        self.assertIn('edc-inline-next-page', response.render().content.decode())
+
+    def test_page_view(self):
+        self.client.force_login(self.user)
+        url = reverse('admin:edc_model_admin_testmodel_inline_page',
+                      args=(self.obj.pk, PREFIX))
+        data = self.client.get(url, {'start': 10}).json()
+        self.assertEqual(data['rows'], 10)
+        self.assertEqual(data['remaining'], 5)
+        self.assertIn(f'name="{PREFIX}-10-f1"', data['html'])
+        self.assertIn(f'name="{PREFIX}-19-f1"', data['html'])
+        self.assertNotIn(f'name="{PREFIX}-9-f1"', data['html'])
+        self.assertIn(f'value="{self.rows[10].pk}"', data['html'])
+        data = self.client.get(url, {'start': 20}).json()
+        self.assertEqual(data['rows'], 5)
+        self.assertEqual(data['remaining'], 0)
+
+    def test_saves_loaded_rows_only(self):
+        request = self.request()
+        FormSet = self.inline.get_formset(request, self.obj)
+        data = {f'{PREFIX}-TOTAL_FORMS': '20', f'{PREFIX}-INITIAL_FORMS': '20'}
+        for i, row in enumerate(self.rows[:20]):
+            data[f'{PREFIX}-{i}-id'] = str(row.pk)
+            data[f'{PREFIX}-{i}-test_model'] = str(self.obj.pk)
+            data[f'{PREFIX}-{i}-f1'] = row.f1
+        data[f'{PREFIX}-12-f1'] = 'changed'
+        formset = FormSet(data, instance=self.obj, prefix=PREFIX,
+                          queryset=self.inline.get_queryset(request))
+        self.assertTrue(formset.is_valid(), formset.errors)
+        self.assertEqual(len(formset.get_queryset()), 20)
+        self.assertEqual(formset.save(), [self.rows[12]])
+        self.assertEqual(TestInlineModel.objects.get(pk=self.rows[12].pk).f1, 'changed')
+        self.assertEqual(TestInlineModel.objects.filter(test_model=self.obj).count(), 25)
@@ -0,0 +1,151 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.db import connection
+from django.test import TestCase
+from django.test.client import RequestFactory
+from unittest import skipUnless
+
+from ..model_admin_basic_mixin import ModelAdminBasicMixin, clear_layout_cache
+from ..search import FULLTEXT, IDENTIFIER, TOKENIZED
+from ..checks import check_search_fulltext, check_search_strategies
+from ..search import FullTextBackend, Search, SqliteFTS5Backend
+from ..search import parse_strategy, split_terms
+from .models import TestModel
+
+
+class SearchModelAdmin(ModelAdminBasicMixin, admin.ModelAdmin):
+
+    search_fields = ('f1', )
+    mixin_search_fields = ['f2', 'f3']
+    search_strategies = {'f1': 'prefix', 'f3': 'exact:upper'}
+
+
+class TestSearch(TestCase):
+
+    def setUp(self):
+        clear_layout_cache()
+        self.request = RequestFactory().get('/')
+        self.model_admin = SearchModelAdmin(TestModel, AdminSite())
+        TestModel.objects.create(f1='066-1234', f2='apple pie', f3='A1')
+        TestModel.objects.create(f1='066-5678', f2='apple crumble', f3='B2')
+        TestModel.objects.create(f1='067-0001', f2='pear pie 066', f3='C3')
+
+    def search(self, search_term, model_admin=None):
+        queryset, _ = (model_admin or self.model_admin).get_search_results(
+            self.request, TestModel.objects.all(), search_term)
+        return sorted(queryset.values_list('f1', flat=True)), str(queryset.query)
+
+    def test_split_terms(self):
+        self.assertEqual(split_terms(' apple  "pear pie" '), ['apple', 'pear pie'])
+        self.assertEqual(split_terms(''), [])
+
+    def test_strategy(self):
+        search = Search(TestModel, ['f1', 'f2'], strategies={'f1': 'prefix'})
+        self.assertEqual(search.get_strategy(['066-1234']), IDENTIFIER)
+        self.assertEqual(search.get_strategy(['apple']), TOKENIZED)
+        self.assertEqual(search.get_strategy(['066', 'apple']), TOKENIZED)
+        search.fulltext = FullTextBackend(['f2'])
+        self.assertEqual(search.get_strategy(['apple']), FULLTEXT)
+        self.assertEqual(Search(TestModel, ['f1']).get_strategy(['066']), TOKENIZED)
+
+    def test_identifier_uses_identifier_fields_only(self):
+        values, sql = self.search('066')
+        self.assertEqual(values, ['066-1234', '066-5678'])
+        self.assertIn('LIKE 066%', sql)
+        self.assertNotIn('f2', sql.split('WHERE')[1])
+        self.assertEqual(self.search('B2')[0], ['066-5678'])
+        self.assertEqual(self.search('B3')[0], [])
+
+    def test_identifier_case_converted(self):
+        values, sql = self.search('b2')
+        self.assertEqual(values, ['066-5678'])
+        self.assertIn('"f3" = B2', sql)
+
+    def test_exact_uses_column_index(self):
+        queryset, _ = Search(TestModel, ['f3'], strategies={'f3': 'exact'}).filter(
+            TestModel.objects.all(), 'A1')
+        sql = str(queryset.query).split('WHERE')[1]
+        self.assertNotIn('UPPER', sql)
+        self.assertNotIn('LIKE', sql)
+        self.assertIn('"f3" = A1', sql)
+        self.assertEqual(queryset.count(), 1)
+
+    def test_parse_strategy(self):
+        self.assertEqual(parse_strategy('prefix'), ('startswith', None))
+        self.assertEqual(parse_strategy('exact:upper'), ('exact', str.upper))
+        self.assertRaises(ValueError, parse_strategy, 'iexact')
+        self.assertRaises(ValueError, parse_strategy, 'exact:title')
+        self.assertEqual(check_search_strategies(self.model_admin), [])
+        self.model_admin.search_strategies = {'f1': 'iexact'}
+        self.assertEqual(
+            [e.id for e in check_search_strategies(self.model_admin)],
+            ['edc_model_admin.E007'])
+
+    def test_tokenized(self):
+        self.assertEqual(self.search('apple pie')[0], ['066-1234'])
+        self.assertEqual(self.search('"pear pie"')[0], ['067-0001'])
+        self.assertEqual(self.search('pie')[0], ['066-1234', '067-0001'])
+
+    def test_default_without_strategies(self):
+        class MyModelAdmin(ModelAdminBasicMixin, admin.ModelAdmin):
+            search_fields = ('f1', 'f2')
+        values, sql = self.search('066', MyModelAdmin(TestModel, AdminSite()))
+        self.assertEqual(values, ['066-1234', '066-5678', '067-0001'])
+
+
+@skipUnless(connection.vendor == 'sqlite', 'SQLite FTS5')
+class TestSqliteFTS5Backend(TestCase):
+
+    def setUp(self):
+        clear_layout_cache()
+        self.request = RequestFactory().get('/')
+        self.backend = SqliteFTS5Backend(['f1', 'f2'])
+
+        class MyModelAdmin(SearchModelAdmin):
+            search_fulltext = self.backend
+
+        self.model_admin = MyModelAdmin(TestModel, AdminSite())
+        self.backend.rebuild(TestModel)
+
+    def tearDown(self):
+        self.backend.disconnect(TestModel)
+
+    def search(self, search_term):
+        queryset, _ = self.model_admin.get_search_results(
+            self.request, TestModel.objects.all(), search_term)
+        return sorted(queryset.values_list('f2', flat=True))
+
+    def test_indexed_on_save_and_delete(self):
+        obj = TestModel.objects.create(f1='066-1234', f2='apple pie')
+        TestModel.objects.create(f1='066-5678', f2='pear crumble')
+        self.assertEqual(self.search('appl'), ['apple pie'])
+        self.assertEqual(self.search('pie appl'), ['apple pie'])
+        self.assertEqual(self.search('"apple'), ['apple pie'])
+        obj.f2 = 'plum pie'
+        obj.save()
+        self.assertEqual(self.search('apple'), [])
+        self.assertEqual(self.search('plum'), ['plum pie'])
+        obj.delete()
+        self.assertEqual(self.search('plum'), [])
+        self.assertEqual(self.search('066-5678'), ['pear crumble'])
+
+    def test_rebuild(self):
+        self.backend.disconnect(TestModel)
+        TestModel.objects.create(f1='066-1234', f2='apple pie')
+        self.assertEqual(self.search('apple'), [])
+        self.assertEqual(self.backend.rebuild(TestModel), 1)
+        self.assertEqual(self.search('apple'), ['apple pie'])
+
+    def test_without_table(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE {self.backend.get_table(TestModel)}')
+        self.assertFalse(self.backend.exists(TestModel))
+        self.assertEqual(
+            [e.id for e in check_search_fulltext(self.model_admin)],
+            ['edc_model_admin.W008'])
+        TestModel.objects.create(f1='066-1234', f2='apple pie')
+        self.assertEqual(self.search('apple'), ['apple pie'])
+        self.assertFalse(self.backend.exists(TestModel))
+        self.backend.rebuild(TestModel)
+        self.assertEqual(check_search_fulltext(self.model_admin), [])
+        self.assertEqual(self.search('appl'), ['apple pie'])
@@ -0,0 +1,85 @@
+from django.contrib import admin
+from django.contrib.admin import AdminSite
+from django.test import TestCase
+from unittest.mock import patch
+
+from ..checks import check_model_redirect, check_next_url_redirect
+from ..checks import check_redirect_on_delete, url_name_exists
+from ..model_admin_basic_mixin import ModelAdminBasicMixin, _layouts, clear_layout_cache
+from ..model_admin_model_redirect_mixin import ModelAdminModelRedirectMixin
+from ..model_admin_next_url_redirect_mixin import ModelAdminNextUrlRedirectMixin
+from ..model_admin_redirect_on_delete_mixin import ModelAdminRedirectOnDeleteMixin
+from ..model_admin_static_context_mixin import _static_contexts, clear_static_context_cache
+from ..startup import state, warm_up, warm_up_on_first_request
+from .models import TestModel
+
+
+class BasicModelAdmin(ModelAdminBasicMixin, ModelAdminNextUrlRedirectMixin,
+                      admin.ModelAdmin):
+
+    mixin_list_display = ['f1']
+
+
+class BadModelAdmin(ModelAdminModelRedirectMixin, ModelAdminNextUrlRedirectMixin,
+                    ModelAdminRedirectOnDeleteMixin, admin.ModelAdmin):
+
+    redirect_app_label = 'edc_model_admin'
+    redirect_model_name = 'nomodel'
+    show_save_next = True
+    post_url_on_delete_name = 'admin:nourl'
+
+
+class TestStartup(TestCase):
+
+    def test_warm_up(self):
+        clear_layout_cache()
+        clear_static_context_cache()
+        site = AdminSite()
+        site.register(TestModel, BasicModelAdmin)
+        self.assertEqual(warm_up(sites=[site]), 1)
+        self.assertIn(BasicModelAdmin, [key[0] for key in _layouts])
+        self.assertIn((BasicModelAdmin, 'add'), _static_contexts)
+
+    def test_warm_up_logs_skipped_admin(self):
+        site = AdminSite()
+        site.register(TestModel, BadModelAdmin)
+        with self.assertLogs('edc_model_admin.startup', 'WARNING') as logs:
+            self.assertEqual(warm_up(sites=[site]), 0)
+        self.assertIn('Skipped warm up', logs.output[0])
+
+    def test_first_request_skipped_after_warm_up(self):
+        self.addCleanup(state.update, warmed_up=state['warmed_up'])
+        state['warmed_up'] = False
+        warm_up(sites=[AdminSite()])
+        self.assertFalse(state['warmed_up'])
+        with patch('edc_model_admin.startup.warm_up') as fallback:
+            warm_up_on_first_request()
+        fallback.assert_called_once_with()
+        warm_up()
+        self.assertTrue(state['warmed_up'])
+        with patch('edc_model_admin.startup.warm_up') as fallback:
+            warm_up_on_first_request()
+        fallback.assert_not_called()
+
+    def test_url_name_exists(self):
+        self.assertTrue(url_name_exists('admin:app_list'))
+        self.assertTrue(url_name_exists('admin:edc_model_admin_testmodel_change'))
+        self.assertFalse(url_name_exists('admin:nourl'))
+        self.assertFalse(url_name_exists('nonamespace:app_list'))
+
+    def test_checks(self):
+        model_admin = BadModelAdmin(TestModel, AdminSite())
+        self.assertEqual(
+            [e.id for e in check_model_redirect(model_admin)], ['edc_model_admin.E001'])
+        self.assertEqual(
+            [e.id for e in check_next_url_redirect(model_admin)], ['edc_model_admin.E004'])
+        self.assertEqual(
+            [e.id for e in check_redirect_on_delete(model_admin)], ['edc_model_admin.W003'])
+        model_admin.redirect_model_name = 'testmodel'
+        model_admin.redirect_namespace = 'nosite'
+        self.assertEqual(
+            [e.id for e in check_model_redirect(model_admin)], ['edc_model_admin.E002'])
+        model_admin.redirect_namespace = 'admin'
+        model_admin.post_url_on_delete_name = 'admin:app_list'
+        self.assertEqual(check_model_redirect(model_admin), [])
+        self.assertEqual(check_redirect_on_delete(model_admin), [])
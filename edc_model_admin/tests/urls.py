@@ -0,0 +1,10 @@
+from django.contrib import admin
+from django.urls import path, re_path
+from django.views.generic.base import View
+
+urlpatterns = [
+    re_path(r'^dashboard/(?P<subject_identifier>\d{3}-\d+)/$',
+            View.as_view(), name='dashboard_url'),
+    path('dashboard/', View.as_view(), name='dashboard_url'),
+    path('admin/', admin.site.urls),
+]
@@ -0,0 +1,53 @@
+import copy
+
+from collections import OrderedDict
+from threading import Lock
+
+
+def copy_declared_fields(form):
+    """Replaces fields in `form.base_fields` that are shared with
+    `form.declared_fields` with copies and returns the form class.
+
+    A field declared on a ModelForm is the same instance on every
+    form class `modelform_factory` builds from it. Copy before
+    changing a label, widget or disabled on a form class returned
+    by `get_form`.
+    """
+    for name, field in form.declared_fields.items():
+        if form.base_fields.get(name) is field:
+            form.base_fields[name] = copy.deepcopy(field)
+    return form
+
+
+class LRUCache:
+
+    """A thread-safe dict of at most `maxsize` items that evicts the
+    least recently used.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.lock = Lock()
+
+    def __len__(self):
+        return len(self.data)
+
+    def get(self, key):
+        with self.lock:
+            try:
+                self.data.move_to_end(key)
+            except KeyError:
+                return None
+            return self.data[key]
+
+    def set(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "edc_model_admin.settings")
 
 application = get_wsgi_application()
+
+from edc_model_admin.startup import warm_up  # noqa after django.setup()
+
+warm_up()